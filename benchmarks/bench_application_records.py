@@ -0,0 +1,102 @@
+"""
+Benchmark: parsing tracker rows into records, time and memory
+
+Compares the old per-row seven-key dicts with the slotted Application records
+produced by parse_applications, at 10k and 100k synthetic rows.
+
+Usage:
+    python benchmarks/bench_application_records.py [--sizes 10000 100000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internship_coach_mcp import DATA_START_ROW, parse_applications  # noqa: E402
+
+COMPANIES = ["Google", "Meta", "Amazon", "Microsoft", "Apple", "Netflix", "Stripe",
+             "Databricks", "Palantir", "Lockheed Martin", "Raytheon", "OpenAI"]
+POSITIONS = ["Software Engineering Intern", "Data Science Intern", "ML Intern",
+             "Security Analyst Intern", "Materials Science Intern"]
+REFERRALS = ["LinkedIn/Online", "Handshake", "Internal Referral", "Career Fair"]
+STATUSES = ["Submitted", "In Progress", "Rejected", "Phone Screen/HireVue",
+            "Technical", "Interview"]
+
+
+def make_rows(n: int, seed: int = 0) -> list:
+    """Synthetic rows shaped like Sheets values().get output (fresh strings per cell)"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        rows.append([
+            f"{rng.choice(COMPANIES)}",
+            f"{rng.choice(POSITIONS)}",
+            f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/25",
+            "".join(rng.choice(REFERRALS)),
+            "".join(rng.choice(STATUSES)),
+            f"Recruiter follow-up #{i}" if rng.random() < 0.3 else "",
+            f"https://careers.example.com/apply/{i}"
+        ])
+    return rows
+
+
+def legacy_parse(rows: list) -> list:
+    """The dict-per-row loop get_applications used before Application records"""
+    applications = []
+    for i, row in enumerate(rows, start=DATA_START_ROW):
+        if not row or len(row) == 0 or not row[0]:
+            continue
+        applications.append({
+            'row': i,
+            'company': row[0] if len(row) > 0 else '',
+            'position': row[1] if len(row) > 1 else '',
+            'date_applied': row[2] if len(row) > 2 else '',
+            'referral_source': row[3] if len(row) > 3 else '',
+            'status': row[4] if len(row) > 4 else '',
+            'details': row[5] if len(row) > 5 else '',
+            'portal': row[6] if len(row) > 6 else ''
+        })
+    return applications
+
+
+def measure(parse, n: int) -> tuple:
+    """(parse seconds, bytes retained by the parsed result once the raw rows are gone)"""
+    rows = make_rows(n)
+    gc.collect()
+    start = time.perf_counter()
+    parse(rows)
+    elapsed = time.perf_counter() - start
+
+    rows = make_rows(n)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    parsed = parse(rows)
+    del rows
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del parsed
+    return elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}  {'parser':<12} {'parse (ms)':>11} {'retained (MB)':>14} {'bytes/row':>10}")
+    for n in args.sizes:
+        for name, parse in (("dicts", legacy_parse), ("Application", parse_applications)):
+            elapsed, retained = measure(parse, n)
+            print(f"{n:>8,}  {name:<12} {elapsed * 1000:>11.1f} {retained / 1e6:>14.2f} {retained / n:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: recommend_resume keyword scoring on large job descriptions
+
+Compares the old per-keyword substring scan (about 160 `in` checks over the
+position and job description) with the precompiled KeywordMatcher.
+
+Usage:
+    python benchmarks/bench_recommend_resume.py [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internship_coach_mcp import RESUME_KEYWORDS, _RESUME_MATCHER  # noqa: E402
+
+FILLER = (
+    "the team will collaborate with stakeholders across the organization to "
+    "deliver high quality results in a fast paced environment you will maintain "
+    "strong communication skills and attention to detail with the ability to "
+    "prioritize preferred qualifications include experience with agile processes "
+    "benefits include health insurance paid time off and a hybrid schedule"
+).split()
+
+
+def make_job_description(size_bytes: int, distinct_keywords: int = 12,
+                         keyword_density: float = 0.02, seed: int = 0) -> str:
+    """
+    Synthetic job description of roughly size_bytes.
+    
+    Like a real posting it mentions a handful of distinct keywords (repeated
+    throughout) rather than every keyword we know about.
+    """
+    rng = random.Random(seed)
+    all_keywords = sorted({k for words in RESUME_KEYWORDS.values() for k in words})
+    keywords = rng.sample(all_keywords, distinct_keywords)
+    words = []
+    length = 0
+    while length < size_bytes:
+        word = rng.choice(keywords) if rng.random() < keyword_density else rng.choice(FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def legacy_scores(position: str, job_description: str) -> dict:
+    """The substring scan recommend_resume used before KeywordMatcher"""
+    position_lower = position.lower()
+    jd_lower = job_description.lower() if job_description else ""
+    return {
+        uri: sum(1 for keyword in keywords if keyword in position_lower or keyword in jd_lower)
+        for uri, keywords in RESUME_KEYWORDS.items()
+    }
+
+
+def time_per_call(fn, args, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per measurement")
+    args = parser.parse_args()
+
+    position = "Software Engineering Intern"
+    print(f"{'JD size':>10}  {'legacy (us)':>12}  {'matcher (us)':>13}  {'speedup':>8}")
+    for size in (10_000, 50_000, 200_000):
+        jd = make_job_description(size)
+        repeat = max(10, args.repeat * 10_000 // size)
+        legacy = time_per_call(legacy_scores, (position, jd), repeat)
+        matcher = time_per_call(_RESUME_MATCHER.score, (position, jd), repeat)
+        print(f"{len(jd):>10,}  {legacy * 1e6:>12.1f}  {matcher * 1e6:>13.1f}  {legacy / matcher:>7.1f}x")
+
+    # The substring scan also over-counts: 'ai' in "maintain", 'bi' in "ability"
+    sample = "maintain ability to prioritize"
+    print("\nFalse positives on", repr(sample))
+    print("  legacy: ", {k.split('://')[-1]: v for k, v in legacy_scores("", sample).items() if v})
+    print("  matcher:", {k.split('://')[-1]: v for k, v in _RESUME_MATCHER.score("", sample).items() if v})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: server startup, measured as time to the first list_tools response
+
+Launches the server as a subprocess (the way an MCP client does), performs the
+initialize handshake over stdio and times how long it takes until tools/list
+answers. Nothing here needs Google credentials: authentication is deferred to
+the first tool call that uses Sheets or Calendar.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--script PATH]
+
+Pass --script to time a different copy of the server (e.g. an older checkout
+via `git worktree`) for comparison. Versions that authenticate before serving
+need a valid token.pickle next to that script.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCRIPT = os.path.join(ROOT, "internship_coach_mcp.py")
+
+
+def send(proc, message: dict):
+    proc.stdin.write((json.dumps(message) + "\n").encode())
+    proc.stdin.flush()
+
+
+def wait_for_response(proc, request_id: int) -> dict:
+    while True:
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError("Server exited before responding: "
+                               + proc.stderr.read().decode(errors="replace")[-2000:])
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+
+
+def time_to_list_tools(script: str) -> tuple:
+    """(seconds to initialize response, seconds to tools/list response, tool count)"""
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, script], stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        send(proc, {
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "bench-startup", "version": "0"}
+            }
+        })
+        wait_for_response(proc, 1)
+        initialized = time.perf_counter() - start
+        send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send(proc, {"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        response = wait_for_response(proc, 2)
+        listed = time.perf_counter() - start
+        return initialized, listed, len(response["result"]["tools"])
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Server launches to time")
+    parser.add_argument("--script", default=DEFAULT_SCRIPT, help="Server script to launch")
+    args = parser.parse_args()
+
+    init_times, list_times = [], []
+    for _ in range(args.runs):
+        initialized, listed, tool_count = time_to_list_tools(args.script)
+        init_times.append(initialized)
+        list_times.append(listed)
+
+    print(f"{args.script} ({tool_count} tools, {args.runs} runs)")
+    print(f"  initialize:        median {statistics.median(init_times) * 1000:7.1f} ms"
+          f"   min {min(init_times) * 1000:7.1f} ms")
+    print(f"  first list_tools:  median {statistics.median(list_times) * 1000:7.1f} ms"
+          f"   min {min(list_times) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+Benchmark: every MCP tool against in-process fake Sheets and Calendar services
+
+Builds a tracker of each requested size in the fakes from fake_google.py
+(with injected per-request latency), then calls every tool through the MCP
+call_tool request handler, the same path a client's tools/call takes (input
+validation, the tool itself, response encoding). The first call of each
+scenario is reported separately from the warm ones that follow. Concurrent
+scenarios fire many calls at once through the same handler.
+
+Quota pacing is off unless --quotas is given: with Sheets' 60 requests per
+minute, a few rounds of writes would otherwise measure the token bucket
+rather than the code.
+
+Results are written as JSON. Pass --compare with an earlier report to list
+scenarios that got slower by more than --threshold.
+
+Usage:
+    python benchmarks/bench_tools.py [--sizes 100 10000 100000] [--latency-ms 20]
+        [--repeat 5] [--concurrency 1 10 50] [--mirror] [--quotas] [--only TOOL ...]
+        [--output report.json] [--compare baseline.json] [--threshold 0.2]
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mcp.types as types  # noqa: E402
+
+import internship_coach_mcp as server  # noqa: E402
+from bench_application_records import COMPANIES, POSITIONS, make_rows  # noqa: E402
+from bench_recommend_resume import make_job_description  # noqa: E402
+from fake_google import FakeCalendarService, FakeSheetsService, make_interview_events  # noqa: E402
+
+REPORT_VERSION = 1
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _day(offset: int) -> str:
+    return (datetime.now() + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=None)
+def _postings(n: int) -> tuple:
+    return tuple({"company": COMPANIES[i % len(COMPANIES)], "position": POSITIONS[i % len(POSITIONS)],
+                  "job_description": make_job_description(2_000, seed=i)} for i in range(n))
+
+
+async def _continuation_of_full_listing(harness) -> dict:
+    """Arguments for get_more_results: the cursor a full listing was cut at (None if it wasn't)"""
+    await harness.call("get_applications", {})
+    listing = json.loads(harness.last_text)
+    if not isinstance(listing, dict) or "continuation" not in listing:
+        return None
+    return {"cursor": listing["continuation"]["cursor"]}
+
+
+def tool_scenarios(size: int, step: int) -> list:
+    """
+    (scenario name, tool name, arguments) for every tool, sized for a tracker
+    of `size` rows. `step` varies rows and dates between repetitions so
+    writes don't all land on the same cell or calendar slot. Arguments can
+    also be an async function of the harness that prepares state untimed and
+    returns them (or None to skip the scenario at this size).
+    """
+    row = server.DATA_START_ROW + (step * 7919) % size
+    today = datetime.now()
+    application = {"company": "Bench Co", "position": "Software Engineering Intern",
+                   "date_applied": f"{today.month}/{today.day}/{today:%y}",
+                   "referral_source": "Handshake", "status": "Submitted"}
+    job_description = make_job_description(5_000, seed=step)
+    return [
+        ("get_applications", "get_applications", {}),
+        ("get_applications[page]", "get_applications", {"limit": 50}),
+        ("get_applications[filtered]", "get_applications",
+         {"status_filter": "Rejected", "fields": ["company", "status"], "sort_by": "date_applied"}),
+        ("query_applications", "query_applications",
+         {"statuses": ["Technical", "Interview"], "applied_since": "6/1/25"}),
+        ("get_pipeline_stats", "get_pipeline_stats", {"weeks": 8}),
+        ("add_application", "add_application", application),
+        ("add_applications", "add_applications",
+         {"applications": [dict(application, company=f"Bench Co {i}") for i in range(50)]}),
+        ("update_status", "update_status", {"row_num": row, "new_status": "Technical"}),
+        ("update_details", "update_details", {"row_num": row, "details": f"Follow-up #{step}"}),
+        ("batch_update", "batch_update",
+         {"edits": [{"row": server.DATA_START_ROW + (step * 101 + i * 37) % size,
+                     "column": "status", "value": "Rejected"} for i in range(100)]}),
+        ("schedule_interview", "schedule_interview",
+         {"company": "Bench Co", "position": "Software Engineering Intern",
+          "interview_date": _day(90 + step), "interview_time": "10:00", "check_conflicts": True}),
+        ("schedule_interviews", "schedule_interviews",
+         {"interviews": [{"company": f"Bench Co {i}", "position": "Data Science Intern",
+                          "interview_date": _day(120 + step), "interview_time": f"{9 + i % 8:02d}:{30 * (i // 8):02d}"}
+                         for i in range(16)]}),
+        ("find_free_slots", "find_free_slots",
+         {"start_date": _day(1), "end_date": _day(5), "duration_minutes": 45}),
+        ("get_upcoming_interviews", "get_upcoming_interviews", {"days_ahead": 30}),
+        ("create_study_schedule", "create_study_schedule",
+         {"interview_date": _day(14), "topics": ["Arrays", "Graphs", "DP", "System Design"],
+          "days_available": 14}),
+        ("plan_study_schedule", "plan_study_schedule", {"days_ahead": 30}),
+        ("get_interview_prep", "get_interview_prep", {"position": "Machine Learning Intern"}),
+        ("recommend_resume", "recommend_resume",
+         {"company": "Stripe", "position": "Software Engineering Intern", "job_description": job_description}),
+        ("recommend_resumes_batch", "recommend_resumes_batch",
+         {"postings": list(_postings(200))}),
+        ("sync_tracker", "sync_tracker", {}),
+        ("get_more_results", "get_more_results", _continuation_of_full_listing),
+        ("get_cache_stats", "get_cache_stats", {}),
+        ("get_server_metrics", "get_server_metrics", {}),
+    ]
+
+
+def concurrent_scenarios(size: int) -> dict:
+    """Name -> list of (tool, arguments) to fire at once, cycled to the concurrency level"""
+    return {
+        "cold_reads": [("get_applications", {"limit": 50})],
+        "mixed": [
+            ("get_applications", {"limit": 50}),
+            ("query_applications", {"statuses": ["Interview"]}),
+            ("get_pipeline_stats", {}),
+            ("get_upcoming_interviews", {"days_ahead": 14}),
+            ("recommend_resume", {"company": "Meta", "position": "Data Science Intern"}),
+            ("update_status", {"row_num": server.DATA_START_ROW + size // 2, "new_status": "Interview"}),
+        ],
+    }
+
+
+class Harness:
+    """A fresh coach over fakes of one size, installed as the server's coach"""
+
+    def __init__(self, size: int, latency: float, mirror_dir=None, quotas: bool = False):
+        self.sheets = FakeSheetsService(make_rows(size), latency=latency)
+        self.calendar = FakeCalendarService(make_interview_events(max(10, size // 100)), latency=latency)
+        mirror_path = (os.path.join(tempfile.mkdtemp(dir=mirror_dir), "mirror.sqlite3")
+                       if mirror_dir else None)
+        self.coach = server.InternshipCoach(mirror_path=mirror_path)
+        self.coach.sheets_service = self.sheets
+        self.coach.calendar_service = self.calendar
+        if not quotas:
+            self.coach.api_executor.buckets = {}
+        server.coach = self.coach
+        self.handler = server.app.request_handlers[types.CallToolRequest]
+        self.last_text = ""
+
+    def api_calls(self) -> tuple:
+        return self.sheets.calls, self.calendar.calls
+
+    async def call(self, tool: str, arguments: dict) -> tuple:
+        """(seconds, whether the call failed)"""
+        request = types.CallToolRequest(method="tools/call",
+                                        params=types.CallToolRequestParams(name=tool, arguments=arguments))
+        start = time.perf_counter()
+        result = (await self.handler(request)).root
+        elapsed = time.perf_counter() - start
+        text = self.last_text = result.content[0].text if result.content else ""
+        failed = result.isError or text.startswith(("Error:", "❌"))
+        return elapsed, failed
+
+    def close(self):
+        self.coach.close()
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_tools(size: int, args) -> dict:
+    harness = Harness(size, args.latency_ms / 1000, args.mirror_dir, args.quotas)
+    results = {}
+    try:
+        names = [name for name, _, _ in tool_scenarios(size, 0)]
+        for index, name in enumerate(names):
+            if args.only and name.split("[")[0] not in args.only:
+                continue
+            times, errors = [], 0
+            setup_sheets = setup_calendar = 0  # Requests made preparing arguments, not by the tool
+            sheets_before, calendar_before = harness.api_calls()
+            for step in range(args.repeat + 1):
+                _, tool, arguments = tool_scenarios(size, step)[index]
+                if callable(arguments):
+                    prepared_from = harness.api_calls()
+                    arguments = await arguments(harness)
+                    if arguments is None:
+                        break
+                    prepared_to = harness.api_calls()
+                    setup_sheets += prepared_to[0] - prepared_from[0]
+                    setup_calendar += prepared_to[1] - prepared_from[1]
+                elapsed, failed = await harness.call(tool, arguments)
+                times.append(elapsed)
+                errors += failed
+            if not times:
+                continue
+            sheets_after, calendar_after = harness.api_calls()
+            warm = times[1:] or times
+            results[name] = {
+                "first_ms": _ms(times[0]),
+                "median_ms": _ms(statistics.median(warm)),
+                "p90_ms": _ms(_percentile(warm, 0.9)),
+                "max_ms": _ms(max(warm)),
+                "calls": len(times),
+                "errors": errors,
+                "sheets_requests": sheets_after - sheets_before - setup_sheets,
+                "calendar_requests": calendar_after - calendar_before - setup_calendar,
+            }
+            print(f"  {size:>7,} rows  {name:<28} first {results[name]['first_ms']:>9.1f} ms"
+                  f"  median {results[name]['median_ms']:>9.1f} ms  errors {errors}"
+                  f"  sheets {results[name]['sheets_requests']:>3}  calendar {results[name]['calendar_requests']:>3}")
+    finally:
+        harness.close()
+    return results
+
+
+async def run_concurrent(size: int, args) -> dict:
+    results = {}
+    for scenario, calls in concurrent_scenarios(size).items():
+        for level in args.concurrency:
+            harness = Harness(size, args.latency_ms / 1000, args.mirror_dir, args.quotas)
+            try:
+                if scenario != "cold_reads":
+                    await harness.call("get_applications", {"limit": 1})  # Warm the caches
+                sheets_before, calendar_before = harness.api_calls()
+                batch = [calls[i % len(calls)] for i in range(level)]
+                start = time.perf_counter()
+                outcomes = await asyncio.gather(*(harness.call(tool, arguments) for tool, arguments in batch))
+                wall = time.perf_counter() - start
+                sheets_after, calendar_after = harness.api_calls()
+            finally:
+                harness.close()
+            latencies = [elapsed for elapsed, _ in outcomes]
+            key = f"{scenario}@{level}"
+            results[key] = {
+                "wall_ms": _ms(wall),
+                "calls_per_second": round(level / wall, 1),
+                "median_ms": _ms(statistics.median(latencies)),
+                "p99_ms": _ms(_percentile(latencies, 0.99)),
+                "errors": sum(failed for _, failed in outcomes),
+                "sheets_requests": sheets_after - sheets_before,
+                "calendar_requests": calendar_after - calendar_before,
+            }
+            print(f"  {size:>7,} rows  {key:<28} wall {results[key]['wall_ms']:>10.1f} ms"
+                  f"  {results[key]['calls_per_second']:>8.1f} calls/s  sheets {results[key]['sheets_requests']:>3}")
+    return results
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    """(key, baseline ms, current ms) for every timing more than threshold slower than the baseline"""
+    regressions = []
+    for size, sections in report["results"].items():
+        for section, scenarios in sections.items():
+            for name, current in scenarios.items():
+                previous = baseline.get("results", {}).get(size, {}).get(section, {}).get(name)
+                if previous is None:
+                    continue
+                for metric in ("median_ms", "wall_ms"):
+                    if metric in current and metric in previous:
+                        before, after = previous[metric], current[metric]
+                        # Ignore sub-millisecond jitter on very fast calls
+                        if after > before * (1 + threshold) and after - before > 1:
+                            regressions.append((f"{size}/{section}/{name}/{metric}", before, after))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--latency-ms", type=float, default=20, help="Injected latency per Google request")
+    parser.add_argument("--repeat", type=int, default=5, help="Warm calls per tool after the first")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--mirror", action="store_true", help="Serve the tracker from the offline SQLite mirror")
+    parser.add_argument("--quotas", action="store_true", help="Pace requests by the real Google API quotas")
+    parser.add_argument("--only", nargs="+", help="Only benchmark these tools")
+    parser.add_argument("--output", default="bench_tools_report.json", help="Where to write the JSON report")
+    parser.add_argument("--compare", help="Earlier report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    tool_names = {tool.name for tool in asyncio.run(server.list_tools())}
+    untested = sorted(tool_names - {tool for _, tool, _ in tool_scenarios(100, 0)})
+    if untested:
+        print(f"No scenario for: {', '.join(untested)}")
+
+    report = {
+        "benchmark": "bench_tools",
+        "version": REPORT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"sizes": args.sizes, "latency_ms": args.latency_ms, "repeat": args.repeat,
+                   "concurrency": args.concurrency, "mirror": args.mirror, "quotas": args.quotas},
+        "untested_tools": untested,
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as mirror_dir:
+        args.mirror_dir = mirror_dir if args.mirror else None
+        for size in args.sizes:
+            report["results"][str(size)] = {
+                "tools": asyncio.run(run_tools(size, args)),
+                "concurrency": {} if args.only else asyncio.run(run_concurrent(size, args)),
+            }
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("config") != report["config"]:
+            print(f"Note: {args.compare} was run with different settings: {baseline.get('config')}")
+        regressions = compare(report, baseline, args.threshold)
+        print(f"Compared with {args.compare} ({baseline.get('git_commit') or 'unknown commit'}):"
+              f" {len(regressions)} regression(s) over {args.threshold:.0%}")
+        for key, before, after in regressions:
+            print(f"  {key:<60} {before:>10.1f} -> {after:>10.1f} ms  ({after / before - 1:+.0%})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+In-process fakes of the Google Sheets and Calendar API clients
+
+Cover the surface the server uses: spreadsheets().values() get / append /
+update / batchUpdate, and Calendar events() list / insert / get, freebusy().query
+and batch HTTP requests. Responses follow the real APIs closely enough for
+the server's caching and incremental sync to behave as they do against
+Google: trailing blank cells and rows are trimmed from reads, writes echo
+updatedRange/updatedData, events().list pages and hands out sync tokens.
+
+Every request sleeps for the service's injected latency when executed (on
+the server's API worker thread, as a real round trip would), and counts
+towards `calls`.
+"""
+
+import itertools
+import os
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internship_coach_mcp import DATA_START_ROW, _event_timestamp, _interview_event  # noqa: E402
+
+A1_CELL = re.compile(r"!([A-Z]+)(\d+)(?::([A-Z]+)(\d*))?$")
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - 64
+    return index - 1
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+class FakeHttpError(Exception):
+    """Stands in for googleapiclient's HttpError: carries the HTTP status on .resp"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.resp = type("Response", (), {"status": status})()
+
+
+class FakeRequest:
+    """A built request; execute() waits out the latency then runs the call"""
+
+    def __init__(self, service, fn):
+        self.service = service
+        self.fn = fn
+
+    def execute(self, http=None, num_retries=0):
+        with self.service.lock:
+            self.service.calls += 1
+        if self.service.latency:
+            time.sleep(self.service.latency)
+        with self.service.lock:
+            return self.fn()
+
+
+class FakeSheetsService:
+    """
+    Sheets client over one in-memory tracker tab.
+
+    Args:
+        rows: Tracker rows starting at DATA_START_ROW (mutated by writes)
+        latency: Seconds each request takes
+    """
+
+    def __init__(self, rows: list, latency: float = 0.0):
+        self.rows = rows
+        self.latency = latency
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def _bounds(self, a1_range: str) -> tuple:
+        """(first row offset, last row offset or None, first col, last col or None)"""
+        m = A1_CELL.search(a1_range)
+        if m is None:
+            raise ValueError(f"Unsupported range: {a1_range}")
+        first_col = _column_index(m.group(1))
+        last_col = _column_index(m.group(3)) if m.group(3) else (None if m.group(4) is None else first_col)
+        first = int(m.group(2)) - DATA_START_ROW
+        if m.group(3) is None:
+            last = first
+        else:
+            last = int(m.group(4)) - DATA_START_ROW if m.group(4) else None
+        return first, last, first_col, last_col
+
+    def _read(self, a1_range: str) -> list:
+        first, last, first_col, last_col = self._bounds(a1_range)
+        end = len(self.rows) if last is None else min(last + 1, len(self.rows))
+        values = []
+        for row in self.rows[first:end]:
+            cells = row[first_col:None if last_col is None else last_col + 1]
+            while cells and cells[-1] == "":
+                cells = cells[:-1]
+            values.append(list(cells))
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def _write(self, a1_range: str, values: list) -> dict:
+        first, _, first_col, _ = self._bounds(a1_range)
+        for i, new_row in enumerate(values):
+            while len(self.rows) <= first + i:
+                self.rows.append([])
+            row = self.rows[first + i] = list(self.rows[first + i])
+            while len(row) < first_col + len(new_row):
+                row.append("")
+            row[first_col:first_col + len(new_row)] = [str(v) for v in new_row]
+        width = max((len(r) for r in values), default=1)
+        sheet = a1_range.split("!")[0]
+        updated_range = (f"{sheet}!{_column_letter(first_col)}{first + DATA_START_ROW}:"
+                         f"{_column_letter(first_col + width - 1)}{first + len(values) - 1 + DATA_START_ROW}")
+        return {
+            "updatedRange": updated_range,
+            "updatedRows": len(values),
+            "updatedCells": sum(len(r) for r in values),
+            "updatedData": {"range": updated_range, "values": [[str(v) for v in r] for r in values]}
+        }
+
+    def get(self, spreadsheetId, range, **kwargs):
+        def run():
+            result = {"range": range, "majorDimension": "ROWS"}
+            values = self._read(range)
+            if values:
+                result["values"] = values
+            return result
+        return FakeRequest(self, run)
+
+    def append(self, spreadsheetId, range, body, includeValuesInResponse=False, **kwargs):
+        def run():
+            end = len(self.rows)
+            while end and not any(self.rows[end - 1]):
+                end -= 1
+            sheet = range.split("!")[0]
+            updated = self._write(f"{sheet}!A{end + DATA_START_ROW}", body["values"])
+            if not includeValuesInResponse:
+                updated.pop("updatedData")
+            return {"spreadsheetId": spreadsheetId, "updates": updated}
+        return FakeRequest(self, run)
+
+    def update(self, spreadsheetId, range, body, includeValuesInResponse=False, **kwargs):
+        def run():
+            updated = self._write(range, body["values"])
+            if not includeValuesInResponse:
+                updated.pop("updatedData")
+            return updated
+        return FakeRequest(self, run)
+
+    def batchUpdate(self, spreadsheetId, body):
+        def run():
+            responses = []
+            for data in body["data"]:
+                updated = self._write(data["range"], data["values"])
+                if not body.get("includeValuesInResponse"):
+                    updated.pop("updatedData")
+                responses.append(updated)
+            return {"spreadsheetId": spreadsheetId, "responses": responses,
+                    "totalUpdatedCells": sum(r["updatedCells"] for r in responses)}
+        return FakeRequest(self, run)
+
+
+class FakeBatch:
+    """new_batch_http_request(): the added requests run in one round trip"""
+
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id or str(len(self.requests)), request))
+
+    def execute(self, http=None):
+        with self.service.lock:
+            self.service.calls += 1
+        if self.service.latency:
+            time.sleep(self.service.latency)
+        for request_id, request in self.requests:
+            try:
+                with self.service.lock:
+                    response = request.fn()
+            except FakeHttpError as e:
+                self.callback(request_id, None, e)
+            else:
+                self.callback(request_id, response, None)
+
+
+class FakeCalendarService:
+    """
+    Calendar client over an in-memory primary calendar.
+
+    Every insert is appended to a change log; sync tokens are positions in
+    that log, so an incremental list returns just the events added since.
+    Client-supplied event ids are kept, and inserting an id that already
+    exists fails with 409 as it does against Google.
+
+    Args:
+        events: Initial events (dicts shaped like events().insert bodies)
+        latency: Seconds each request (or batch) takes
+    """
+
+    def __init__(self, events: list = (), latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.lock = threading.Lock()
+        self._ids = itertools.count()
+        self.events_by_id = {}
+        self.log = []
+        for event in events:
+            self._insert(event)
+
+    def _insert(self, body: dict) -> dict:
+        event_id = body.get("id") or f"evt{next(self._ids)}"
+        if event_id in self.events_by_id:
+            raise FakeHttpError(409, f"The requested identifier already exists: {event_id}")
+        event = dict(body, id=event_id, status="confirmed",
+                     htmlLink=f"https://calendar.example.com/event?eid={event_id}")
+        self.events_by_id[event_id] = event
+        self.log.append(event)
+        return event
+
+    def events(self):
+        return self
+
+    def freebusy(self):
+        return _FakeFreeBusy(self)
+
+    def new_batch_http_request(self, callback=None):
+        return FakeBatch(self, callback)
+
+    def insert(self, calendarId, body, **kwargs):
+        request = FakeRequest(self, lambda: self._insert(body))
+        request.body = body
+        return request
+
+    def get(self, calendarId, eventId, **kwargs):
+        def run():
+            if eventId not in self.events_by_id:
+                raise FakeHttpError(404, f"Not Found: {eventId}")
+            return self.events_by_id[eventId]
+        return FakeRequest(self, run)
+
+    def list(self, calendarId, maxResults=250, pageToken=None, syncToken=None, **kwargs):
+        def run():
+            if pageToken:
+                source, position = (int(part) for part in pageToken.split(":"))
+            else:
+                source, position = (int(syncToken) if syncToken else -1), 0
+            events = list(self.events_by_id.values()) if source < 0 else self.log[source:]
+            result = {"kind": "calendar#events", "items": events[position:position + maxResults]}
+            if position + maxResults < len(events):
+                result["nextPageToken"] = f"{source}:{position + maxResults}"
+            else:
+                result["nextSyncToken"] = str(len(self.log))
+            return result
+        return FakeRequest(self, run)
+
+
+class _FakeFreeBusy:
+    def __init__(self, calendar: FakeCalendarService):
+        self.calendar = calendar
+
+    def query(self, body):
+        def run():
+            window_start = _event_timestamp({"dateTime": body["timeMin"]})
+            window_end = _event_timestamp({"dateTime": body["timeMax"]})
+            busy = []
+            for event in self.calendar.events_by_id.values():
+                start, end = _event_timestamp(event["start"]), _event_timestamp(event["end"])
+                if start is not None and end is not None and start < window_end and end > window_start:
+                    busy.append((max(start, window_start), min(end, window_end)))
+            return {"calendars": {"primary": {"busy": [
+                {"start": datetime.fromtimestamp(s, timezone.utc).isoformat(),
+                 "end": datetime.fromtimestamp(e, timezone.utc).isoformat()}
+                for s, e in sorted(busy)
+            ]}}}
+        return FakeRequest(self.calendar, run)
+
+
+def make_interview_events(n: int, days: int = 60, seed: int = 0) -> list:
+    """n interview event bodies spread over the next `days` days, in business hours"""
+    rng = random.Random(seed)
+    today = datetime.now()
+    return [
+        _interview_event(f"Company {i}", "Software Engineering Intern",
+                         (today + timedelta(days=rng.randint(1, days))).strftime("%Y-%m-%d"),
+                         f"{rng.randint(9, 16):02d}:{rng.choice((0, 30)):02d}",
+                         duration_minutes=45)
+        for i in range(n)
+    ]
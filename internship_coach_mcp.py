@@ -4,19 +4,37 @@ Matches Akshaya's exact sheet format
 """
 
 import asyncio
+import base64
+import bisect
+import contextlib
+import difflib
+import functools
+import hashlib
+import heapq
 from typing import Any, Optional
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 import mcp.server.stdio
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-import PyPDF2
+# Google client libraries and PyPDF2 are imported where they're used: they're
+# slow to load and nothing in the MCP handshake or list_tools needs them
 import os.path
 import pickle
-from datetime import datetime, timedelta
+import random
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 import json
+try:
+    import orjson  # Optional: faster encoding of tool responses
+except ImportError:
+    orjson = None
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Google API setup
 SCOPES = [
@@ -29,53 +47,3148 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 SHEET_NAME = 'Internship & Job Tracker'  # Your main sheet
 HEADER_ROW = 15  # Row 15 is your header
 DATA_START_ROW = 16  # Data starts at row 16
+TRACKER_RANGE = f'{SHEET_NAME}!A{DATA_START_ROW}:G'
+# Column order A..G of the tracker
+TRACKER_FIELDS = ['company', 'position', 'date_applied', 'referral_source',
+                  'status', 'details', 'portal']
+TRACKER_CACHE_TTL_SECONDS = 60  # How long a cached tracker read stays fresh
+TOKEN_PATH = os.path.join(SCRIPT_DIR, 'token.pickle')
+AUTHORIZE_FIRST_MESSAGE = ("🔑 Google access isn't authorized yet. Finish the sign-in in the browser window "
+                           "the server opened, or run `python internship_coach_mcp.py --authorize` once, "
+                           "then try again.")
+TOKEN_REFRESH_MARGIN_SECONDS = 300  # Refresh this long before the access token expires
+TOKEN_REFRESH_RETRY_SECONDS = 60  # Wait after a failed refresh (or while not yet authenticated)
+RESUME_DIR = os.path.join(SCRIPT_DIR, 'resumes')
+RESUME_EXTENSIONS = ('.pdf', '.txt', '.md')  # Tried in order when a mapped file is missing
+EXTRACTION_CACHE_PATH = os.path.join(RESUME_DIR, '.extraction_cache.json')
+APPLICATIONS_PAGE_SIZE = 50  # Default page size when get_applications is paged
+DELTA_MAX_LOG = 50000  # Row changes remembered for delta sync before old tokens force a resync
+WINDOW_MIN_ROWS = 25  # Smallest read when fetching just one page of rows
+WINDOW_END_BLANK_ROWS = 100  # This many blank rows in a row means the tracker has ended
+BULK_APPEND_CHUNK_SIZE = 500  # Max rows sent in one values().append
+RESUME_BATCH_PARALLEL_THRESHOLD = 64  # Smaller batches aren't worth a process hop
+MIRROR_PATH = os.path.join(SCRIPT_DIR, 'tracker_mirror.sqlite3')
+MIRROR_ENABLED = os.environ.get('INTERNSHIP_COACH_MIRROR', '1') != '0'  # Serve the tracker from the local mirror
+MIRROR_SYNC_INTERVAL_SECONDS = 60  # Background pull/push cadence (local writes trigger a sync sooner)
+MIRROR_WRITE_DEBOUNCE_SECONDS = 1  # Gather a burst of local writes into one sync
+MIRROR_RETRY_SECONDS = 30  # Back off this long after a failed sync (e.g. while offline)
+GOOGLE_API_MAX_WORKERS = 8  # Threads available for concurrent Google API calls
+GOOGLE_API_TIMEOUT_SECONDS = 30  # Per-call timeout for Google API requests (browser sign-in isn't one)
+GOOGLE_API_QUOTAS = {'sheets': 60, 'calendar': 600}  # Requests per minute per user
+GOOGLE_API_MAX_RETRIES = 5  # Retries of a request that hit a rate limit or server error
+GOOGLE_API_BACKOFF_BASE_SECONDS = 1  # First retry waits up to this long, doubling each time
+GOOGLE_API_BACKOFF_MAX_SECONDS = 32
+CALENDAR_SYNC_TTL_SECONDS = 30  # Serve interview queries from the event cache this long before re-syncing
+TIMEZONE = os.environ.get('INTERNSHIP_COACH_TIMEZONE', 'America/New_York')  # Interviews are booked and searched in this zone
+FREEBUSY_CACHE_TTL_SECONDS = 60  # How long fetched busy blocks are trusted
+FREEBUSY_MIN_WINDOW_DAYS = 14  # A free/busy fetch covers at least this many days
+STUDY_DAILY_HOURS = 3  # Default study budget per day
+STUDY_TOPIC_HOURS = 2  # First-pass study time for a topic of weight 1
+STUDY_SESSION_MINUTES = 60  # Length of one study session
+STUDY_REVIEW_MINUTES = 30  # Length of one spaced-repetition review
+STUDY_REVIEW_OFFSETS = (1, 3, 7)  # Review a topic this many days after finishing it
+STUDY_MAX_SESSIONS_PER_TOPIC_PER_DAY = 2  # Spread a topic over days rather than cramming it
+CALENDAR_PAGE_SIZE = 250  # Events per events().list page while syncing
+CALENDAR_BATCH_SIZE = 50  # Calendar API limit on requests in one batch HTTP request
+CALENDAR_BATCH_MAX_ATTEMPTS = 3  # Rounds of retrying the items of a bulk insert that failed
+RETRYABLE_403_REASONS = frozenset({'ratelimitexceeded', 'userratelimitexceeded'})  # 403s that are rate limits, not permissions
+METRICS_ENABLED = os.environ.get('INTERNSHIP_COACH_METRICS', '1') != '0'  # Record tool latency and Google API usage
+METRICS_TEXTFILE = os.environ.get('INTERNSHIP_COACH_METRICS_TEXTFILE')  # Also export Prometheus metrics to this file
+METRICS_EXPORT_INTERVAL_SECONDS = 15  # How often the textfile is rewritten
+DUPLICATE_LSH_BANDS = 12  # MinHash LSH bands; more bands find weaker matches
+DUPLICATE_LSH_POSITION_ROWS = 2  # Position signature values per band (next to the company's)
+DUPLICATE_COMPANY_SIMILARITY = 0.5  # Trigram Jaccard needed between normalized companies
+DUPLICATE_COMPANY_TYPO_SIMILARITY = 0.8  # ...or edit similarity, for misspellings ('googel')
+DUPLICATE_POSITION_SIMILARITY = 0.5  # ...and between normalized positions
+DUPLICATE_POSITION_WORD_SIMILARITY = 0.8  # Edit similarity for two role words to count as one ('securty')
+DUPLICATE_SPELLING_MIN_LENGTH = 3  # Shortest company spelling used as a lookup key
+DUPLICATE_MAX_MATCHES = 3  # Possible duplicates reported per application
+RESPONSE_COMPACT = os.environ.get('INTERNSHIP_COACH_COMPACT_RESPONSES', '1') != '0'  # JSON without indentation
+RESPONSE_MAX_BYTES = int(os.environ.get('INTERNSHIP_COACH_RESPONSE_MAX_BYTES', 100_000))  # Larger responses are split (0: no cap)
+RESPONSE_CONTINUATION_TTL_SECONDS = 900  # How long the rest of a split response can be fetched
+RESPONSE_CONTINUATIONS_MAX = 16  # Split responses kept at once (oldest dropped first)
+RESPONSE_TEXT_CONTINUATION = '\n\n✂️ continuation: '  # Precedes the JSON note ending each piece of split text
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # Histogram bucket bounds (seconds)
+
+
+class SheetValuesCache:
+    """
+    Write-through in-memory cache for sheet value ranges.
+    
+    Entries are keyed on (spreadsheet_id, range) and expire after ttl_seconds.
+    Writes made through the coach are applied to the cached rows so reads stay
+    correct without another round trip; anything we can't apply precisely
+    invalidates the entry instead.
+    
+    Every write and invalidation also bumps the range's generation, even when
+    nothing is cached yet, so a read that was in flight across a write can
+    tell its rows may predate it and skip caching them.
+    """
+    
+    def __init__(self, ttl_seconds: float = TRACKER_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}  # (spreadsheet_id, range) -> (fetched_at, rows)
+        self._generations = {}  # (spreadsheet_id, range) -> writes seen
+        self._flushes = 0  # Invalidations that spanned more than one range
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get(self, spreadsheet_id: str, range_name: str) -> Optional[list]:
+        """Return cached rows for a range, or None if missing or expired"""
+        entry = self._entries.get((spreadsheet_id, range_name))
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+    
+    def generation(self, spreadsheet_id: str, range_name: str) -> tuple:
+        """Token that changes whenever the range is written to or invalidated"""
+        return self._flushes, self._generations.get((spreadsheet_id, range_name), 0)
+    
+    def _bump(self, spreadsheet_id: str, range_name: str):
+        key = (spreadsheet_id, range_name)
+        self._generations[key] = self._generations.get(key, 0) + 1
+    
+    def put(self, spreadsheet_id: str, range_name: str, rows: list,
+            generation: Optional[tuple] = None) -> bool:
+        """
+        Store freshly fetched rows for a range.
+        
+        Args:
+            generation: generation() taken before the read was sent; if the
+                range has been written since, the rows aren't stored
+        
+        Returns:
+            Whether the rows were cached
+        """
+        if generation is not None and generation != self.generation(spreadsheet_id, range_name):
+            return False
+        self._entries[(spreadsheet_id, range_name)] = (time.monotonic(), rows)
+        return True
+    
+    def peek(self, spreadsheet_id: str, range_name: str) -> Optional[list]:
+        """Like get, but doesn't count as a hit or miss"""
+        entry = self._entries.get((spreadsheet_id, range_name))
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        return None
+    
+    def is_fresh(self, spreadsheet_id: str, range_name: str) -> bool:
+        """Whether a range is cached and unexpired (doesn't count as a hit or miss)"""
+        return self.peek(spreadsheet_id, range_name) is not None
+    
+    def update_cell(self, spreadsheet_id: str, range_name: str,
+                    row_offset: int, col_index: int, value: str):
+        """Apply a single-cell write to the cached rows (row_offset is 0-based within the range)"""
+        self._bump(spreadsheet_id, range_name)
+        entry = self._entries.get((spreadsheet_id, range_name))
+        if entry is None:
+            return
+        rows = entry[1]
+        if row_offset < 0:
+            self.invalidate(spreadsheet_id, range_name)
+            return
+        while len(rows) <= row_offset:
+            rows.append([])
+        row = rows[row_offset]
+        while len(row) <= col_index:
+            row.append('')
+        row[col_index] = value
+    
+    def set_rows(self, spreadsheet_id: str, range_name: str,
+                 row_offset: int, values: list):
+        """Apply a write of whole rows starting at row_offset (0-based within the range)"""
+        self._bump(spreadsheet_id, range_name)
+        entry = self._entries.get((spreadsheet_id, range_name))
+        if entry is None:
+            return
+        if row_offset < 0:
+            self.invalidate(spreadsheet_id, range_name)
+            return
+        rows = entry[1]
+        while len(rows) < row_offset + len(values):
+            rows.append([])
+        for i, row in enumerate(values):
+            rows[row_offset + i] = list(row)
+    
+    def invalidate(self, spreadsheet_id: Optional[str] = None, range_name: Optional[str] = None):
+        """Drop one entry, every entry for a spreadsheet, or everything"""
+        if spreadsheet_id is not None and range_name is not None:
+            self._bump(spreadsheet_id, range_name)
+        else:
+            self._flushes += 1
+        for key in list(self._entries):
+            if spreadsheet_id is not None and key[0] != spreadsheet_id:
+                continue
+            if range_name is not None and key[1] != range_name:
+                continue
+            del self._entries[key]
+            self.invalidations += 1
+    
+    def stats(self) -> dict:
+        """Hit/miss counters; every hit is one Sheets round trip saved"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'round_trips_saved': self.hits,
+            'ttl_seconds': self.ttl_seconds,
+            'cached_ranges': len(self._entries)
+        }
+
+
+# Keywords for each resume type
+RESUME_KEYWORDS = {
+    "resume://software-engineering": [
+        'software', 'engineer', 'developer', 'backend', 'frontend', 'full stack',
+        'fullstack', 'web dev', 'mobile', 'ios', 'android', 'coding', 'programming',
+        'java', 'python', 'c++', 'javascript', 'react', 'node', 'api', 'system design',
+        'swe', 'sde', 'software development'
+    ],
+    "resume://data-science": [
+        'data', 'analytics', 'analyst', 'business intelligence', 'bi',
+        'sql', 'tableau', 'power bi', 'visualization', 'reporting',
+        'metrics', 'dashboard', 'excel', 'statistics'
+    ],
+    "resume://machine-learning": [
+        'machine learning', 'ml', 'ai', 'artificial intelligence', 'deep learning',
+        'neural network', 'nlp', 'computer vision', 'tensorflow', 'pytorch',
+        'scikit-learn', 'model', 'training', 'inference', 'data science',
+        'research', 'phd', 'kaggle'
+    ],
+    "resume://cyber": [
+        'cyber', 'security', 'infosec', 'penetration', 'vulnerability',
+        'threat', 'soc', 'incident response', 'firewall', 'encryption',
+        'compliance', 'risk', 'authentication', 'network security',
+        'malware', 'forensics', 'ceh', 'cissp'
+    ],
+    "resume://materials-science": [
+        'materials', 'chemistry', 'chemical', 'polymer', 'nanomaterial',
+        'characterization', 'synthesis', 'lab', 'research', 'microscopy',
+        'spectroscopy', 'semiconductor', 'metallurgy', 'biomaterial',
+        'composite', 'crystallography'
+    ]
+}
+
+
+class KeywordMatcher:
+    """
+    Whole-word keyword matcher, compiled once for a fixed set of categories.
+    
+    Text is lowercased and split into tokens a single time. Single-word
+    keywords are then found with one set intersection and multi-word keywords
+    with a substring check against the space-joined tokens, so every category
+    is scored from the same pass and a keyword never matches inside a longer
+    word ('ai' doesn't hit "maintain", 'bi' doesn't hit "ability"). A
+    trailing plural 's' is accepted ("engineers", "models").
+    """
+    
+    # Everything except letters, digits, '+' and '#' separates tokens ("c++", "c#")
+    _SEPARATORS = str.maketrans({
+        chr(i): ' ' for i in range(128)
+        if not (chr(i).isalnum() or chr(i) in '+#')
+    })
+    
+    def __init__(self, categories: dict):
+        self.categories = list(categories)
+        self._keyword_categories = {}  # keyword -> categories it counts toward
+        self._words = {}  # token (or its plural) -> single-word keywords
+        self._phrases = []  # (leading tokens, ' phrase ', ' phrases ', keyword)
+        
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword, []).append(category)
+        
+        for keyword in self._keyword_categories:
+            tokens = self.tokenize(keyword)
+            if len(tokens) == 1:
+                self._words.setdefault(tokens[0], set()).add(keyword)
+                if not tokens[0].endswith('s'):
+                    self._words.setdefault(tokens[0] + 's', set()).add(keyword)
+            elif tokens:
+                phrase = ' '.join(tokens)
+                self._phrases.append((frozenset(tokens[:-1]), f' {phrase} ', f' {phrase}s ', keyword))
+        self._word_keys = frozenset(self._words)
+    
+    def tokenize(self, text: str) -> list:
+        return text.lower().translate(self._SEPARATORS).split()
+    
+    def matches(self, *texts: str) -> set:
+        """Distinct keywords that appear as whole words in any of the texts"""
+        tokens = []
+        for text in texts:
+            if text:
+                tokens.extend(self.tokenize(text))
+                tokens.append('|')  # Phrases can't span two texts
+        present = set(tokens)
+        
+        found = set()
+        for token in self._word_keys.intersection(present):
+            found.update(self._words[token])
+        
+        joined = None
+        for leading, phrase, plural, keyword in self._phrases:
+            if keyword in found or not leading.issubset(present):
+                continue
+            if joined is None:
+                joined = f" {' '.join(tokens)} "
+            if phrase in joined or plural in joined:
+                found.add(keyword)
+        return found
+    
+    def score(self, *texts: str) -> dict:
+        """Number of distinct keywords matched per category"""
+        scores = dict.fromkeys(self.categories, 0)
+        for keyword in self.matches(*texts):
+            for category in self._keyword_categories[keyword]:
+                scores[category] += 1
+        return scores
+
+
+_RESUME_MATCHER = KeywordMatcher(RESUME_KEYWORDS)
+
+
+def recommend_resume_for(company: str, position: str, job_description: str = "") -> dict:
+    """
+    Recommend which resume version to use for a specific application.
+    Analyzes the position title, company, and optional job description to suggest
+    the most appropriate resume from your available versions.
+    
+    Args:
+        company: Company name
+        position: Position title
+        job_description: Optional job description text for analysis
+        
+    Returns:
+        dict with recommendation, reasoning, and alternatives
+    """
+    
+    # Calculate scores for each category in one pass over the text
+    scores = _RESUME_MATCHER.score(position, job_description)
+    
+    # Find the highest score
+    max_score = max(scores.values())
+    
+    # Handle ties or no clear winner
+    top_resumes = [uri for uri, score in scores.items() if score == max_score]
+    
+    recommendation = None
+    reasoning = []
+    alternatives = []
+    confidence = "high"
+    
+    if max_score == 0:
+        # No keywords matched - default to most general
+        recommendation = "resume://software-engineering"
+        reasoning.append("⚠️ No clear keyword matches found in position or description")
+        reasoning.append("Defaulting to software engineering resume as most general tech resume")
+        alternatives = [
+            {"uri": "resume://data-science", "reason": "Use if role involves data analysis"},
+            {"uri": "resume://machine-learning", "reason": "Use if role involves ML/AI work"},
+            {"uri": "resume://cyber", "reason": "Use if role is security-focused"},
+            {"uri": "resume://materials-science", "reason": "Use if role is materials/chemistry-focused"}
+        ]
+        confidence = "low"
+        reasoning.append("💡 Consider providing the full job description for better analysis")
+    
+    elif len(top_resumes) > 1:
+        # Tie - pick based on hierarchy: ML > Cyber > SWE > Data > MatSci
+        priority_order = [
+            "resume://machine-learning",
+            "resume://cyber", 
+            "resume://software-engineering",
+            "resume://data-science",
+            "resume://materials-science"
+        ]
+        
+        for uri in priority_order:
+            if uri in top_resumes:
+                recommendation = uri
+                break
+        
+        reasoning.append(f"Multiple resume types tied with {max_score} keyword matches")
+        reasoning.append(f"Recommending {recommendation.split('://')[-1]} as primary")
+        
+        for uri in top_resumes:
+            if uri != recommendation:
+                alternatives.append({
+                    "uri": uri,
+                    "reason": f"Equally strong match ({scores[uri]} keywords)"
+                })
+        confidence = "medium"
+    
+    else:
+        # Clear winner
+        recommendation = top_resumes[0]
+        resume_type = recommendation.split('://')[-1]
+        reasoning.append(f"✅ Strong match for {resume_type} ({max_score} keyword matches)")
+        
+        # Add specific reasoning based on type
+        if recommendation == "resume://software-engineering":
+            reasoning.append("Focus on: coding skills, software projects, technical stack")
+        elif recommendation == "resume://data-science":
+            reasoning.append("Focus on: data analysis, SQL, visualization, business insights")
+        elif recommendation == "resume://machine-learning":
+            reasoning.append("Focus on: ML models, research, algorithms, frameworks (TensorFlow/PyTorch)")
+        elif recommendation == "resume://cyber":
+            reasoning.append("Focus on: security tools, vulnerabilities, compliance, threat analysis")
+        elif recommendation == "resume://materials-science":
+            reasoning.append("Focus on: lab experience, characterization, research, publications")
+        
+        # Add runner-up alternatives
+        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        for uri, score in sorted_scores[1:3]:  # Next 2 highest
+            if score > 0:
+                alternatives.append({
+                    "uri": uri,
+                    "reason": f"Consider if role emphasizes {uri.split('://')[-1]} ({score} keywords)"
+                })
+    
+    # Company-specific insights
+    company_lower = company.lower()
+    if any(term in company_lower for term in ['google', 'meta', 'facebook', 'amazon', 'microsoft', 'apple', 'netflix']):
+        reasoning.append(f"🏢 {company} is a major tech company - roles are usually well-defined")
+    
+    if any(term in company_lower for term in ['defense', 'lockheed', 'raytheon', 'northrop', 'booz allen']):
+        if recommendation != "resume://cyber":
+            reasoning.append("⚠️ Defense contractors often value security clearance/cyber skills")
+    
+    if any(term in company_lower for term in ['openai', 'deepmind', 'anthropic', 'hugging face']):
+        if recommendation != "resume://machine-learning":
+            reasoning.append("⚠️ AI research companies typically prefer ML-focused resumes")
+    
+    return {
+        "recommended_resume": recommendation,
+        "resume_name": recommendation.split('://')[-1],
+        "confidence": confidence,
+        "reasoning": reasoning,
+        "alternatives": alternatives,
+        "analysis": {
+            "keyword_scores": {
+                "software_engineering": scores["resume://software-engineering"],
+                "data_science": scores["resume://data-science"],
+                "machine_learning": scores["resume://machine-learning"],
+                "cybersecurity": scores["resume://cyber"],
+                "materials_science": scores["resume://materials-science"]
+            },
+            "company": company,
+            "position": position,
+            "jd_provided": bool(job_description)
+        }
+    }
+
+
+def _posting_fields(posting) -> tuple:
+    """(company, position, job_description) from a posting dict or sequence"""
+    if isinstance(posting, dict):
+        company, position = posting.get('company'), posting.get('position')
+        job_description = posting.get('job_description') or ''
+    elif isinstance(posting, (list, tuple)) and 2 <= len(posting) <= 3:
+        company, position = posting[0], posting[1]
+        job_description = (posting[2] if len(posting) > 2 else '') or ''
+    else:
+        raise ValueError("Posting must be an object or a [company, position, job_description] list")
+    if not isinstance(company, str) or not isinstance(position, str) or not isinstance(job_description, str):
+        raise ValueError("company and position are required and must be text")
+    return company, position, job_description
+
+
+def _recommend_resume_chunk(indexed_postings: list) -> list:
+    """Score a chunk of (index, posting) pairs; runs in a worker process"""
+    results = []
+    for index, posting in indexed_postings:
+        try:
+            results.append(recommend_resume_for(*_posting_fields(posting)))
+        except ValueError as e:
+            results.append({"index": index, "error": str(e)})
+    return results
+
+
+def _posting_chunks(postings: list, workers: int) -> list:
+    """Split postings into about four (index, posting) chunks per worker, in order"""
+    size = max(1, -(-len(postings) // (workers * 4)))
+    indexed = list(enumerate(postings))
+    return [indexed[i:i + size] for i in range(0, len(indexed), size)]
+
+
+def recommend_resumes_batch(postings: list, max_workers: Optional[int] = None) -> list:
+    """
+    Recommend resumes for many postings from plain Python (no server needed).
+    
+    Args:
+        postings: list of {"company", "position", "job_description"} objects
+            or (company, position, job_description) tuples
+        max_workers: Processes to use (default: one per CPU)
+    
+    Returns:
+        One recommend_resume-shaped result per posting, in input order
+    """
+    postings = list(postings)
+    if len(postings) < RESUME_BATCH_PARALLEL_THRESHOLD:
+        return _recommend_resume_chunk(list(enumerate(postings)))
+    
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        chunks = _posting_chunks(postings, pool._max_workers)
+        return [result for chunk in pool.map(_recommend_resume_chunk, chunks) for result in chunk]
+
+
+class ExtractionCache:
+    """
+    Text extracted from documents, keyed on path and validated by mtime and size.
+    
+    Entries live in memory and are persisted as JSON (written atomically) so a
+    PDF is parsed once per change rather than once per read or per restart.
+    """
+    
+    def __init__(self, cache_path: str = EXTRACTION_CACHE_PATH):
+        self.cache_path = cache_path
+        self._entries = None  # path -> {'mtime_ns', 'size', 'value'}
+        self.hits = 0
+        self.misses = 0
+    
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+    
+    def _save(self):
+        directory = os.path.dirname(self.cache_path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.extraction_cache.', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # Persisting is best-effort; the in-memory copy still works
+            pass
+    
+    def get(self, file_path: str):
+        """Cached value for file_path, or None if missing or the file has changed"""
+        entry = self._load().get(os.path.abspath(file_path))
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            entry = None
+        if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            return entry['value']
+        self.misses += 1
+        return None
+    
+    def put(self, file_path: str, value):
+        """Store a value for the current version of file_path and persist"""
+        stat = os.stat(file_path)
+        self._load()[os.path.abspath(file_path)] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'value': value
+        }
+        self._save()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (bounds from METRICS_LATENCY_BUCKETS, plus +Inf)"""
+    
+    __slots__ = ('counts', 'count', 'total', 'max')
+    
+    def __init__(self):
+        self.counts = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(METRICS_LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th observation (capped at the max seen)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min(METRICS_LATENCY_BUCKETS[i], self.max) if i < len(METRICS_LATENCY_BUCKETS) else self.max
+        return self.max
+    
+    def summary(self) -> dict:
+        """Count plus mean, approximate percentiles and max in milliseconds"""
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 2)
+        return {
+            'count': self.count,
+            'mean_ms': ms(self.total / self.count) if self.count else None,
+            'p50_ms': ms(self.quantile(0.5)),
+            'p90_ms': ms(self.quantile(0.9)),
+            'p99_ms': ms(self.quantile(0.99)),
+            'max_ms': ms(self.max) if self.count else None
+        }
+
+
+def _prometheus_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ServerMetrics:
+    """
+    Latency histograms and counters for the running server.
+    
+    Histograms are keyed by (family, label): 'tool' per MCP tool, 'google_api'
+    per API attempt ('local' for mirror reads that never leave the machine)
+    and 'stage' for internal steps such as PDF extraction, index builds and
+    response encoding. Worker threads record byte counts, so updates take a
+    lock. Call sites check `enabled` before reading the clock, which keeps the
+    cost of disabled metrics to one attribute read.
+    """
+    
+    HISTOGRAMS = (  # family, Prometheus name, label name, help
+        ('tool', 'tool_latency_seconds', 'tool', 'MCP tool call latency'),
+        ('google_api', 'google_api_request_seconds', 'api', 'Google API request latency per attempt'),
+        ('stage', 'stage_seconds', 'stage', 'Time spent in internal processing steps'),
+    )
+    COUNTERS = (  # name, label names, help
+        ('tool_errors', ('tool',), 'MCP tool calls that raised or returned an error'),
+        ('google_api_errors', ('api',), 'Google API request attempts that failed'),
+        ('google_api_bytes', ('api', 'direction'), 'Bytes sent to and received from Google APIs'),
+    )
+    
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        self.enabled = enabled
+        self.started = time.time()
+        self.histograms = {}  # (family, label) -> LatencyHistogram
+        self.counters = {}  # (name, labels) -> int
+        self._lock = threading.Lock()
+    
+    def observe(self, family: str, label: str, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get((family, label))
+            if histogram is None:
+                histogram = self.histograms[(family, label)] = LatencyHistogram()
+            histogram.observe(seconds)
+    
+    def inc(self, name: str, labels: tuple, amount: int = 1):
+        key = (name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+    
+    def snapshot(self) -> dict:
+        """Per-tool, per-API and per-stage summaries"""
+        if not self.enabled:
+            return {'enabled': False,
+                    'hint': 'Metrics are off (INTERNSHIP_COACH_METRICS=0)'}
+        with self._lock:
+            histograms = {key: histogram.summary() for key, histogram in self.histograms.items()}
+            counters = dict(self.counters)
+        
+        tools, apis, stages = {}, {}, {}
+        for (family, label), summary in sorted(histograms.items()):
+            if family == 'tool':
+                tools[label] = dict(summary, errors=counters.get(('tool_errors', (label,)), 0))
+            elif family == 'google_api':
+                apis[label] = dict(summary, errors=counters.get(('google_api_errors', (label,)), 0))
+            else:
+                stages[label] = summary
+        for (name, labels), value in sorted(counters.items()):
+            if name == 'google_api_bytes':
+                api, direction = labels
+                apis.setdefault(api, {})[f'bytes_{direction}'] = value
+        return {
+            'enabled': True,
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'tools': tools,
+            'google_api': apis,
+            'stages': stages
+        }
+    
+    def prometheus_text(self, prefix: str = 'internship_coach') -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            histograms = sorted((key, list(h.counts), h.total, h.count) for key, h in self.histograms.items())
+            counters = sorted(self.counters.items())
+        
+        lines = [f'# HELP {prefix}_start_time_seconds When the server started',
+                 f'# TYPE {prefix}_start_time_seconds gauge',
+                 f'{prefix}_start_time_seconds {self.started:.3f}']
+        bounds = [repr(float(b)) for b in METRICS_LATENCY_BUCKETS] + ['+Inf']
+        for family, metric, label_name, help_text in self.HISTOGRAMS:
+            name = f'{prefix}_{metric}'
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+            for (f, label), counts, total, count in histograms:
+                if f != family:
+                    continue
+                label = f'{label_name}="{_prometheus_label(label)}"'
+                cumulative = 0
+                for bound, n in zip(bounds, counts):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{label}}} {total:.6f}')
+                lines.append(f'{name}_count{{{label}}} {count}')
+        for counter, label_names, help_text in self.COUNTERS:
+            name = f'{prefix}_{counter}_total'
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+            for (c, labels), value in counters:
+                if c == counter:
+                    label = ','.join(f'{k}="{_prometheus_label(v)}"' for k, v in zip(label_names, labels))
+                    lines.append(f'{name}{{{label}}} {value}')
+        return '\n'.join(lines) + '\n'
+    
+    def write_textfile(self, path: str):
+        """
+        Write prometheus_text() for node_exporter's textfile collector.
+        
+        Written to a temp file and renamed into place so the collector never
+        reads a partial file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class _CountingHttp:
+    """Transport wrapper that counts request and response bytes per Google API"""
+    
+    def __init__(self, http, metrics: ServerMetrics):
+        self._http = http
+        self._metrics = metrics
+    
+    def request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+        resp, content = self._http.request(uri, method, body, headers, *args, **kwargs)
+        api = 'sheets' if 'sheets.googleapis.com' in uri else 'calendar' if '/calendar/' in uri else 'other'
+        if body:
+            self._metrics.inc('google_api_bytes', (api, 'sent'),
+                              len(body.encode('utf-8')) if isinstance(body, str) else len(body))
+        self._metrics.inc('google_api_bytes', (api, 'received'), len(content or b''))
+        return resp, content
+    
+    def __getattr__(self, name):
+        return getattr(self._http, name)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: uniformly up to base * 2^attempt, capped"""
+    return random.uniform(0, min(GOOGLE_API_BACKOFF_MAX_SECONDS,
+                                 GOOGLE_API_BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After header), if any"""
+    headers = getattr(error, 'resp', None)
+    try:
+        return float(headers.get('retry-after')) if headers is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class TokenBucket:
+    """
+    Async token bucket: bursts up to capacity, refilling at rate tokens per second.
+    
+    Waiters are served in arrival order.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waited_seconds = 0.0
+    
+    @classmethod
+    def for_quota(cls, per_minute: int) -> 'TokenBucket':
+        """A bucket that can't exceed per_minute requests in any 60 second window"""
+        capacity = max(1, per_minute // 6)
+        return cls(rate=(per_minute - capacity) / 60, capacity=capacity)
+    
+    async def acquire(self, cost: float = 1):
+        cost = min(cost, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                wait = (cost - self.tokens) / self.rate
+                self.waited_seconds += wait
+                await asyncio.sleep(wait)
+
+
+class GoogleApiExecutor:
+    """
+    Runs blocking googleapiclient requests on a bounded thread pool.
+    
+    googleapiclient's httplib2 transport isn't thread-safe, so every worker
+    thread gets its own AuthorizedHttp built from the current credentials.
+    Each call is bounded twice: by the socket timeout on the worker's
+    transport, and by an asyncio timeout so the awaiting tool call returns
+    even if the worker is still stuck.
+    
+    It's also the one place quota is managed: calls tagged with an API wait
+    on that API's token bucket, idempotent calls that hit rate limit or
+    server errors (see _is_retryable) are retried with jittered exponential backoff, and identical reads already
+    in flight are shared instead of sent twice.
+    """
+    
+    def __init__(self, max_workers: int = GOOGLE_API_MAX_WORKERS,
+                 timeout: float = GOOGLE_API_TIMEOUT_SECONDS,
+                 quotas: Optional[dict] = None, metrics: Optional[ServerMetrics] = None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.credentials = None
+        self._pool = None
+        self._local = threading.local()
+        self.buckets = {api: TokenBucket.for_quota(per_minute)
+                        for api, per_minute in (GOOGLE_API_QUOTAS if quotas is None else quotas).items()}
+        self._inflight = {}  # coalesce key -> task
+        self.requests = 0
+        self.retries = 0
+        self.coalesced = 0
+        self.metrics = metrics if metrics is not None else ServerMetrics(enabled=False)
+    
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix='google-api')
+        return self._pool
+    
+    def _thread_http(self):
+        """This worker's transport, rebuilt whenever the credentials object changes"""
+        local = self._local
+        if getattr(local, 'credentials', None) is not self.credentials:
+            import google_auth_httplib2
+            import httplib2
+            local.http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http(timeout=self.timeout))
+            if self.metrics.enabled:
+                local.http = _CountingHttp(local.http, self.metrics)
+            local.credentials = self.credentials
+        return local.http
+    
+    def _run(self, request_factory):
+        request = request_factory()
+        if self.credentials is None:
+            # No OAuth credentials (e.g. services injected directly); let the
+            # request use whatever transport it was built with
+            return request.execute()
+        return request.execute(http=self._thread_http())
+    
+    async def execute(self, request_factory, timeout: Optional[float] = None,
+                      api: Optional[str] = None, coalesce_key=None, cost: int = 1,
+                      idempotent: bool = False):
+        """
+        Build and execute a Google API request on the pool.
+        
+        Args:
+            request_factory: Zero-argument callable returning the request to
+                execute. It's called on the worker thread so building the
+                request never touches the event loop.
+            timeout: Seconds to wait per attempt (default: self.timeout)
+            api: Quota the call counts against ('sheets', 'calendar'); None
+                for calls that don't reach Google
+            coalesce_key: Hashable identity of a read; concurrent calls with
+                the same key share one request and its result
+            cost: Requests this call counts as (e.g. the size of a batch)
+            idempotent: Whether sending the request twice does no harm (reads,
+                updates, batchUpdate, inserts that carry their own id). Only
+                these are retried: a failed append may still have been applied.
+        """
+        if coalesce_key is None:
+            return await self._execute_with_retry(request_factory, timeout, api, cost, idempotent)
+        key = (api, coalesce_key)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._execute_with_retry(request_factory, timeout, api, cost, idempotent))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _execute_with_retry(self, request_factory, timeout: Optional[float],
+                                  api: Optional[str], cost: int, idempotent: bool):
+        timeout = self.timeout if timeout is None else timeout
+        bucket = self.buckets.get(api)
+        loop = asyncio.get_running_loop()
+        metrics = self.metrics
+        for attempt in range(GOOGLE_API_MAX_RETRIES + 1):
+            if bucket is not None:
+                await bucket.acquire(cost)
+            self.requests += 1
+            started = time.perf_counter() if metrics.enabled else None
+            future = loop.run_in_executor(self.pool, self._run, request_factory)
+            try:
+                result = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self._record(api, started, failed=True)
+                raise TimeoutError(f"Google API call timed out after {timeout}s") from None
+            except Exception as e:
+                self._record(api, started, failed=True)
+                if attempt == GOOGLE_API_MAX_RETRIES or not idempotent or not _is_retryable(e):
+                    raise
+                self.retries += 1
+                delay = _retry_after(e)
+                await asyncio.sleep(delay if delay is not None else _backoff_delay(attempt))
+            else:
+                self._record(api, started)
+                return result
+    
+    def _record(self, api: Optional[str], started: Optional[float], failed: bool = False):
+        """Record one attempt's latency (and failure) when metrics are on"""
+        if started is None:
+            return
+        label = api or 'local'
+        self.metrics.observe('google_api', label, time.perf_counter() - started)
+        if failed:
+            self.metrics.inc('google_api_errors', (label,))
+    
+    def stats(self) -> dict:
+        """Request, retry and coalescing counters, and time spent waiting on quota"""
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'coalesced': self.coalesced,
+            'quota_wait_seconds': {api: round(bucket.waited_seconds, 3)
+                                   for api, bucket in self.buckets.items()}
+        }
+    
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+def _first_row_of_range(a1_range: str) -> Optional[int]:
+    """Extract the first row number from an A1 range like 'Sheet'!A42:G42"""
+    match = re.search(r'![A-Z]+(\d+)', a1_range or '')
+    return int(match.group(1)) if match else None
+
+
+def _parse_page_range(pages: Optional[str]) -> tuple:
+    """
+    Parse a 1-based inclusive page range ("3", "2-5", "4-") into (first, last).
+    
+    last is None for an open-ended range. No range means every page.
+    """
+    if pages is None or str(pages).strip() == '':
+        return 1, None
+    match = re.fullmatch(r'\s*(\d+)\s*(?:(-)\s*(\d*)\s*)?', str(pages))
+    if not match or int(match.group(1)) < 1:
+        raise ValueError(f"Invalid page range: {pages!r} (use e.g. '1', '2-4' or '3-')")
+    first = int(match.group(1))
+    if not match.group(2):
+        return first, first
+    last = int(match.group(3)) if match.group(3) else None
+    if last is not None and last < first:
+        raise ValueError(f"Invalid page range: {pages!r} (end is before start)")
+    return first, last
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_sheet_date(value: str) -> Optional[datetime]:
+    """Parse a Date Applied cell (M/D/YY, M/D/YYYY or YYYY-MM-DD); None if it isn't a date"""
+    value = (value or '').strip()
+    for fmt in ('%m/%d/%y', '%m/%d/%Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _field_projection(fields: Optional[list]) -> Optional[list]:
+    """Validate a fields projection; None means every field"""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(',')]
+    unknown = [f for f in fields if f not in TRACKER_FIELDS and f != 'row']
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(TRACKER_FIELDS)}")
+    return [f for f in TRACKER_FIELDS if f in fields]
+
+
+def _project(app, projection: Optional[list]) -> dict:
+    """Application as a dict, limited to the projected fields (plus row)"""
+    if projection is None:
+        return app.to_dict()
+    projected = {'row': app.row}
+    for field in projection:
+        projected[field] = getattr(app, field)
+    return projected
+
+
+def _sort_spec(sort_by: Optional[str]) -> tuple:
+    """(field, descending) from a sort key like 'company' or '-date_applied'"""
+    if not sort_by:
+        return None, False
+    descending = sort_by.startswith('-')
+    field = sort_by.lstrip('-+').strip()
+    if field not in TRACKER_FIELDS and field != 'row':
+        raise ValueError(f"Can't sort by {field!r}. Available: row, {', '.join(TRACKER_FIELDS)}")
+    return field, descending
+
+
+def _sort_value(app, field: str) -> tuple:
+    """Sort key: (is blank, value); dates compare as dates, text case-insensitively"""
+    value = getattr(app, field)
+    if field == 'row':
+        return (False, value)
+    if field == 'date_applied':
+        parsed = _parse_sheet_date(value)
+        return (parsed is None, parsed or datetime.min)
+    value = value.strip().lower()
+    return (value == '', value)
+
+
+def _query_fingerprint(query: list) -> str:
+    return hashlib.sha1(json.dumps(query, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def _encode_cursor(offset: int, next_row: int, query: list) -> str:
+    """Opaque paging cursor bound to the query it came from"""
+    payload = json.dumps({'o': offset, 'r': next_row, 'q': _query_fingerprint(query)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str, query: list) -> tuple:
+    """(offset, next_row) from a cursor; raises ValueError if it's invalid or from another query"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset, next_row, fingerprint = int(payload['o']), int(payload['r']), payload['q']
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor") from None
+    if fingerprint != _query_fingerprint(query):
+        raise ValueError("Cursor belongs to a different query; pass the same filters, fields and sort_by")
+    return offset, next_row
+
+
+def _column_index(letters: str) -> int:
+    """0-based index of a column letter (A -> 0, G -> 6, AA -> 26)"""
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + (ord(ch) - ord('A') + 1)
+    return index - 1
+
+
+def _column_letter(index: int) -> str:
+    """Column letter for a 0-based index (0 -> A, 26 -> AA)"""
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
+def _application_row(record: dict) -> list:
+    """
+    Validate an application record and return it as a tracker row (A..G).
+    
+    Raises:
+        ValueError: If a required field is missing or a value isn't text
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Record must be an object")
+    missing = [f for f in ('company', 'position', 'date_applied', 'referral_source')
+               if not str(record.get(f) or '').strip()]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+    unknown = set(record) - set(TRACKER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    
+    defaults = {'status': 'In Progress', 'details': '', 'portal': ''}
+    row = []
+    for field in TRACKER_FIELDS:
+        value = record.get(field)
+        if value is None:
+            value = defaults.get(field, '')
+        if not isinstance(value, (str, int, float)):
+            raise ValueError(f"Field '{field}' must be text")
+        row.append(str(value))
+    return row
+
+
+def _merge_cell_edits(cells: list) -> list:
+    """
+    Merge single-cell edits into as few rectangular ranges as possible.
+    
+    Args:
+        cells: list of (row, col_index, value, edit_index) with unique (row, col)
+    
+    Returns:
+        list of dicts with 'row', 'col', 'values' (2D) and 'edits' (edit
+        indices per cell, same shape as values)
+    """
+    # Pass 1: contiguous columns within a row become one horizontal segment
+    segments = []
+    for row, col, value, edit_index in sorted(cells, key=lambda c: (c[0], c[1])):
+        last = segments[-1] if segments else None
+        if last and last['row'] == row and last['col'] + len(last['values'][0]) == col:
+            last['values'][0].append(value)
+            last['edits'][0].append(edit_index)
+        else:
+            segments.append({'row': row, 'col': col, 'values': [[value]], 'edits': [[edit_index]]})
+    
+    # Pass 2: stack segments with the same column span on consecutive rows
+    segments.sort(key=lambda seg: (seg['col'], len(seg['values'][0]), seg['row']))
+    blocks = []
+    for seg in segments:
+        last = blocks[-1] if blocks else None
+        if (last and last['col'] == seg['col']
+                and len(last['values'][0]) == len(seg['values'][0])
+                and last['row'] + len(last['values']) == seg['row']):
+            last['values'].extend(seg['values'])
+            last['edits'].extend(seg['edits'])
+        else:
+            blocks.append(seg)
+    return blocks
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_key(value: str) -> str:
+    """Case- and whitespace-insensitive lookup key"""
+    return ' '.join((value or '').lower().split())
+
+
+def _parse_query_date(value: str) -> datetime:
+    """Parse a date given in a query; M/D without a year means this year"""
+    parsed = _parse_sheet_date(value)
+    if parsed is None:
+        try:
+            parsed = datetime.strptime(f"{value.strip()}/{datetime.now().year}", '%m/%d/%Y')
+        except ValueError:
+            raise ValueError(f"Invalid date: {value!r} (use M/D, M/D/YY or YYYY-MM-DD)") from None
+    return parsed
+
+
+class Application:
+    """
+    One tracker row.
+    
+    __slots__ keeps per-row overhead to the fields themselves, and the short
+    values that repeat across rows (status, referral source, date) are
+    interned so every "Submitted" or "Handshake" shares one string. Cells
+    that aren't text (a number a client wrote into Date Applied) are kept as
+    their text, the way Sheets echoes them back.
+    """
+    
+    __slots__ = ('row',) + tuple(TRACKER_FIELDS)
+    
+    def __init__(self, row: int, company: str = '', position: str = '', date_applied: str = '',
+                 referral_source: str = '', status: str = '', details: str = '', portal: str = ''):
+        self.row = row
+        self.company = str(company)
+        self.position = str(position)
+        self.date_applied = sys.intern(str(date_applied))
+        self.referral_source = sys.intern(str(referral_source))
+        self.status = sys.intern(str(status))
+        self.details = str(details)
+        self.portal = str(portal)
+    
+    def to_dict(self) -> dict:
+        return {
+            'row': self.row,
+            'company': self.company,
+            'position': self.position,
+            'date_applied': self.date_applied,
+            'referral_source': self.referral_source,
+            'status': self.status,
+            'details': self.details,
+            'portal': self.portal
+        }
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Application):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+    
+    def __repr__(self) -> str:
+        return f"Application(row={self.row}, company={self.company!r}, position={self.position!r}, status={self.status!r})"
+
+
+def parse_applications(rows: list, start_row: int = DATA_START_ROW) -> list:
+    """
+    Parse raw A..G rows into Application records, skipping blank rows.
+    
+    This is the only place tracker rows are turned into records; every reader
+    (listing, paging, indexes, delta sync) goes through it.
+    """
+    applications = []
+    n_fields = len(TRACKER_FIELDS)
+    for i, row in enumerate(rows, start=start_row):
+        if not row or not row[0]:  # Skip empty rows
+            continue
+        if len(row) < n_fields:
+            row = row + [''] * (n_fields - len(row))
+        applications.append(Application(i, *row[:n_fields]))
+    return applications
+
+
+def _row_fingerprint(row: list) -> Optional[bytes]:
+    """Digest of a row's A..G values; None for a blank row (no company)"""
+    if not row or not row[0]:
+        return None
+    cells = [str(value) for value in row[:len(TRACKER_FIELDS)]]
+    cells += [''] * (len(TRACKER_FIELDS) - len(cells))
+    return hashlib.blake2b('\x1f'.join(cells).encode(), digest_size=16).digest()
+
+
+def _appended_row_key(row: list) -> tuple:
+    """
+    A row's A..G cells as text for telling whether an append landed; the
+    date is compared as a date, since Sheets may reformat it ('9/4/25' ->
+    '9/4/2025')
+    """
+    cells = ['' if value is None else str(value).strip() for value in row[:len(TRACKER_FIELDS)]]
+    cells += [''] * (len(TRACKER_FIELDS) - len(cells))
+    date_col = TRACKER_FIELDS.index('date_applied')
+    cells[date_col] = _parse_sheet_date(cells[date_col]) or cells[date_col]
+    return tuple(cells)
+
+
+def _find_appended_rows(rows: list, values: list, start: int = 0) -> Optional[int]:
+    """
+    Offset in rows (at or after start) of the last place values appear as
+    consecutive rows, or None if they don't: how an append that failed
+    without a clear answer is checked against the sheet read back afterwards
+    """
+    if not values:
+        return None
+    wanted = [_appended_row_key(row) for row in values]
+    have = [_appended_row_key(row) for row in rows[start:]]
+    for offset in range(len(have) - len(wanted), -1, -1):
+        if have[offset] == wanted[0] and have[offset:offset + len(wanted)] == wanted:
+            return start + offset
+    return None
+
+
+class RowVersions:
+    """
+    Versioned fingerprints of tracker rows for delta sync.
+    
+    Every observed change to a row (insert, edit, delete) is stamped with a
+    new version and appended to a change log, so "what changed since version
+    v" is a bisect into the log plus the rows it names. Tokens carry a
+    per-process epoch; a token from another process, or one older than the
+    trimmed log, can't be answered incrementally and the caller resyncs.
+    """
+    
+    def __init__(self, max_log: int = DELTA_MAX_LOG):
+        self.epoch = os.urandom(4).hex()
+        self.version = 0
+        self.oldest_version = 0  # Changes after this version are fully in the log
+        self.max_log = max_log
+        self.fingerprints = {}  # row -> fingerprint of its current contents
+        self.inserted_at = {}  # row -> version it (re)appeared at
+        self._log = []  # (version, row) in version order
+    
+    def _record(self, row: int, fingerprint: Optional[bytes]):
+        previous = self.fingerprints.get(row)
+        if previous == fingerprint:
+            return
+        self.version += 1
+        if fingerprint is None:
+            del self.fingerprints[row]
+            self.inserted_at.pop(row, None)
+        else:
+            if previous is None:
+                self.inserted_at[row] = self.version
+            self.fingerprints[row] = fingerprint
+        self._log.append((self.version, row))
+    
+    def observe_snapshot(self, rows: list, start_row: int = DATA_START_ROW):
+        """Diff a full fetch of the sheet against what we had"""
+        seen = set()
+        for row_num, row in enumerate(rows, start=start_row):
+            fingerprint = _row_fingerprint(row)
+            if fingerprint is not None:
+                seen.add(row_num)
+            self._record(row_num, fingerprint)
+        for row_num in [r for r in self.fingerprints if r not in seen]:
+            self._record(row_num, None)
+        self._trim()
+    
+    def observe_rows(self, rows: list, first_row: int, count: int, start_row: int = DATA_START_ROW):
+        """Record rows first_row..first_row+count-1 after a write-through"""
+        for row_num in range(first_row, first_row + count):
+            offset = row_num - start_row
+            row = rows[offset] if 0 <= offset < len(rows) else None
+            self._record(row_num, _row_fingerprint(row))
+        self._trim()
+    
+    def _trim(self):
+        if len(self._log) > self.max_log:
+            drop = len(self._log) - self.max_log
+            self.oldest_version = self._log[drop - 1][0]
+            del self._log[:drop]
+    
+    def token(self) -> str:
+        payload = json.dumps({'e': self.epoch, 'v': self.version})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+    
+    def changes_since(self, token: str) -> Optional[tuple]:
+        """
+        (inserted rows, changed rows, deleted rows) since token, or None if
+        the token can't be answered incrementally and a full resync is needed
+        """
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            epoch, since = payload['e'], int(payload['v'])
+        except (ValueError, TypeError, KeyError):
+            return None
+        if epoch != self.epoch or since < self.oldest_version or since > self.version:
+            return None
+        
+        start = bisect.bisect_right(self._log, (since, float('inf')))
+        touched = {row for _, row in self._log[start:]}
+        inserted, changed, deleted = [], [], []
+        for row in sorted(touched):
+            if row not in self.fingerprints:
+                deleted.append(row)
+            elif self.inserted_at.get(row, 0) > since:
+                inserted.append(row)
+            else:
+                changed.append(row)
+        return inserted, changed, deleted
+
+
+PIPELINE_STAGES = ['submitted', 'phone_screen', 'technical', 'interview']  # Funnel order
+
+
+def _pipeline_stage(status: str) -> Optional[str]:
+    """
+    Furthest funnel stage a status implies: 'interview', 'technical',
+    'phone_screen', 'submitted' or 'rejected' (None for In Progress/blank/other).
+    """
+    status_lower = _normalize_key(status)
+    if 'interview' in status_lower:
+        return 'interview'
+    if 'technical' in status_lower:
+        return 'technical'
+    if 'phone screen' in status_lower or 'hirevue' in status_lower:
+        return 'phone_screen'
+    if status_lower == 'submitted':
+        return 'submitted'
+    if status_lower == 'rejected':
+        return 'rejected'
+    return None
+
+
+def _rate(numerator: int, denominator: int) -> Optional[float]:
+    return round(numerator / denominator, 3) if denominator else None
+
+
+class PipelineStats:
+    """
+    Running aggregates over the tracker: counts by status, applied vs in
+    progress, funnel stages, referral sources and weekly volume.
+    
+    Every counter is additive, so add/remove adjust them for one application
+    at a time and a write never forces a recount of the whole sheet.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.applied = 0
+        self.in_progress = 0
+        self.undated = 0
+        self.status_counts = {}  # normalized status -> count
+        self.status_labels = {}  # normalized status -> status as written in the sheet
+        self.stage_counts = dict.fromkeys(PIPELINE_STAGES + ['rejected'], 0)
+        self.referrals = {}  # normalized source -> [label, total, applied, advanced]
+        self.weekly = {}  # ordinal of the week's Monday -> applications dated that week
+    
+    @staticmethod
+    def _bump(counts: dict, key, delta: int):
+        value = counts.get(key, 0) + delta
+        if value:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+    
+    def _apply(self, app, applied: bool, date: Optional[datetime], delta: int):
+        self.total += delta
+        if applied:
+            self.applied += delta
+        status_key = _normalize_key(app.status)
+        if status_key == 'in progress':
+            self.in_progress += delta
+        
+        self._bump(self.status_counts, status_key, delta)
+        if status_key in self.status_counts:
+            self.status_labels.setdefault(status_key, app.status.strip() or '(blank)')
+        else:
+            self.status_labels.pop(status_key, None)
+        
+        stage = _pipeline_stage(app.status)
+        if stage is not None:
+            self.stage_counts[stage] += delta
+        
+        source_key = _normalize_key(app.referral_source)
+        entry = self.referrals.get(source_key)
+        if entry is None:
+            entry = self.referrals[source_key] = [app.referral_source.strip() or '(blank)', 0, 0, 0]
+        entry[1] += delta
+        if applied:
+            entry[2] += delta
+        if stage in ('phone_screen', 'technical', 'interview'):
+            entry[3] += delta
+        if not entry[1]:
+            del self.referrals[source_key]
+        
+        if date is None:
+            self.undated += delta
+        else:
+            self._bump(self.weekly, date.toordinal() - date.weekday(), delta)
+    
+    def add(self, app, applied: bool, date: Optional[datetime]):
+        """Count an application (applied and date as already worked out by the caller)"""
+        self._apply(app, applied, date, 1)
+    
+    def remove(self, app, applied: bool, date: Optional[datetime]):
+        """Stop counting an application previously passed to add"""
+        self._apply(app, applied, date, -1)
+    
+    def snapshot(self, weeks: Optional[int] = None) -> dict:
+        """
+        The aggregates as a response dict.
+        
+        Funnel counts are "reached at least this stage" (a status only records
+        the furthest stage, so a Technical application also passed the phone
+        screen); rejected applications count as submitted. weeks limits the
+        weekly volume to the most recent N weeks with applications.
+        """
+        reached = {}
+        running = 0
+        for stage in reversed(PIPELINE_STAGES):
+            running += self.stage_counts[stage]
+            reached[stage] = running
+        reached['submitted'] += self.stage_counts['rejected']
+        
+        weekly = sorted(self.weekly.items())
+        if weeks is not None:
+            weekly = weekly[-weeks:] if weeks > 0 else []
+        
+        return {
+            'total': self.total,
+            'applied': self.applied,
+            'in_progress': self.in_progress,
+            'other': self.total - self.applied - self.in_progress,
+            'by_status': {
+                self.status_labels[key]: count
+                for key, count in sorted(self.status_counts.items(), key=lambda item: -item[1])
+            },
+            'funnel': {stage: reached[stage] for stage in PIPELINE_STAGES},
+            'rejected': self.stage_counts['rejected'],
+            'conversion_rates': {
+                'submitted_to_phone_screen': _rate(reached['phone_screen'], reached['submitted']),
+                'phone_screen_to_technical': _rate(reached['technical'], reached['phone_screen']),
+                'technical_to_interview': _rate(reached['interview'], reached['technical']),
+                'submitted_to_interview': _rate(reached['interview'], reached['submitted'])
+            },
+            'by_referral_source': {
+                label: {'total': total, 'applied': applied, 'advanced': advanced,
+                        'advance_rate': _rate(advanced, applied)}
+                for label, total, applied, advanced in sorted(self.referrals.values(),
+                                                               key=lambda entry: -entry[1])
+            },
+            'weekly_volume': {
+                datetime.fromordinal(monday).strftime('%Y-%m-%d'): count
+                for monday, count in weekly
+            },
+            'undated': self.undated
+        }
+
+
+_COMPANY_SUFFIXES = frozenset({'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation',
+                               'co', 'company', 'plc', 'gmbh', 'lp', 'llp', 'ag', 'sa'})
+_POSITION_WORDS = {  # Abbreviations and word forms -> one canonical spelling
+    'swe': 'software engineer', 'sde': 'software developer engineer', 'se': 'software engineer',
+    'ml': 'machine learning', 'ai': 'artificial intelligence', 'ds': 'data science',
+    'pm': 'product manager', 'qa': 'quality assurance', 'eng': 'engineer', 'engr': 'engineer',
+    'engineering': 'engineer', 'dev': 'developer', 'development': 'developer',
+    'scientist': 'science', 'analytics': 'analyst', 'mgr': 'manager', 'management': 'manager',
+    'sr': 'senior', 'jr': 'junior', 'internship': 'intern', 'interns': 'intern',
+}
+_POSITION_STOPWORDS = frozenset({'a', 'an', 'the', 'of', 'and', 'for', 'to', 'in', 'at',
+                                 'summer', 'fall', 'winter', 'spring'})
+# Words most internship titles share; what's left says which role it is
+_POSITION_GENERIC_WORDS = frozenset({'intern', 'engineer', 'software', 'developer', 'year', 'co', 'op', 'coop'})
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_company(company: str) -> str:
+    """'The Boeing Company' -> 'boeing', 'Google LLC' -> 'google'"""
+    words = re.sub(r'[^a-z0-9]+', ' ', (company or '').lower().replace('&', ' and ')).split()
+    if len(words) > 1 and words[0] == 'the':
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_position(position: str) -> str:
+    """Canonical words, sorted: 'SWE Intern, Summer 2026' -> 'engineer intern software'"""
+    words = set()
+    for word in re.sub(r'[^a-z0-9+#]+', ' ', (position or '').lower()).split():
+        if word in _POSITION_STOPWORDS or re.fullmatch(r'(19|20)\d\d', word):
+            continue
+        words.update(_POSITION_WORDS.get(word, word).split())
+    return ' '.join(sorted(words))
+
+
+@functools.lru_cache(maxsize=65536)
+def _role_words(position: str) -> frozenset:
+    """The words of a normalized position that set the role apart ('hardware', 'data', 'manager')"""
+    return frozenset(word for word in position.split() if word not in _POSITION_GENERIC_WORDS)
+
+
+def _same_role_word(a: str, b: str) -> bool:
+    """Equal, one abbreviates the other ('quant' / 'quantitative'), or a misspelling of it"""
+    if a == b:
+        return True
+    shorter, longer = sorted((a, b), key=len)
+    if len(shorter) >= 4 and longer.startswith(shorter):
+        return True
+    return difflib.SequenceMatcher(None, a, b).ratio() >= DUPLICATE_POSITION_WORD_SIMILARITY
+
+
+def _same_role(a: frozenset, b: frozenset) -> bool:
+    """
+    Whether two positions' role words (see _role_words) name the same role:
+    every word on each side has a match on the other, so 'Software Engineering
+    Intern' and 'SWE Intern' match but 'Hardware Engineering Intern' doesn't
+    """
+    if a == b:
+        return True
+    return (all(any(_same_role_word(x, y) for y in b) for x in a)
+            and all(any(_same_role_word(x, y) for x in a) for y in b))
+
+
+def _trigrams(text: str) -> frozenset:
+    padded = f' {text} '
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2)) if text else frozenset()
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _spells_leading_words(compact: str, name: str) -> bool:
+    """Whether compact is the first words of name with the spaces taken out"""
+    joined = ''
+    for word in name.split():
+        joined += word
+        if len(joined) >= len(compact):
+            return joined == compact
+    return False
+
+
+def _company_similarity(a: str, a_grams: frozenset, b: str, b_grams: frozenset) -> float:
+    """
+    How alike two normalized company names are, from 0 to 1.
+    
+    1.0 when one is the other with words added or spaced differently
+    ('meta' / 'meta platforms', 'j p morgan' / 'jpmorgan chase'); otherwise
+    trigram Jaccard, or the names' edit similarity when that's high enough
+    to be a misspelling.
+    """
+    a_compact, b_compact = a.replace(' ', ''), b.replace(' ', '')
+    if a_compact == b_compact or _spells_leading_words(a_compact, b) or _spells_leading_words(b_compact, a):
+        return 1.0
+    similarity = _jaccard(a_grams, b_grams)
+    matcher = difflib.SequenceMatcher(None, a_compact, b_compact)
+    # The quick ratios are upper bounds; most pairs are ruled out without the full diff
+    if (matcher.real_quick_ratio() < DUPLICATE_COMPANY_TYPO_SIMILARITY
+            or matcher.quick_ratio() < DUPLICATE_COMPANY_TYPO_SIMILARITY):
+        return similarity
+    typo = matcher.ratio()
+    return max(similarity, typo) if typo >= DUPLICATE_COMPANY_TYPO_SIMILARITY else similarity
+
+
+def _company_spellings(company: str) -> set:
+    """
+    Keys a near-duplicate name has in common with a normalized company name:
+    its leading words with the spaces taken out ('jpmorgan', 'jpmorganchase'
+    for 'jpmorgan chase'), and the whole name with the spaces taken out and
+    any one letter deleted, which a one-letter misspelling ('googel',
+    'gogle', 'gooogle') shares with it.
+    """
+    compact, joined = company.replace(' ', ''), ''
+    spellings = {compact}
+    for word in company.split():
+        joined += word
+        if len(joined) >= DUPLICATE_SPELLING_MIN_LENGTH:
+            spellings.add(joined)
+    if len(compact) > DUPLICATE_SPELLING_MIN_LENGTH:
+        spellings.update(compact[:i] + compact[i + 1:] for i in range(len(compact)))
+    return spellings
+
+
+def _minhash_params(count: int, seed: int = 0) -> tuple:
+    """(a, b) for count universal hash functions h(x) = (a * x + b) mod p"""
+    rng = random.Random(seed)
+    return tuple((rng.randrange(1, _MINHASH_PRIME), rng.randrange(_MINHASH_PRIME)) for _ in range(count))
+
+
+_MINHASH_PARAMS = _minhash_params(DUPLICATE_LSH_BANDS * max(2, DUPLICATE_LSH_POSITION_ROWS))
+
+
+@functools.lru_cache(maxsize=65536)
+def _gram_hashes(gram: str) -> tuple:
+    """A gram's value under every MinHash function (trigrams repeat a lot, so this is cached)"""
+    h = hash(gram) % _MINHASH_PRIME
+    return tuple((a * h + b) % _MINHASH_PRIME for a, b in _MINHASH_PARAMS)
+
+
+@functools.lru_cache(maxsize=65536)
+def _minhash(grams: frozenset, count: int) -> tuple:
+    """MinHash signature of count values: per hash function, the smallest hash of any gram"""
+    if not grams:
+        return (0,) * count
+    return tuple(map(min, zip(*map(_gram_hashes, grams))))[:count]
+
+
+class DuplicateIndex:
+    """
+    Finds rows that look like the same application under different spellings
+    ("Google" / "SWE Intern" vs "Google LLC" / "Software Engineering Intern").
+    
+    Companies and positions are normalized, then compared by the Jaccard
+    similarity of their character trigrams (see _company_similarity for the
+    extra ways two company names count as the same). Positions must also
+    name the same role once generic words are set aside (_same_role), so
+    "Hardware Engineering Intern" isn't taken for "Software Engineering
+    Intern". Candidates come from
+    MinHash LSH: each band key pairs a slice of a signature of the company's
+    first word with a slice of the position's, so only pairs similar in both
+    tend to share a bucket and a lookup looks at a few buckets instead of
+    every row (finds "Lockheed" for "Lockheed Martin"). Since a misspelled
+    first word shares few trigrams, rows are also keyed by the spellings in
+    _company_spellings (finds "JPMorgan" for "J.P. Morgan" and "Google" for
+    "Googel"); those buckets hold only one company's rows. Rows with
+    the same normalized company and position share one entry.
+    """
+    
+    def __init__(self):
+        self._rows = {}  # row -> (company, position) key
+        self._entries = {}  # key -> (company trigrams, position trigrams, band keys, rows)
+        self._buckets = {}  # band key -> keys
+    
+    @staticmethod
+    def _signature(key: tuple) -> tuple:
+        """(company trigrams, position trigrams, band keys) for a normalized key"""
+        company, position = key
+        company_grams, position_grams = _trigrams(company), _trigrams(position)
+        r = DUPLICATE_LSH_POSITION_ROWS
+        first_word_hash = _minhash(_trigrams(company.split()[0]), DUPLICATE_LSH_BANDS * 2)
+        position_hash = _minhash(position_grams, DUPLICATE_LSH_BANDS * r)
+        bands = [(band, first_word_hash[band * 2:(band + 1) * 2], position_hash[band * r:(band + 1) * r])
+                 for band in range(DUPLICATE_LSH_BANDS)]
+        bands.extend(_company_spellings(company))
+        return company_grams, position_grams, bands
+    
+    def add(self, row: int, company: str, position: str):
+        """Index a row, replacing whatever was indexed for it"""
+        self.remove(row)
+        key = (_normalize_company(company), _normalize_position(position))
+        if not key[0]:
+            return
+        self._rows[row] = key
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = self._signature(key) + (set(),)
+            for band in entry[2]:
+                self._buckets.setdefault(band, set()).add(key)
+        entry[3].add(row)
+    
+    def remove(self, row: int):
+        key = self._rows.pop(row, None)
+        if key is None:
+            return
+        entry = self._entries[key]
+        entry[3].discard(row)
+        if not entry[3]:
+            del self._entries[key]
+            for band in entry[2]:
+                bucket = self._buckets[band]
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+    
+    def matches(self, company: str, position: str, limit: int = DUPLICATE_MAX_MATCHES) -> list:
+        """(row, similarity) for the likeliest duplicates, most similar first"""
+        key = (_normalize_company(company), _normalize_position(position))
+        if not key[0]:
+            return []
+        entry = self._entries.get(key)
+        company_grams, position_grams, bands = entry[:3] if entry else self._signature(key)
+        role = _role_words(key[1])
+        candidates = set()
+        for band in bands:
+            candidates |= self._buckets.get(band, set())
+        
+        scored = []
+        for candidate in candidates:
+            other_company, other_position, _, rows = self._entries[candidate]
+            position_similarity = _jaccard(position_grams, other_position)
+            if position_similarity < DUPLICATE_POSITION_SIMILARITY:
+                continue
+            if not _same_role(role, _role_words(candidate[1])):
+                continue
+            company_similarity = _company_similarity(key[0], company_grams, candidate[0], other_company)
+            if company_similarity < DUPLICATE_COMPANY_SIMILARITY:
+                continue
+            similarity = round((company_similarity + position_similarity) / 2, 3)
+            scored.extend((-similarity, row) for row in rows)
+        return [(row, -negated) for negated, row in heapq.nsmallest(limit, scored)]
+
+
+class ApplicationIndex:
+    """
+    In-memory indexes over parsed tracker rows.
+    
+    - hash indexes on normalized status, company and referral source
+    - a sorted (date, row) index on Date Applied for range queries
+    - the set of rows that count as applied
+    - PipelineStats aggregates, kept in step with the rows
+    - a DuplicateIndex on company/position, built on first use
+    
+    Lookups are hash hits and a bisect, and filters are combined by
+    intersecting from the smallest candidate set, so a query costs about the
+    size of its answer rather than the size of the sheet. upsert/remove keep
+    everything current as single rows change.
+    """
+    
+    def __init__(self, is_applied):
+        self._is_applied = is_applied
+        self.applications = {}  # row -> Application
+        self.by_status = {}
+        self.by_company = {}
+        self.by_referral = {}
+        self.by_date = []  # sorted (date ordinal, row)
+        self.applied = set()
+        self.stats = PipelineStats()
+        self._duplicates = None
+    
+    @property
+    def duplicates(self) -> DuplicateIndex:
+        """Near-duplicate index over company/position (built on first use, then kept current)"""
+        if self._duplicates is None:
+            duplicates = DuplicateIndex()
+            for app in self.applications.values():
+                duplicates.add(app.row, app.company, app.position)
+            self._duplicates = duplicates
+        return self._duplicates
+    
+    def likely_duplicates(self, company: str, position: str, limit: int = DUPLICATE_MAX_MATCHES) -> list:
+        """[(Application, similarity)] already tracked that look like the same role, best first"""
+        return [(self.applications[row], similarity)
+                for row, similarity in self.duplicates.matches(company, position, limit)]
+    
+    @staticmethod
+    def _add(index: dict, key: str, row: int):
+        index.setdefault(key, set()).add(row)
+    
+    @staticmethod
+    def _discard(index: dict, key: str, row: int):
+        rows = index.get(key)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del index[key]
+    
+    def upsert(self, app):
+        """Add an application, replacing whatever was indexed for its row"""
+        row = app.row
+        self.remove(row)
+        self.applications[row] = app
+        self._add(self.by_status, _normalize_key(app.status), row)
+        self._add(self.by_company, _normalize_key(app.company), row)
+        self._add(self.by_referral, _normalize_key(app.referral_source), row)
+        date = _parse_sheet_date(app.date_applied)
+        if date is not None:
+            bisect.insort(self.by_date, (date.toordinal(), row))
+        applied = self._is_applied(app.status)
+        if applied:
+            self.applied.add(row)
+        self.stats.add(app, applied, date)
+        if self._duplicates is not None:
+            self._duplicates.add(row, app.company, app.position)
+    
+    def load(self, applications):
+        """
+        Bulk-build a fresh index from a parsed snapshot.
+        
+        Same result as upserting each application, but the date index is
+        sorted once instead of insort-ed row by row.
+        """
+        dated = []
+        stats = self.stats
+        for app in applications:
+            row = app.row
+            self.applications[row] = app
+            self._add(self.by_status, _normalize_key(app.status), row)
+            self._add(self.by_company, _normalize_key(app.company), row)
+            self._add(self.by_referral, _normalize_key(app.referral_source), row)
+            date = _parse_sheet_date(app.date_applied)
+            if date is not None:
+                dated.append((date.toordinal(), row))
+            applied = self._is_applied(app.status)
+            if applied:
+                self.applied.add(row)
+            stats.add(app, applied, date)
+        dated.sort()
+        self.by_date = dated
+    
+    def remove(self, row: int):
+        """Drop a row from every index (no-op if it isn't indexed)"""
+        app = self.applications.pop(row, None)
+        if app is None:
+            return
+        self._discard(self.by_status, _normalize_key(app.status), row)
+        self._discard(self.by_company, _normalize_key(app.company), row)
+        self._discard(self.by_referral, _normalize_key(app.referral_source), row)
+        date = _parse_sheet_date(app.date_applied)
+        if date is not None:
+            i = bisect.bisect_left(self.by_date, (date.toordinal(), row))
+            if i < len(self.by_date) and self.by_date[i] == (date.toordinal(), row):
+                del self.by_date[i]
+        self.stats.remove(app, row in self.applied, date)
+        self.applied.discard(row)
+        if self._duplicates is not None:
+            self._duplicates.remove(row)
+    
+    def _date_range(self, since: Optional[datetime], before: Optional[datetime]) -> set:
+        lo = bisect.bisect_left(self.by_date, (since.toordinal(), 0)) if since else 0
+        hi = bisect.bisect_left(self.by_date, (before.toordinal(), 0)) if before else len(self.by_date)
+        return {row for _, row in self.by_date[lo:hi]}
+    
+    def query(self, statuses: Optional[list] = None, companies: Optional[list] = None,
+              referral_sources: Optional[list] = None, applied_since: Optional[datetime] = None,
+              applied_before: Optional[datetime] = None, applied_only: bool = False) -> list:
+        """
+        Applications matching every given filter (any value within a filter), in row order.
+        
+        applied_since is inclusive and applied_before exclusive; rows without a
+        parseable date never match a date filter.
+        """
+        candidates = []
+        for index, values in ((self.by_status, statuses), (self.by_company, companies),
+                              (self.by_referral, referral_sources)):
+            if values:
+                matched = set()
+                for value in values:
+                    matched |= index.get(_normalize_key(value), set())
+                candidates.append(matched)
+        if applied_since is not None or applied_before is not None:
+            candidates.append(self._date_range(applied_since, applied_before))
+        if applied_only:
+            candidates.append(self.applied)
+        
+        if not candidates:
+            rows = self.applications.keys()
+        else:
+            candidates.sort(key=len)
+            rows = set(candidates[0])
+            for other in candidates[1:]:
+                if not rows:
+                    break
+                rows &= other
+        return [self.applications[row] for row in sorted(rows)]
+
+
+def _http_status(error: Exception) -> Optional[int]:
+    """HTTP status of a googleapiclient HttpError (None for anything else)"""
+    return getattr(getattr(error, 'resp', None), 'status', None)
+
+
+def _error_reasons(error: Exception) -> set:
+    """Google's error reasons on an HttpError, lowercased ('ratelimitexceeded', ...)"""
+    reasons = set()
+    details = getattr(error, 'error_details', None)
+    if isinstance(details, list):
+        reasons.update(str(d.get('reason', '')) for d in details if isinstance(d, dict))
+    content = getattr(error, 'content', None)
+    if content:
+        try:
+            payload = json.loads(content.decode('utf-8') if isinstance(content, bytes) else content)
+            reasons.update(str(e.get('reason', '')) for e in payload['error'].get('errors', []))
+            reasons.update(str(d.get('reason', '')) for d in payload['error'].get('details', []))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            pass
+    return {reason.lower().replace('_', '') for reason in reasons if reason}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Whether a failed Google API request may succeed if sent again: rate
+    limits (429, or 403 with a rate limit reason) and server errors (5xx).
+    Other 403s are permission problems and fail the same way every time.
+    """
+    status = _http_status(error)
+    if status == 429 or (status or 0) >= 500:
+        return True
+    return status == 403 and bool(_error_reasons(error) & RETRYABLE_403_REASONS)
+
+
+def _interview_event(company: str, position: str, interview_date: str,
+                     interview_time: str, duration_minutes: int = 60, notes: str = "",
+                     time_zone: str = TIMEZONE) -> dict:
+    """Calendar event body for an interview; raises ValueError on a bad date/time"""
+    start_datetime = datetime.strptime(f"{interview_date} {interview_time}", "%Y-%m-%d %H:%M")
+    end_datetime = start_datetime + timedelta(minutes=duration_minutes)
+    return {
+        'summary': f'Interview: {position} at {company}',
+        'description': f'Position: {position}\nCompany: {company}\n\n{notes}',
+        'start': {
+            'dateTime': start_datetime.isoformat(),
+            'timeZone': time_zone,
+        },
+        'end': {
+            'dateTime': end_datetime.isoformat(),
+            'timeZone': time_zone,
+        },
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': 24 * 60},  # 1 day before
+                {'method': 'popup', 'minutes': 60},        # 1 hour before
+            ],
+        },
+    }
+
+
+def _interview_event_id(event: dict) -> str:
+    """
+    Client-supplied Calendar id for an interview event, derived from its title
+    and times so the same interview always gets the same id (hex digits are
+    valid in Calendar's base32hex ids)
+    """
+    key = '\x1f'.join((event['summary'], event['start']['dateTime'], event['end']['dateTime']))
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _event_timestamp(when: dict) -> Optional[float]:
+    """POSIX timestamp of a Calendar start/end ({'dateTime': ...} or all-day {'date': ...})"""
+    value = when.get('dateTime') or when.get('date')
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=ZoneInfo(when['timeZone']) if when.get('timeZone') else timezone.utc)
+    return parsed.timestamp()
+
+
+def _local_timestamp(date_str: str, time_str: str = '00:00', time_zone: str = TIMEZONE) -> float:
+    """POSIX timestamp of a YYYY-MM-DD HH:MM wall-clock time in time_zone"""
+    local = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+    return local.replace(tzinfo=ZoneInfo(time_zone)).timestamp()
+
+
+def _format_timestamp(timestamp: float, time_zone: str = TIMEZONE) -> str:
+    return datetime.fromtimestamp(timestamp, ZoneInfo(time_zone)).isoformat()
+
+
+class BusyIntervals:
+    """
+    Busy blocks for a time window, from one freebusy query.
+    
+    Blocks are merged on insert into disjoint intervals kept in two sorted
+    lists (starts and ends), so whether a slot overlaps anything is a single
+    bisect: O(log n) per candidate slot, however many slots are checked.
+    """
+    
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.window = None  # (start, end) timestamps the blocks are complete for
+        self.fetched_at = None
+    
+    def covers(self, start: float, end: float, ttl_seconds: float) -> bool:
+        """Whether [start, end) lies inside a window fetched less than ttl_seconds ago"""
+        return (self.window is not None and self.window[0] <= start and end <= self.window[1]
+                and time.monotonic() - self.fetched_at < ttl_seconds)
+    
+    def replace(self, window_start: float, window_end: float, blocks):
+        """Replace everything with freshly fetched (start, end) blocks for a window"""
+        self.starts, self.ends = [], []
+        for start, end in sorted(blocks):
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+        self.window = (window_start, window_end)
+        self.fetched_at = time.monotonic()
+    
+    def add(self, start: float, end: float):
+        """Mark [start, end) busy, merging with any blocks it touches"""
+        lo = bisect.bisect_left(self.ends, start)
+        hi = bisect.bisect_right(self.starts, end)
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+    
+    def conflicts(self, start: float, end: float) -> list:
+        """Busy blocks overlapping [start, end)"""
+        lo = bisect.bisect_right(self.ends, start)
+        hi = bisect.bisect_left(self.starts, end)
+        return list(zip(self.starts[lo:hi], self.ends[lo:hi]))
+    
+    def is_free(self, start: float, end: float) -> bool:
+        i = bisect.bisect_right(self.ends, start)
+        return i == len(self.starts) or self.starts[i] >= end
+    
+    def copy(self) -> 'BusyIntervals':
+        other = BusyIntervals()
+        other.starts, other.ends = list(self.starts), list(self.ends)
+        other.window, other.fetched_at = self.window, self.fetched_at
+        return other
+
+
+class CalendarEventCache:
+    """
+    Local copy of the calendar's interview events, kept current with syncToken.
+    
+    A full sync pages through events().list and ends with a nextSyncToken;
+    later syncs pass that token and get back only events created, changed or
+    cancelled since. Calendar doesn't allow q/timeMin/orderBy alongside a
+    sync token, so the interview filter and the time window are applied here:
+    only matching events are kept, in a (start, id) list sorted for bisect.
+    """
+    
+    def __init__(self, keyword: str = 'interview'):
+        self.keyword = keyword.lower()
+        self.events = {}  # event id -> event
+        self._by_start = []  # sorted (start timestamp, event id)
+        self.sync_token = None
+        self.synced_at = None  # time.monotonic() of the last completed sync
+        self.full_syncs = 0
+        self.incremental_syncs = 0
+    
+    def reset(self):
+        """Forget everything (before a full sync)"""
+        self.events.clear()
+        self._by_start.clear()
+        self.sync_token = None
+        self.synced_at = None
+    
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return self.synced_at is not None and time.monotonic() - self.synced_at < ttl_seconds
+    
+    def _matches(self, event: dict) -> bool:
+        text = ' '.join(event.get(key) or '' for key in ('summary', 'description', 'location'))
+        return self.keyword in text.lower()
+    
+    def _discard(self, event_id: str):
+        old = self.events.pop(event_id, None)
+        if old is None:
+            return
+        key = (_event_timestamp(old['start']), event_id)
+        i = bisect.bisect_left(self._by_start, key)
+        if i < len(self._by_start) and self._by_start[i] == key:
+            del self._by_start[i]
+    
+    def apply(self, event: dict):
+        """Apply one event from a sync page or a write (cancelled events are removed)"""
+        event_id = event.get('id')
+        if not event_id:
+            return
+        self._discard(event_id)
+        if event.get('status') == 'cancelled' or not self._matches(event):
+            return
+        start = _event_timestamp(event.get('start', {}))
+        if start is None:
+            return
+        self.events[event_id] = event
+        bisect.insort(self._by_start, (start, event_id))
+    
+    def between(self, start: float, end: float) -> list:
+        """Cached events starting in [start, end), ordered by start time"""
+        lo = bisect.bisect_left(self._by_start, (start, ''))
+        hi = bisect.bisect_left(self._by_start, (end, ''))
+        return [self.events[event_id] for _, event_id in self._by_start[lo:hi]]
+    
+    def stats(self) -> dict:
+        return {
+            'cached_events': len(self.events),
+            'full_syncs': self.full_syncs,
+            'incremental_syncs': self.incremental_syncs
+        }
+
+
+def _study_budget_minutes(daily_hours, day) -> int:
+    """Study minutes available on a date given a number or a {date/weekday/'default': hours} dict"""
+    if isinstance(daily_hours, dict):
+        for key in (day.isoformat(), day.strftime('%a').lower(), day.strftime('%A').lower()):
+            if key in daily_hours:
+                return int(float(daily_hours[key]) * 60)
+        return int(float(daily_hours.get('default', STUDY_DAILY_HOURS)) * 60)
+    return int(float(STUDY_DAILY_HOURS if daily_hours is None else daily_hours) * 60)
+
+
+def _study_topics(interview: dict) -> list:
+    """(topic, weight, minutes) for an interview's topics (strings or {topic, weight, hours})"""
+    interview_weight = float(interview.get('weight') or 1)
+    topics = []
+    for topic in interview.get('topics') or []:
+        if isinstance(topic, dict):
+            name = topic.get('topic') or topic.get('name')
+            weight = float(topic.get('weight') or 1) * interview_weight
+            hours = topic.get('hours')
+        else:
+            name, weight, hours = topic, interview_weight, None
+        if not name:
+            raise ValueError(f"topic without a name in {interview.get('label') or interview.get('company')!r}")
+        minutes = int(float(hours) * 60) if hours is not None else int(weight * STUDY_TOPIC_HOURS * 60)
+        topics.append((name, weight, max(1, minutes)))
+    return topics
+
+
+def plan_study(interviews: list, daily_hours=None, start_date: Optional[str] = None,
+               session_minutes: int = STUDY_SESSION_MINUTES,
+               review_minutes: int = STUDY_REVIEW_MINUTES) -> dict:
+    """
+    Plan study across several interviews at once, with spaced repetition.
+    
+    Each topic's study time (weight x STUDY_TOPIC_HOURS unless hours is
+    given) is laid out in sessions before its interview, most urgent and
+    most important first. Reviews go STUDY_REVIEW_OFFSETS days after a topic
+    is done (and on the eve of the interview) in the time study left free,
+    nearest interview first. Work that can't fit is reported as unscheduled.
+    
+    Args:
+        interviews: [{label (or company/position), date: YYYY-MM-DD,
+            topics, weight}]
+        daily_hours: Hours per day, or a dict keyed by date, weekday ('mon',
+            'monday') or 'default'
+        start_date: First study day (YYYY-MM-DD, default today)
+        session_minutes: Length of a study session
+        review_minutes: Length of a review
+    
+    Returns:
+        dict with the day-by-day plan and a per-interview summary
+    """
+    if isinstance(daily_hours, dict):
+        daily_hours = {str(k).lower(): v for k, v in daily_hours.items()}
+    start = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else datetime.now().date()
+    first_day = start.toordinal()
+    session_minutes = max(1, int(session_minutes))
+    review_minutes = max(1, int(review_minutes))
+    
+    topics = []  # topic id -> [interview index, name, weight, minutes left, deadline]
+    summaries = []
+    ready = []  # (deadline, -weight, seq, topic id)
+    for i, interview in enumerate(interviews):
+        label = interview.get('label') or ' - '.join(
+            part for part in (interview.get('company'), interview.get('position')) if part) or f"Interview {i + 1}"
+        interview_day = datetime.strptime(interview['date'], "%Y-%m-%d").date().toordinal()
+        deadline = interview_day - 1 if interview_day > first_day else interview_day
+        summaries.append({'label': label, 'date': interview['date'], 'required_hours': 0,
+                          'planned_hours': 0, 'reviews_planned': 0, 'reviews_skipped': 0,
+                          'unscheduled': []})
+        for name, weight, minutes in _study_topics(interview):
+            summaries[i]['required_hours'] += minutes / 60
+            topics.append([i, name, weight, minutes, deadline])
+            ready.append((deadline, -weight, len(topics) - 1, len(topics) - 1))
+    heapq.heapify(ready)
+    
+    plan = {}  # day ordinal -> {(topic id, kind): minutes}
+    free = {}  # day ordinal -> minutes of budget left after study
+    reviews = []  # (deadline, review day, -weight, seq, topic id)
+    
+    def book(day, topic_id, kind, minutes):
+        day_plan = plan.setdefault(day, {})
+        day_plan[(topic_id, kind)] = day_plan.get((topic_id, kind), 0) + minutes
+        free[day] -= minutes
+    
+    # Pass 1: first-pass study, earliest deadline first
+    last_day = max((topic[4] for topic in topics), default=first_day - 1)
+    for day in range(first_day, last_day + 1):
+        free[day] = _study_budget_minutes(daily_hours, datetime.fromordinal(day).date())
+        sessions_today = {}
+        deferred = []
+        while ready and free[day] > 0:
+            entry = heapq.heappop(ready)
+            deadline, _, _, topic_id = entry
+            topic = topics[topic_id]
+            if deadline < day:
+                summaries[topic[0]]['unscheduled'].append({'topic': topic[1], 'hours': round(topic[3] / 60, 2)})
+                continue
+            minutes = min(session_minutes, topic[3])
+            if minutes > free[day] or sessions_today.get(topic_id, 0) >= STUDY_MAX_SESSIONS_PER_TOPIC_PER_DAY:
+                deferred.append(entry)
+                continue
+            book(day, topic_id, 'study', minutes)
+            sessions_today[topic_id] = sessions_today.get(topic_id, 0) + 1
+            summaries[topic[0]]['planned_hours'] += minutes / 60
+            topic[3] -= minutes
+            if topic[3] > 0:
+                heapq.heappush(ready, entry)
+                continue
+            review_days = [day + offset for offset in STUDY_REVIEW_OFFSETS if day + offset <= topic[4]]
+            if topic[4] > day and topic[4] not in review_days:
+                review_days.append(topic[4])
+            for review_day in review_days:
+                reviews.append((topic[4], review_day, entry[1], len(reviews), topic_id))
+        for entry in deferred:
+            heapq.heappush(ready, entry)
+    for _, _, _, topic_id in ready:
+        topic = topics[topic_id]
+        summaries[topic[0]]['unscheduled'].append({'topic': topic[1], 'hours': round(topic[3] / 60, 2)})
+    
+    # Pass 2: reviews into the time study left free, on their day or the day after.
+    # The nearest interview's reviews claim that time first; a later one's can wait.
+    heapq.heapify(reviews)
+    while reviews:
+        _, review_day, _, _, topic_id = heapq.heappop(reviews)
+        topic = topics[topic_id]
+        for day in range(review_day, min(review_day + 1, topic[4]) + 1):
+            if free.get(day, 0) >= review_minutes:
+                book(day, topic_id, 'review', review_minutes)
+                summaries[topic[0]]['reviews_planned'] += 1
+                break
+        else:
+            summaries[topic[0]]['reviews_skipped'] += 1
+    
+    days = []
+    for day in sorted(plan):
+        sessions = [{'interview': summaries[topics[topic_id][0]]['label'], 'topic': topics[topic_id][1],
+                     'kind': kind, 'minutes': minutes}
+                    for (topic_id, kind), minutes in plan[day].items()]
+        days.append({'date': datetime.fromordinal(day).strftime("%Y-%m-%d"),
+                     'hours': round(sum(session['minutes'] for session in sessions) / 60, 2),
+                     'sessions': sessions})
+    for summary in summaries:
+        summary['required_hours'] = round(summary['required_hours'], 2)
+        summary['planned_hours'] = round(summary['planned_hours'], 2)
+    return {'start_date': start.isoformat(), 'days': days, 'interviews': summaries}
+
+
+def _parse_a1_range(a1_range: str) -> tuple:
+    """
+    (first_row, first_col, last_row, last_col) of a tracker A1 range; rows and
+    columns are 1-based and 0-based respectively, and open ends are None.
+    """
+    match = re.search(r'!([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$', a1_range or '')
+    if match is None:
+        raise ValueError(f"Unsupported range: {a1_range!r}")
+    first_col, first_row, last_col, last_row = match.groups()
+    return (int(first_row) if first_row else DATA_START_ROW, _column_index(first_col),
+            int(last_row) if last_row else (None if last_col else int(first_row or DATA_START_ROW)),
+            _column_index(last_col) if last_col else _column_index(first_col))
+
+
+def _filled_row_count(rows: list) -> int:
+    """Rows up to and including the last one with any content"""
+    count = len(rows)
+    while count and not any(rows[count - 1]):
+        count -= 1
+    return count
+
+
+def _put_cells(rows: list, row_num: int, col: int, values: list):
+    """Write a 2D block of values into sheet rows (index 0 = DATA_START_ROW), growing as needed"""
+    for i, row_values in enumerate(values):
+        offset = row_num - DATA_START_ROW + i
+        while len(rows) <= offset:
+            rows.append([])
+        row = rows[offset]
+        while len(row) < col + len(row_values):
+            row.append('')
+        row[col:col + len(row_values)] = list(row_values)
+
+
+def _cell_texts(values: list) -> list:
+    """A 2D block of written values as a USER_ENTERED echo returns them: every cell as text"""
+    return [['' if value is None else str(value) for value in row] for row in values]
+
+
+def _get_cells(rows: list, row_num: int, col: int, width: int) -> list:
+    offset = row_num - DATA_START_ROW
+    row = rows[offset] if 0 <= offset < len(rows) else []
+    return [row[c] if c < len(row) else '' for c in range(col, col + width)]
+
+
+class TrackerMirror:
+    """
+    Offline-first SQLite copy of the tracker.
+    
+    Stores the last snapshot pulled from Sheets (base) and an outbox of local
+    writes not yet pushed. Reads see the base with pending writes replayed on
+    top (the view), so they never wait on the network and keep working
+    offline. `service` mimics the slice of the Sheets values() API the coach
+    uses, so every read and write path runs unchanged against the mirror;
+    InternshipCoach._sync_mirror pushes the outbox and pulls fresh data.
+    
+    Appended rows get a provisional row number until they are pushed (the
+    sheet may have grown meanwhile); edits to such rows follow them. Cells
+    are stored as text, as Sheets would echo them, so a number a client
+    wrote reads back the same whether or not it has been synced.
+    """
+    
+    def __init__(self, path: str = MIRROR_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS base (row INTEGER PRIMARY KEY, cells TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,            -- 'append' or 'update'
+                    row INTEGER,                   -- target row (provisional for appends)
+                    col INTEGER,
+                    cells TEXT NOT NULL,           -- JSON: rows for an append, one row for an update
+                    base_cells TEXT,               -- JSON: what the edited cells held when edited
+                    append_ref INTEGER,            -- update of a row appended by this outbox op
+                    ref_offset INTEGER,
+                    status TEXT NOT NULL DEFAULT 'pending',  -- 'pending' or 'conflict'
+                    remote_cells TEXT,             -- JSON: what the sheet held when a conflict was found
+                    created_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            """)
+        self.base = []
+        for row_num, cells in self._db.execute("SELECT row, cells FROM base ORDER BY row"):
+            while len(self.base) < row_num - DATA_START_ROW:
+                self.base.append([])
+            self.base.append(json.loads(cells))
+        pulled = self._db.execute("SELECT value FROM meta WHERE key = 'pulled_at'").fetchone()
+        self.pulled_at = float(pulled[0]) if pulled else None
+        self.last_error = None
+        self.on_write = None  # Called (from any thread) after every local write
+        self.view = []
+        self._provisional = {}  # view row -> (append op id, offset)
+        self.service = LocalSheetsService(self)
+        self.replay()
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
+    
+    @property
+    def has_snapshot(self) -> bool:
+        return self.pulled_at is not None
+    
+    def _ops(self, status: str = 'pending') -> list:
+        cursor = self._db.execute(
+            "SELECT id, kind, row, col, cells, base_cells, append_ref, ref_offset, remote_cells, created_at "
+            "FROM outbox WHERE status = ? ORDER BY id", (status,))
+        return [{
+            'id': op_id, 'kind': kind, 'row': row, 'col': col, 'cells': json.loads(cells),
+            'base_cells': json.loads(base_cells) if base_cells else None,
+            'append_ref': append_ref, 'ref_offset': ref_offset,
+            'remote_cells': json.loads(remote_cells) if remote_cells else None,
+            'created_at': created_at
+        } for op_id, kind, row, col, cells, base_cells, append_ref, ref_offset, remote_cells, created_at in cursor]
+    
+    def pending_ops(self) -> list:
+        with self._lock:
+            return self._ops('pending')
+    
+    def conflicts(self) -> list:
+        with self._lock:
+            return self._ops('conflict')
+    
+    def replay(self):
+        """Rebuild the view: base plus pending writes, appends placed after the last filled row"""
+        with self._lock:
+            view = [list(row) for row in self.base]
+            provisional = {}
+            appended_at = {}
+            for op in self._ops('pending'):
+                if op['kind'] == 'append':
+                    first_row = DATA_START_ROW + _filled_row_count(view)
+                    _put_cells(view, first_row, 0, op['cells'])
+                    appended_at[op['id']] = first_row
+                    for offset in range(len(op['cells'])):
+                        provisional[first_row + offset] = (op['id'], offset)
+                    continue
+                row = op['row']
+                if op['append_ref'] is not None:
+                    if op['append_ref'] not in appended_at:
+                        continue
+                    row = appended_at[op['append_ref']] + op['ref_offset']
+                _put_cells(view, row, op['col'], [op['cells']])
+            self.view = view
+            self._provisional = provisional
+    
+    def _notify(self):
+        if self.on_write is not None:
+            self.on_write()
+    
+    def read(self, first_row: int, last_row: Optional[int]) -> list:
+        """View rows first_row..last_row (inclusive; None = to the end), trailing blanks trimmed"""
+        with self._lock:
+            rows = self.view[first_row - DATA_START_ROW:None if last_row is None else last_row - DATA_START_ROW + 1]
+            return [list(row) for row in rows[:_filled_row_count(rows)]]
+    
+    def append(self, values: list) -> int:
+        """Commit an append locally; returns the (provisional) first row"""
+        with self._lock:
+            values = _cell_texts(values)
+            first_row = DATA_START_ROW + _filled_row_count(self.view)
+            with self._db:
+                cursor = self._db.execute(
+                    "INSERT INTO outbox (kind, row, col, cells, created_at) VALUES ('append', ?, 0, ?, ?)",
+                    (first_row, json.dumps(values), time.time()))
+            _put_cells(self.view, first_row, 0, values)
+            for offset in range(len(values)):
+                self._provisional[first_row + offset] = (cursor.lastrowid, offset)
+        self._notify()
+        return first_row
+    
+    def update(self, first_row: int, col: int, values: list):
+        """Commit a block edit locally, one outbox op per row"""
+        values = _cell_texts(values)
+        with self._lock:
+            with self._db:
+                for i, row_values in enumerate(values):
+                    row_num = first_row + i
+                    append_ref, ref_offset = self._provisional.get(row_num, (None, None))
+                    self._db.execute(
+                        "INSERT INTO outbox (kind, row, col, cells, base_cells, append_ref, ref_offset, created_at) "
+                        "VALUES ('update', ?, ?, ?, ?, ?, ?, ?)",
+                        (row_num, col, json.dumps(list(row_values)),
+                         json.dumps(_get_cells(self.view, row_num, col, len(row_values))),
+                         append_ref, ref_offset, time.time()))
+            _put_cells(self.view, first_row, col, values)
+        self._notify()
+    
+    def complete(self, op_ids: list, appended_at: Optional[dict] = None):
+        """
+        Drop pushed ops in one transaction.
+        
+        Args:
+            op_ids: Outbox ids that reached the sheet
+            appended_at: append op id -> first row it landed on; edits that
+                referred to those rows (and are still queued) are pinned there
+        """
+        with self._lock, self._db:
+            for op_id, first_row in (appended_at or {}).items():
+                self._db.execute(
+                    "UPDATE outbox SET row = ? + ref_offset, append_ref = NULL, ref_offset = NULL "
+                    "WHERE append_ref = ?", (first_row, op_id))
+            self._db.executemany("DELETE FROM outbox WHERE id = ?", [(op_id,) for op_id in op_ids])
+    
+    def append_in_flight(self) -> Optional[dict]:
+        """The last append sent to the remote without a confirmed result, if any (see set_append_in_flight)"""
+        with self._lock:
+            found = self._db.execute("SELECT value FROM meta WHERE key = 'append_in_flight'").fetchone()
+            return json.loads(found[0]) if found else None
+    
+    def set_append_in_flight(self, record: Optional[dict]):
+        """
+        Remember an append before it's sent (None once its outcome is known),
+        so a sync that loses the response can check the sheet for the rows
+        instead of sending them again.
+        
+        Args:
+            record: {'after': filled remote rows before the append, 'rows':
+                the appended values, 'ops': outbox ids it carries, 'offsets':
+                append op id -> offset of its first row}
+        """
+        with self._lock, self._db:
+            if record is None:
+                self._db.execute("DELETE FROM meta WHERE key = 'append_in_flight'")
+            else:
+                self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('append_in_flight', ?)",
+                                 (json.dumps(record),))
+    
+    def mark_conflict(self, op_id: int, remote_cells: list):
+        with self._lock, self._db:
+            self._db.execute("UPDATE outbox SET status = 'conflict', remote_cells = ? WHERE id = ?",
+                             (json.dumps(remote_cells), op_id))
+    
+    def resolve_conflicts(self, keep: str) -> int:
+        """Settle every conflict: 'local' re-queues our edits over the sheet's values, 'remote' drops them"""
+        if keep not in ('local', 'remote'):
+            raise ValueError("keep must be 'local' or 'remote'")
+        with self._lock, self._db:
+            if keep == 'remote':
+                cursor = self._db.execute("DELETE FROM outbox WHERE status = 'conflict'")
+            else:
+                cursor = self._db.execute(
+                    "UPDATE outbox SET status = 'pending', base_cells = remote_cells, remote_cells = NULL "
+                    "WHERE status = 'conflict'")
+            resolved = cursor.rowcount
+        self.replay()
+        return resolved
+    
+    def replace_base(self, rows: list) -> bool:
+        """Store a freshly pulled snapshot and rebuild the view; returns whether the view changed"""
+        with self._lock:
+            rows = [list(row) for row in rows[:_filled_row_count(rows)]]
+            with self._db:
+                changed = [(DATA_START_ROW + i, json.dumps(row)) for i, row in enumerate(rows)
+                           if i >= len(self.base) or self.base[i] != row]
+                self._db.executemany("INSERT OR REPLACE INTO base (row, cells) VALUES (?, ?)", changed)
+                self._db.execute("DELETE FROM base WHERE row >= ?", (DATA_START_ROW + len(rows),))
+                self.pulled_at = time.time()
+                self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('pulled_at', ?)",
+                                 (str(self.pulled_at),))
+            self.base = rows
+            before = self.view
+            self.replay()
+            return self.view != before
+    
+    def status(self) -> dict:
+        with self._lock:
+            pending = self._db.execute("SELECT COUNT(*) FROM outbox WHERE status = 'pending'").fetchone()[0]
+            conflicts = self._ops('conflict')
+        return {
+            'last_synced': datetime.fromtimestamp(self.pulled_at).isoformat(timespec='seconds') if self.pulled_at else None,
+            'pending_writes': pending,
+            'conflicts': [{
+                'id': op['id'],
+                'row': op['row'],
+                'range': f"{_column_letter(op['col'])}{op['row']}:{_column_letter(op['col'] + len(op['cells']) - 1)}{op['row']}",
+                'local': op['cells'],
+                'sheet': op['remote_cells'],
+                'was': op['base_cells']
+            } for op in conflicts],
+            'last_error': self.last_error
+        }
+
+
+class _LocalRequest:
+    """A deferred call with the execute() signature of a googleapiclient request"""
+    
+    def __init__(self, fn):
+        self._fn = fn
+    
+    def execute(self, http=None, num_retries=0):
+        return self._fn()
+
+
+class LocalSheetsService:
+    """spreadsheets().values() get/append/update/batchUpdate answered from a TrackerMirror"""
+    
+    def __init__(self, mirror: TrackerMirror):
+        self.mirror = mirror
+    
+    def spreadsheets(self):
+        return self
+    
+    def values(self):
+        return self
+    
+    def get(self, spreadsheetId: str, range: str, **kwargs):
+        def run():
+            first_row, _, last_row, _ = _parse_a1_range(range)
+            return {'range': range, 'majorDimension': 'ROWS', 'values': self.mirror.read(first_row, last_row)}
+        return _LocalRequest(run)
+    
+    def append(self, spreadsheetId: str, range: str, body: dict, **kwargs):
+        def run():
+            values = _cell_texts(body['values'])
+            first_row = self.mirror.append(values)
+            updated_range = f"{SHEET_NAME}!A{first_row}:{_column_letter(max(len(r) for r in values) - 1)}{first_row + len(values) - 1}"
+            return {'updates': {'updatedRange': updated_range, 'updatedRows': len(values),
+                                'updatedData': {'range': updated_range, 'values': values}}}
+        return _LocalRequest(run)
+    
+    def _update(self, range_name: str, values: list) -> dict:
+        values = _cell_texts(values)
+        first_row, first_col, _, _ = _parse_a1_range(range_name)
+        self.mirror.update(first_row, first_col, values)
+        return {'updatedRange': range_name, 'updatedCells': sum(len(r) for r in values),
+                'updatedData': {'range': range_name, 'values': values}}
+    
+    def update(self, spreadsheetId: str, range: str, body: dict, **kwargs):
+        return _LocalRequest(lambda: self._update(range, body['values']))
+    
+    def batchUpdate(self, spreadsheetId: str, body: dict):
+        def run():
+            responses = [self._update(d['range'], d['values']) for d in body['data']]
+            return {'responses': responses, 'totalUpdatedCells': sum(r['updatedCells'] for r in responses)}
+        return _LocalRequest(run)
+
+
+class GoogleSheetsRemote:
+    """The tracker in Google Sheets, as the mirror's sync target"""
+    
+    def __init__(self, coach):
+        self.coach = coach
+    
+    def available(self) -> bool:
+        """Whether syncing can run without prompting for a Google sign-in"""
+        return self.coach.creds is not None or self.coach._sheets_service is not None or os.path.exists(TOKEN_PATH)
+    
+    async def fetch_rows(self) -> list:
+        result = await self.coach._execute(
+            lambda: self.coach.google_sheets_service.spreadsheets().values().get(
+                spreadsheetId=SPREADSHEET_ID,
+                range=TRACKER_RANGE
+            ),
+            api='sheets', coalesce_key=('values.get', SPREADSHEET_ID, TRACKER_RANGE), idempotent=True
+        )
+        return result.get('values', [])
+    
+    async def append_rows(self, values: list) -> int:
+        result = await self.coach._execute(
+            lambda: self.coach.google_sheets_service.spreadsheets().values().append(
+                spreadsheetId=SPREADSHEET_ID,
+                range=TRACKER_RANGE,
+                valueInputOption='USER_ENTERED',
+                insertDataOption='INSERT_ROWS',
+                body={'values': values}
+            ),
+            api='sheets'
+        )
+        first_row = _first_row_of_range(result.get('updates', {}).get('updatedRange', ''))
+        if first_row is None:
+            raise RuntimeError("Sheets didn't report where the rows were appended")
+        return first_row
+    
+    async def update_blocks(self, blocks: list):
+        """Write (row, col, values) blocks with one values.batchUpdate"""
+        data = [{
+            'range': (f"{SHEET_NAME}!{_column_letter(col)}{row}:"
+                      f"{_column_letter(col + len(values[0]) - 1)}{row + len(values) - 1}"),
+            'values': values
+        } for row, col, values in blocks]
+        await self.coach._execute(
+            lambda: self.coach.google_sheets_service.spreadsheets().values().batchUpdate(
+                spreadsheetId=SPREADSHEET_ID,
+                body={'valueInputOption': 'USER_ENTERED', 'data': data}
+            ),
+            api='sheets', idempotent=True
+        )
+
+
+class InMemorySheetsRemote:
+    """
+    A tracker held in memory with the same interface as GoogleSheetsRemote,
+    for running the mirror's sync without Google. Set online = False to
+    simulate an outage.
+    """
+    
+    def __init__(self, rows: Optional[list] = None):
+        self.rows = [list(row) for row in rows or []]
+        self.online = True
+        self.calls = 0
+    
+    def available(self) -> bool:
+        return True
+    
+    def _call(self):
+        self.calls += 1
+        if not self.online:
+            raise ConnectionError("Sheets is unreachable")
+    
+    async def fetch_rows(self) -> list:
+        self._call()
+        return [list(row) for row in self.rows[:_filled_row_count(self.rows)]]
+    
+    async def append_rows(self, values: list) -> int:
+        self._call()
+        first_row = DATA_START_ROW + _filled_row_count(self.rows)
+        _put_cells(self.rows, first_row, 0, values)
+        return first_row
+    
+    async def update_blocks(self, blocks: list):
+        self._call()
+        for row, col, values in blocks:
+            _put_cells(self.rows, row, col, values)
+
+
+class _TextRest(str):
+    """The rest of a response split as text, so its last piece still gets a note"""
+
+
+class ResponseEncoder:
+    """
+    Turns tool results into the text sent back to the client.
+    
+    JSON is written compactly (unless compact is off), with orjson when it's
+    installed. A response over max_bytes is cut at an item boundary of its
+    largest list (or as text, at a line or character boundary, when there's
+    no list to page through) and the rest is kept under a cursor;
+    get_more_results hands it out one capped chunk at a time.
+    """
+    
+    def __init__(self, compact: bool = RESPONSE_COMPACT, max_bytes: int = RESPONSE_MAX_BYTES,
+                 ttl_seconds: float = RESPONSE_CONTINUATION_TTL_SECONDS,
+                 max_pending: int = RESPONSE_CONTINUATIONS_MAX):
+        self.compact = compact
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_pending = max_pending
+        self._pending = {}  # cursor -> (expires at, rest of the result), oldest first
+    
+    def dumps(self, value) -> bytes:
+        """value as UTF-8 JSON"""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS if self.compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(value, option=option)
+            except TypeError:
+                pass  # e.g. an integer wider than 64 bits; the json module copes
+        if self.compact:
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    def encode(self, result) -> str:
+        """Text for a tool result, split with a continuation cursor if it's over max_bytes"""
+        if isinstance(result, str):
+            data = result.encode('utf-8')
+            if self.max_bytes and len(data) > self.max_bytes:
+                return self._split_text(result, data)
+            if isinstance(result, _TextRest):
+                return self._text_piece(result, None, 0)  # The last piece of split text
+            return result
+        if not isinstance(result, (dict, list)):
+            return str(result)
+        if self.max_bytes:
+            return self._encode_capped(result)
+        return self.dumps(result).decode('utf-8')
+    
+    def resume(self, cursor: str):
+        """The rest of a split response (which encode() will split again if it's still too big)"""
+        entry = self._pending.get(cursor)
+        if entry is None or entry[0] <= time.monotonic():
+            self._pending.pop(cursor, None)
+            raise ValueError("Unknown or expired cursor; run the original tool again")
+        return entry[1]
+    
+    def _remember(self, rest) -> str:
+        now = time.monotonic()
+        for cursor in [c for c, (expires, _) in self._pending.items() if expires <= now]:
+            del self._pending[cursor]
+        while len(self._pending) >= self.max_pending:
+            del self._pending[next(iter(self._pending))]
+        cursor = base64.urlsafe_b64encode(os.urandom(9)).decode()
+        self._pending[cursor] = (now + self.ttl_seconds, rest)
+        return cursor
+    
+    def _split_text(self, text: str, data: bytes) -> str:
+        """
+        The first piece of text that fits in max_bytes, with the rest kept under a cursor.
+        
+        The cut is made in the decoded string (at the last line break that fits,
+        else at the last whole character), so the pieces joined back together
+        are exactly text. Each piece ends with RESPONSE_TEXT_CONTINUATION and a
+        JSON note; the last one's cursor is null.
+        """
+        limit = max(1, self.max_bytes - 200)  # Room for the note below
+        head = text[:limit]
+        excess = len(head.encode('utf-8')) - limit
+        while excess > 0:
+            head = head[:len(head) - max(1, excess // 4)]  # A character is at most 4 bytes
+            excess = len(head.encode('utf-8')) - limit
+        if not head:
+            head = text[:1]
+        cut = head.rfind('\n')
+        if cut > 0:
+            head = head[:cut + 1]
+        rest = _TextRest(text[len(head):])
+        return self._text_piece(head, rest, len(data) - len(head.encode('utf-8')))
+    
+    def _text_piece(self, head: str, rest: Optional[str], remaining_bytes: int) -> str:
+        note = {'cursor': self._remember(rest) if rest else None,
+                'remaining_bytes': remaining_bytes, 'tool': 'get_more_results'}
+        return head + RESPONSE_TEXT_CONTINUATION + json.dumps(note, separators=(',', ':'))
+    
+    def _encode_capped(self, result) -> str:
+        """
+        JSON for result, cut at an item boundary of its largest list if it's over max_bytes.
+        
+        Items are measured only until the budget runs out, so a page of a huge
+        result costs about a page of encoding.
+        """
+        if isinstance(result, list):
+            key, items = None, result
+        else:
+            key = max((k for k, v in result.items() if isinstance(v, list)),
+                      key=lambda k: len(result[k]), default=None)
+            items = result[key] if key is not None else []
+        if len(items) < 2:
+            data = self.dumps(result)
+            if len(data) <= self.max_bytes:
+                return data.decode('utf-8')
+            # Nothing to page through (e.g. a big dict of counts): hand the text out in pieces
+            return self._split_text(data.decode('utf-8'), data)
+        
+        def wrap(part, continuation):
+            if key is None:
+                return {'items': part, 'continuation': continuation}
+            return {**result, key: part, 'continuation': continuation}
+        
+        continuation = {'returned': 0, 'remaining': len(items), 'cursor': '', 'tool': 'get_more_results'}
+        budget = self.max_bytes - len(self.dumps(wrap([], continuation))) - 16  # 16: room for the real cursor
+        count = used = 0
+        for item in items:
+            used += len(self.dumps(item)) + 1
+            if used > budget:
+                break
+            count += 1
+        if count == len(items):
+            data = self.dumps(result)
+            if len(data) <= self.max_bytes:
+                return data.decode('utf-8')
+            count -= 1
+        count = max(1, count)
+        # Indentation makes nested items a little bigger than they measure alone
+        while True:
+            continuation.update(returned=count, remaining=len(items) - count)
+            data = self.dumps(wrap(items[:count], continuation))
+            if len(data) <= self.max_bytes or count == 1:
+                break
+            count = max(1, count * 9 // 10)
+        if len(data) > self.max_bytes:
+            # A single item is over the cap on its own
+            data = self.dumps(result)
+            return self._split_text(data.decode('utf-8'), data)
+        
+        rest = items[count:] if key is None else {**result, key: items[count:]}
+        continuation['cursor'] = self._remember(rest)
+        return self.dumps(wrap(items[:count], continuation)).decode('utf-8')
+
 
 class InternshipCoach:
-    def __init__(self):
+    def __init__(self, cache_ttl: float = TRACKER_CACHE_TTL_SECONDS,
+                 mirror_path: Optional[str] = None, mirror_remote=None,
+                 metrics: Optional[ServerMetrics] = None):
+        """
+        Args:
+            cache_ttl: Seconds a tracker read is served from memory
+            mirror_path: SQLite file for the offline tracker mirror (None: talk
+                to Sheets directly)
+            mirror_remote: What the mirror syncs with (default: Google Sheets)
+            metrics: Where latency and API usage are recorded (default: a new
+                ServerMetrics, on unless INTERNSHIP_COACH_METRICS=0)
+        """
         self.creds = None
-        self.sheets_service = None
-        self.calendar_service = None
+        self._sheets_service = None
+        self._calendar_service = None
+        self._auth_lock = threading.Lock()
+        self.tracker_cache = SheetValuesCache(ttl_seconds=cache_ttl)
+        self._app_index = None
+        self._app_index_rows = None  # The cached rows list the index was built from
+        self._app_index_version = None  # RowVersions token the index was last in step with
+        self.row_versions = RowVersions()
+        self.calendar_cache = CalendarEventCache()
+        self._calendar_sync_lock = asyncio.Lock()
+        self.busy = BusyIntervals()
+        self._freebusy_lock = asyncio.Lock()
+        self.metrics = metrics if metrics is not None else ServerMetrics()
+        self.responses = ResponseEncoder()
+        self.api_executor = GoogleApiExecutor(metrics=self.metrics)
+        self.process_workers = os.cpu_count() or 1
+        self._process_pool = None
         # Define your resume paths here
+        # (the extension is a preference: whichever of RESUME_EXTENSIONS exists is used)
         self.resume_map = {
-            "resume://software-engineering": os.path.join(SCRIPT_DIR, "resumes", "swe-resume.txt"),
-            "resume://data-science": os.path.join(SCRIPT_DIR, "resumes", "ds-resume.txt"),
-            "resume://machine-learning": os.path.join(SCRIPT_DIR, "resumes", "ml-resume.txt"),
-            "resume://cyber": os.path.join(SCRIPT_DIR, "resumes", "cyber-resume.txt"),
-            "resume://materials-science": os.path.join(SCRIPT_DIR, "resumes", "matsci-resume.txt")
+            "resume://software-engineering": os.path.join(RESUME_DIR, "swe-resume.txt"),
+            "resume://data-science": os.path.join(RESUME_DIR, "ds-resume.txt"),
+            "resume://machine-learning": os.path.join(RESUME_DIR, "ml-resume.txt"),
+            "resume://cyber": os.path.join(RESUME_DIR, "cyber-resume.txt"),
+            "resume://materials-science": os.path.join(RESUME_DIR, "matsci-resume.txt")
         }
+        self.extraction_cache = ExtractionCache()
+        self._mirror_path = mirror_path
+        self._mirror = None
+        self.mirror_remote = mirror_remote or GoogleSheetsRemote(self)
+        self._mirror_sync_lock = asyncio.Lock()
+        self._mirror_wake = asyncio.Event()
+        self._mirror_first_sync = None  # Initial sync task shared by concurrent first calls
+        self._loop = None  # The server's event loop, once keep_mirror_synced runs
+        
+    @property
+    def mirror(self) -> Optional[TrackerMirror]:
+        """The offline tracker mirror (None if disabled), opened on first use"""
+        if self._mirror is None and self._mirror_path is not None:
+            self._mirror = TrackerMirror(self._mirror_path)
+            self._mirror.on_write = self._wake_mirror_sync
+        return self._mirror
+    
+    def _wake_mirror_sync(self):
+        """Ask the background sync to run soon (safe to call from any thread)"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._mirror_wake.set)
+    
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for CPU-bound batch work, started on first use"""
+        if self._process_pool is None:
+            # spawn rather than fork: the server process already runs threads
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context('spawn'))
+        return self._process_pool
+    
+    def close(self):
+        """Shut down worker threads and processes"""
+        self.api_executor.shutdown()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self._mirror is not None:
+            self._mirror.close()
+            self._mirror = None
+    
+    def authenticate_google(self, interactive: bool = True):
+        """
+        Authenticate with Google Sheets and Calendar APIs.
+        
+        Args:
+            interactive: Sign in through the browser when there's no usable
+                saved token; otherwise raise RuntimeError saying to authorize first
+        """
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow
         
-    def authenticate_google(self):
-        """Authenticate with Google Sheets and Calendar APIs"""
-        token_path = os.path.join(SCRIPT_DIR, 'token.pickle')
         creds_path = os.path.join(SCRIPT_DIR, 'credentials.json')
         
-        if os.path.exists(token_path):
-            with open(token_path, 'rb') as token:
-                self.creds = pickle.load(token)
+        creds = None
+        if os.path.exists(TOKEN_PATH):
+            with open(TOKEN_PATH, 'rb') as token:
+                creds = pickle.load(token)
         
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            elif not interactive:
+                raise RuntimeError(AUTHORIZE_FIRST_MESSAGE)
             else:
                 flow = InstalledAppFlow.from_client_secrets_file(
                     creds_path, SCOPES)
-                self.creds = flow.run_local_server(port=0)
+                # run_local_server prints its prompt and the sign-in URL; while the
+                # server runs, stdout is the JSON-RPC stream, so send it to stderr
+                with contextlib.redirect_stdout(sys.stderr):
+                    creds = flow.run_local_server(port=0)
             
-            with open(token_path, 'wb') as token:
-                pickle.dump(self.creds, token)
+            self._save_token(creds)
+        
+        self._install_credentials(creds)
+    
+    def needs_authorization(self) -> bool:
+        """Whether Google access needs a browser sign-in first (no credentials and no saved token)"""
+        return self.creds is None and not os.path.exists(TOKEN_PATH)
+    
+    def authorize(self):
+        """
+        Interactive first-time sign-in, run at startup or with --authorize.
+        
+        Runs on its own thread rather than an API worker, so the browser flow
+        isn't cut off by the per-call timeout; tool calls made meanwhile get
+        the "authorize first" error instead of waiting on it.
+        """
+        if self.creds is None:
+            self.authenticate_google(interactive=True)
+    
+    def _save_token(self, creds):
+        """Write the token cache atomically so a crash never leaves a half-written pickle"""
+        fd, tmp_path = tempfile.mkstemp(dir=SCRIPT_DIR, prefix='.token.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as token:
+                pickle.dump(creds, token)
+            os.replace(tmp_path, TOKEN_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def _install_credentials(self, creds):
+        """Swap in new credentials along with API clients built from them"""
+        sheets_service = self._build_service('sheets', 'v4', creds)
+        calendar_service = self._build_service('calendar', 'v3', creds)
+        self.creds = creds
+        self.api_executor.credentials = creds  # Workers rebuild their transports on next call
+        self._sheets_service = sheets_service
+        self._calendar_service = calendar_service
+    
+    def _refresh_credentials(self):
+        """Refresh a copy of the current credentials, persist it, then swap it in"""
+        from google.auth.transport.requests import Request
+        
+        # Refresh a copy so in-flight calls keep a consistent token until the swap
+        creds = pickle.loads(pickle.dumps(self.creds))
+        creds.refresh(Request())
+        self._save_token(creds)
+        self._install_credentials(creds)
+    
+    def _seconds_until_refresh(self) -> float:
+        """How long the background refresher should sleep before its next check"""
+        creds = self.creds
+        if creds is None or not getattr(creds, 'refresh_token', None):
+            return TOKEN_REFRESH_RETRY_SECONDS
+        if creds.expiry is None:
+            return TOKEN_REFRESH_RETRY_SECONDS
+        # google-auth keeps expiry as a naive UTC datetime
+        remaining = (creds.expiry - datetime.utcnow()).total_seconds()
+        return max(0.0, remaining - TOKEN_REFRESH_MARGIN_SECONDS)
+    
+    async def keep_credentials_fresh(self):
+        """
+        Background task: refresh the OAuth token shortly before it expires.
         
-        self.sheets_service = build('sheets', 'v4', credentials=self.creds)
-        self.calendar_service = build('calendar', 'v3', credentials=self.creds)
+        The refresh runs on a worker thread and the new credentials are swapped
+        in afterwards, so tool calls always find a valid token and never wait
+        on the token endpoint. Until the first tool call authenticates, this
+        just checks back periodically.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self._seconds_until_refresh())
+            if self.creds is None or self._seconds_until_refresh() > 0:
+                continue
+            try:
+                await loop.run_in_executor(None, self._refresh_credentials)
+            except Exception as e:
+                print(f"Token refresh failed, retrying in {TOKEN_REFRESH_RETRY_SECONDS}s: {e}",
+                      file=sys.stderr)
+                await asyncio.sleep(TOKEN_REFRESH_RETRY_SECONDS)
+    
+    def _build_service(self, name: str, version: str, creds=None):
+        """Build an API client from the discovery document bundled with googleapiclient"""
+        from googleapiclient.discovery import build
+        return build(name, version, credentials=creds or self.creds,
+                     static_discovery=True, cache_discovery=False)
+    
+    def _ensure_google(self):
+        """
+        Authenticate on first use from the saved token (thread-safe; normally
+        runs on an API worker thread). Never opens a browser: without a usable
+        token this raises RuntimeError saying to authorize first.
+        """
+        if self.creds is None:
+            with self._auth_lock:
+                if self.creds is None:
+                    self.authenticate_google(interactive=False)
+    
+    @property
+    def sheets_service(self):
+        """Where tracker reads and writes go: the offline mirror if enabled, else Google Sheets"""
+        if self.mirror is not None:
+            return self.mirror.service
+        return self.google_sheets_service
+    
+    @sheets_service.setter
+    def sheets_service(self, service):
+        self._sheets_service = service
+    
+    @property
+    def google_sheets_service(self):
+        """Sheets API client, authenticated and built on first use"""
+        if self._sheets_service is None:
+            self._ensure_google()
+            if self._sheets_service is None:
+                self._sheets_service = self._build_service('sheets', 'v4')
+        return self._sheets_service
     
-    def _read_pdf(self, file_path: str) -> str:
-        """Helper to read PDF files"""
+    @property
+    def calendar_service(self):
+        """Calendar API client, authenticated and built on first use"""
+        if self._calendar_service is None:
+            self._ensure_google()
+            if self._calendar_service is None:
+                self._calendar_service = self._build_service('calendar', 'v3')
+        return self._calendar_service
+    
+    @calendar_service.setter
+    def calendar_service(self, service):
+        self._calendar_service = service
+    
+    def _resolve_resume_path(self, file_path: str) -> str:
+        """The mapped file if it exists, else the same name with the first extension that does"""
+        if os.path.exists(file_path):
+            return file_path
+        stem = os.path.splitext(file_path)[0]
+        for ext in RESUME_EXTENSIONS:
+            if os.path.exists(stem + ext):
+                return stem + ext
+        return file_path
+    
+    def _iter_pdf_pages(self, file_path: str, first_page: int = 1,
+                        last_page: Optional[int] = None):
+        """
+        Yield (page_number, text) for a 1-based inclusive page range, one page at a time.
+        
+        Only the requested pages are extracted. Pages already extracted for
+        this version of the file come from the extraction cache, and newly
+        extracted ones are added to it when the generator finishes.
+        """
+        import PyPDF2
+        
+        entry = self.extraction_cache.get(file_path)
+        if not isinstance(entry, dict):
+            entry = {'page_count': None, 'pages': {}}
+        pages = entry['pages']
+        added = False
+        reader = None
+        f = None
         try:
-            with open(file_path, 'rb') as f:
+            page_count = entry['page_count']
+            if page_count is None:
+                f = open(file_path, 'rb')
                 reader = PyPDF2.PdfReader(f)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text()
-            return text
+                page_count = entry['page_count'] = len(reader.pages)
+                added = True
+            
+            last = page_count if last_page is None else min(last_page, page_count)
+            for page_number in range(max(1, first_page), last + 1):
+                text = pages.get(str(page_number))
+                if text is None:
+                    started = time.perf_counter() if self.metrics.enabled else None
+                    if reader is None:
+                        f = open(file_path, 'rb')
+                        reader = PyPDF2.PdfReader(f)
+                    text = reader.pages[page_number - 1].extract_text() or ''
+                    if started is not None:
+                        self.metrics.observe('stage', 'pdf_page_extract', time.perf_counter() - started)
+                    pages[str(page_number)] = text
+                    added = True
+                yield page_number, text
+        finally:
+            if f is not None:
+                f.close()
+            if added:
+                self.extraction_cache.put(file_path, entry)
+    
+    def _read_pdf(self, file_path: str, first_page: int = 1,
+                  last_page: Optional[int] = None) -> str:
+        """Helper to read PDF files (optionally just a page range)"""
+        try:
+            return "".join(text for _, text in self._iter_pdf_pages(file_path, first_page, last_page))
         except Exception as e:
             return f"Error reading PDF: {str(e)}"
     
@@ -101,172 +3214,31 @@ class InternshipCoach:
         Returns:
             dict with recommendation, reasoning, and alternatives
         """
+        return recommend_resume_for(company, position, job_description)
+    
+    async def recommend_resumes_batch(self, postings: list):
+        """
+        Recommend resumes for many postings at once.
         
-        position_lower = position.lower()
-        jd_lower = job_description.lower() if job_description else ""
-        
-        # Keywords for each resume type
-        swe_keywords = [
-            'software', 'engineer', 'developer', 'backend', 'frontend', 'full stack',
-            'fullstack', 'web dev', 'mobile', 'ios', 'android', 'coding', 'programming',
-            'java', 'python', 'c++', 'javascript', 'react', 'node', 'api', 'system design',
-            'swe', 'sde', 'software development'
-        ]
-        
-        data_keywords = [
-            'data', 'analytics', 'analyst', 'business intelligence', 'bi',
-            'sql', 'tableau', 'power bi', 'visualization', 'reporting',
-            'metrics', 'dashboard', 'excel', 'statistics'
-        ]
-        
-        ml_keywords = [
-            'machine learning', 'ml', 'ai', 'artificial intelligence', 'deep learning',
-            'neural network', 'nlp', 'computer vision', 'tensorflow', 'pytorch',
-            'scikit-learn', 'model', 'training', 'inference', 'data science',
-            'research', 'phd', 'kaggle'
-        ]
-        
-        cyber_keywords = [
-            'cyber', 'security', 'infosec', 'penetration', 'vulnerability',
-            'threat', 'soc', 'incident response', 'firewall', 'encryption',
-            'compliance', 'risk', 'authentication', 'network security',
-            'malware', 'forensics', 'ceh', 'cissp'
-        ]
-        
-        matsci_keywords = [
-            'materials', 'chemistry', 'chemical', 'polymer', 'nanomaterial',
-            'characterization', 'synthesis', 'lab', 'research', 'microscopy',
-            'spectroscopy', 'semiconductor', 'metallurgy', 'biomaterial',
-            'composite', 'crystallography'
-        ]
-        
-        # Calculate scores for each category
-        swe_score = sum(1 for keyword in swe_keywords if keyword in position_lower or keyword in jd_lower)
-        data_score = sum(1 for keyword in data_keywords if keyword in position_lower or keyword in jd_lower)
-        ml_score = sum(1 for keyword in ml_keywords if keyword in position_lower or keyword in jd_lower)
-        cyber_score = sum(1 for keyword in cyber_keywords if keyword in position_lower or keyword in jd_lower)
-        matsci_score = sum(1 for keyword in matsci_keywords if keyword in position_lower or keyword in jd_lower)
-        
-        # Find the highest score
-        scores = {
-            "resume://software-engineering": swe_score,
-            "resume://data-science": data_score,
-            "resume://machine-learning": ml_score,
-            "resume://cyber": cyber_score,
-            "resume://materials-science": matsci_score
-        }
-        
-        max_score = max(scores.values())
-        
-        # Handle ties or no clear winner
-        top_resumes = [uri for uri, score in scores.items() if score == max_score]
-        
-        recommendation = None
-        reasoning = []
-        alternatives = []
-        confidence = "high"
-        
-        if max_score == 0:
-            # No keywords matched - default to most general
-            recommendation = "resume://software-engineering"
-            reasoning.append("⚠️ No clear keyword matches found in position or description")
-            reasoning.append("Defaulting to software engineering resume as most general tech resume")
-            alternatives = [
-                {"uri": "resume://data-science", "reason": "Use if role involves data analysis"},
-                {"uri": "resume://machine-learning", "reason": "Use if role involves ML/AI work"},
-                {"uri": "resume://cyber", "reason": "Use if role is security-focused"},
-                {"uri": "resume://materials-science", "reason": "Use if role is materials/chemistry-focused"}
-            ]
-            confidence = "low"
-            reasoning.append("💡 Consider providing the full job description for better analysis")
-        
-        elif len(top_resumes) > 1:
-            # Tie - pick based on hierarchy: ML > Cyber > SWE > Data > MatSci
-            priority_order = [
-                "resume://machine-learning",
-                "resume://cyber", 
-                "resume://software-engineering",
-                "resume://data-science",
-                "resume://materials-science"
-            ]
-            
-            for uri in priority_order:
-                if uri in top_resumes:
-                    recommendation = uri
-                    break
-            
-            reasoning.append(f"Multiple resume types tied with {max_score} keyword matches")
-            reasoning.append(f"Recommending {recommendation.split('://')[-1]} as primary")
-            
-            for uri in top_resumes:
-                if uri != recommendation:
-                    alternatives.append({
-                        "uri": uri,
-                        "reason": f"Equally strong match ({scores[uri]} keywords)"
-                    })
-            confidence = "medium"
-        
-        else:
-            # Clear winner
-            recommendation = top_resumes[0]
-            resume_type = recommendation.split('://')[-1]
-            reasoning.append(f"✅ Strong match for {resume_type} ({max_score} keyword matches)")
-            
-            # Add specific reasoning based on type
-            if recommendation == "resume://software-engineering":
-                reasoning.append("Focus on: coding skills, software projects, technical stack")
-            elif recommendation == "resume://data-science":
-                reasoning.append("Focus on: data analysis, SQL, visualization, business insights")
-            elif recommendation == "resume://machine-learning":
-                reasoning.append("Focus on: ML models, research, algorithms, frameworks (TensorFlow/PyTorch)")
-            elif recommendation == "resume://cyber":
-                reasoning.append("Focus on: security tools, vulnerabilities, compliance, threat analysis")
-            elif recommendation == "resume://materials-science":
-                reasoning.append("Focus on: lab experience, characterization, research, publications")
-            
-            # Add runner-up alternatives
-            sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-            for uri, score in sorted_scores[1:3]:  # Next 2 highest
-                if score > 0:
-                    alternatives.append({
-                        "uri": uri,
-                        "reason": f"Consider if role emphasizes {uri.split('://')[-1]} ({score} keywords)"
-                    })
-        
-        # Company-specific insights
-        company_lower = company.lower()
-        if any(term in company_lower for term in ['google', 'meta', 'facebook', 'amazon', 'microsoft', 'apple', 'netflix']):
-            reasoning.append(f"🏢 {company} is a major tech company - roles are usually well-defined")
-        
-        if any(term in company_lower for term in ['defense', 'lockheed', 'raytheon', 'northrop', 'booz allen']):
-            if recommendation != "resume://cyber":
-                reasoning.append("⚠️ Defense contractors often value security clearance/cyber skills")
-        
-        if any(term in company_lower for term in ['openai', 'deepmind', 'anthropic', 'hugging face']):
-            if recommendation != "resume://machine-learning":
-                reasoning.append("⚠️ AI research companies typically prefer ML-focused resumes")
+        Large batches are scored in parallel on a process pool; results come
+        back in input order with the same shape as recommend_resume. A posting
+        that can't be read gets {"index": i, "error": ...} in its slot.
         
-        return {
-            "recommended_resume": recommendation,
-            "resume_name": recommendation.split('://')[-1],
-            "confidence": confidence,
-            "reasoning": reasoning,
-            "alternatives": alternatives,
-            "analysis": {
-                "keyword_scores": {
-                    "software_engineering": swe_score,
-                    "data_science": data_score,
-                    "machine_learning": ml_score,
-                    "cybersecurity": cyber_score,
-                    "materials_science": matsci_score
-                },
-                "company": company,
-                "position": position,
-                "jd_provided": bool(job_description)
-            }
-        }
+        Args:
+            postings: list of {"company", "position", "job_description"} objects
+                or [company, position, job_description] lists
+        """
+        postings = list(postings)
+        if len(postings) < RESUME_BATCH_PARALLEL_THRESHOLD:
+            return _recommend_resume_chunk(list(enumerate(postings)))
         
-    
+        loop = asyncio.get_running_loop()
+        chunks = _posting_chunks(postings, self.process_workers)
+        chunk_results = await asyncio.gather(*(
+            loop.run_in_executor(self.process_pool, _recommend_resume_chunk, chunk)
+            for chunk in chunks
+        ))
+        return [result for chunk in chunk_results for result in chunk]
     
     async def list_resources(self) -> list:
         """
@@ -297,12 +3269,15 @@ class InternshipCoach:
             }
         ]
 
-    async def read_resource(self, uri: str) -> str:
+    async def read_resource(self, uri: str, pages: Optional[str] = None) -> str:
         """
         Read and return the content of a specified resume version.
         
         Args:
-            uri: The unique resource identifier (e.g., "resume://software-engineering")
+            uri: The unique resource identifier (e.g., "resume://software-engineering").
+                A page range can also be given in the URI: "resume://cyber?pages=1-2"
+            pages: Optional 1-based page range for PDFs ("1", "2-4" or "3-");
+                only those pages are extracted
         
         Returns:
             The content of the requested resource as a string. For resumes,
@@ -312,9 +3287,19 @@ class InternshipCoach:
         
         Raises:
             ValueError: If the requested resource URI is not recognized
+                or the page range is malformed
         """
+        uri = str(uri)
+        if '?' in uri:
+            uri, query = uri.split('?', 1)
+            for param in query.split('&'):
+                key, _, value = param.partition('=')
+                if key == 'pages' and pages is None:
+                    pages = value
+        first_page, last_page = _parse_page_range(pages)
+        
         if uri in self.resume_map:
-            file_path = self.resume_map[uri]
+            file_path = self._resolve_resume_path(self.resume_map[uri])
             
             # Check if file exists
             if not os.path.exists(file_path):
@@ -322,97 +3307,75 @@ class InternshipCoach:
             
             # Read based on file extension
             if file_path.endswith('.pdf'):
-                return self._read_pdf(file_path)
+                return self._read_pdf(file_path, first_page, last_page)
             else:  # Assume text file (.txt, .md, etc.)
                 return self._read_text_file(file_path)
         
         raise ValueError(f"Unknown resource: {uri}. Available resources: {', '.join(self.resume_map.keys())}")
     
     async def call_tool(self, name: str, arguments: dict):
+        """Run a tool, recording its latency and whether it failed when metrics are on"""
+        if not self.metrics.enabled:
+            return await self._route_tool(name, arguments)
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await self._route_tool(name, arguments)
+            failed = ((isinstance(result, str) and result.startswith("❌"))
+                      or (isinstance(result, dict) and 'error' in result))
+            return result
+        finally:
+            self.metrics.observe('tool', name, time.perf_counter() - started)
+            if failed:
+                self.metrics.inc('tool_errors', (name,))
+    
+    async def _route_tool(self, name: str, arguments: dict):
         """Route tool calls to appropriate methods"""
         if name == "get_applications":
             return await self.get_applications(**arguments)
         elif name == "add_application":
             return await self.add_application(**arguments)
+        elif name == "add_applications":
+            return await self.add_applications(**arguments)
         elif name == "update_status":
             return await self.update_application_status(**arguments)
         elif name == "update_details":
             return await self.update_application_details(**arguments)
+        elif name == "batch_update":
+            return await self.batch_update(**arguments)
         elif name == "schedule_interview":
             return await self.add_interview_to_calendar(**arguments)
+        elif name == "schedule_interviews":
+            return await self.schedule_interviews(**arguments)
+        elif name == "find_free_slots":
+            return await self.find_free_slots(**arguments)
         elif name == "get_upcoming_interviews":
             return await self.get_upcoming_interviews(**arguments)
         elif name == "create_study_schedule":
             return self.generate_study_schedule(**arguments)
+        elif name == "plan_study_schedule":
+            return await self.plan_study_schedule(**arguments)
         elif name == "get_interview_prep":
-            return self.get_interview_prep(**arguments)
+            return self.get_interview_prep_plan(**arguments)
         elif name == "recommend_resume":
-            return self.recommend_resume(**arguments)
+            return await self.recommend_resume(**arguments)
+        elif name == "recommend_resumes_batch":
+            return await self.recommend_resumes_batch(**arguments)
+        elif name == "query_applications":
+            return await self.query_applications(**arguments)
+        elif name == "get_pipeline_stats":
+            return await self.get_pipeline_stats(**arguments)
+        elif name == "sync_tracker":
+            return await self.sync_tracker(**arguments)
+        elif name == "get_cache_stats":
+            return self.get_cache_stats()
+        elif name == "get_server_metrics":
+            return self.get_server_metrics(**arguments)
+        elif name == "get_more_results":
+            return self.get_more_results(**arguments)
         else:
             raise ValueError(f"Unknown tool: {name}")
     
-    async def get_applications(self, status_filter: Optional[str] = None, applied_only: Optional[bool] = False):
-        """
-        Fetch applications from sheet. The applications considered "applied" are those 
-        that are either submitted, rejected, or have a technical, phone screen, 
-        or interview scheduled. Applications in progress are applications 
-        that have not fully filled out, and need to be filled in soon.
-        Columns: A=Company, B=Position, C=Date Applied, D= Referral, 
-                E=Application Status, F=Details, G=Applicant Portal
-        
-        Args:
-            status_filter: Filter by specific status
-            applied_only: If True, only return applications with status 
-                        'Submitted', 'Rejected', 'Phone Screen/HireVue', 
-                        'Technical', or 'Interview'
-        """
-        # Statuses that count as "applied"
-        APPLIED_STATUSES = {
-            'submitted', 
-            'rejected', 
-            'phone screen/hirevue', 
-            'technical',
-            'interview'
-        }
-        
-        sheet = self.sheets_service.spreadsheets()
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f'{SHEET_NAME}!A{DATA_START_ROW}:G'
-        ).execute()
-        
-        rows = result.get('values', [])
-        applications = []
-        
-        for i, row in enumerate(rows, start=DATA_START_ROW):
-            if not row or len(row) == 0 or not row[0]:  # Skip empty rows
-                continue
-                
-            app = {
-                'row': i,
-                'company': row[0] if len(row) > 0 else '',
-                'position': row[1] if len(row) > 1 else '',
-                'date_applied': row[2] if len(row) > 2 else '',
-                'referral_source': row[3] if len(row) > 3 else '',
-                'status': row[4] if len(row) > 4 else '',
-                'details': row[5] if len(row) > 5 else '',
-                'portal': row[6] if len(row) > 6 else ''
-            }
-            
-            # Filter by applied_only if requested
-            if applied_only:
-                if app['status'].lower().strip() not in APPLIED_STATUSES:
-                    continue
-            
-            # Filter by specific status if requested
-            if status_filter:
-                if app['status'].lower() == status_filter.lower():
-                    applications.append(app)
-            else:
-                applications.append(app)
-        
-        return applications
-    
     def is_applied(self, status: str) -> bool:
         """
         Check if an application counts as "applied" based on status.
@@ -471,181 +3434,1327 @@ class InternshipCoach:
         # Everything else (including "In Progress") is NOT applied
         return False
 
-    async def get_applications(self, status_filter: Optional[str] = None, applied_only: Optional[bool] = False):
+    async def get_applications(self, status_filter: Optional[str] = None, applied_only: Optional[bool] = False,
+                               offset: int = 0, limit: Optional[int] = None,
+                               cursor: Optional[str] = None, fields: Optional[list] = None,
+                               sort_by: Optional[str] = None, since: Optional[str] = None):
+        """
+        Fetch applications from sheet. 
+        
+        APPLIED = Submitted, Rejected, Technical, Phone Screen/HireVue, or any interview status
+        NOT APPLIED = In Progress, blank, or any other status
+        
+        Args:
+            status_filter: Filter by specific status (case-insensitive)
+            applied_only: If True, only return applications that count as "applied"
+            offset: Number of matching applications to skip
+            limit: Page size. When limit or cursor is given the result is a page:
+                {"applications": [...], "total": n, "next_cursor": "..."}.
+                total is None for an unfiltered page read without loading the
+                whole sheet (first page or a cursor, with no fresh snapshot)
+            cursor: next_cursor from the previous page (same filters, fields and sort)
+            fields: Only include these fields (the row number is always included)
+            sort_by: Field to sort by, '-' prefix for descending (e.g. "-date_applied")
+            since: Change token from a previous call; returns only what changed:
+                {"token", "inserted", "changed", "deleted" (row numbers), "reset"}.
+                Pass "" to start: that returns every row as inserted plus a token.
+        
+        Returns:
+            list of applications, a page dict when paging, or a delta dict with since
+        """
+        if since is not None:
+            if status_filter or applied_only or limit is not None or cursor is not None or offset or sort_by:
+                raise ValueError("since can only be combined with fields")
+            return await self._get_application_changes(since, _field_projection(fields))
+        
+        paged = limit is not None or cursor is not None
+        projection = _field_projection(fields)
+        sort_field, descending = _sort_spec(sort_by)
+        query = [status_filter, bool(applied_only), projection, sort_by]
+        start_row = None
+        if cursor is not None:
+            offset, start_row = _decode_cursor(cursor, query)
+        offset = max(0, int(offset or 0))
+        if paged and limit is None:
+            limit = APPLICATIONS_PAGE_SIZE
+        limit = None if limit is None else max(1, int(limit))
+        
+        # An unfiltered, unsorted page with no fresh snapshot only needs its own rows.
+        # Blank rows mean an offset doesn't map to a sheet row, so the window has
+        # to start at the top or where a cursor left off.
+        if (limit is not None and not status_filter and not applied_only and sort_field is None
+                and (offset == 0 or start_row is not None)
+                and not self.tracker_cache.is_fresh(SPREADSHEET_ID, TRACKER_RANGE)):
+            page, next_row = await self._read_application_window(
+                start_row if start_row is not None else DATA_START_ROW, limit)
+            next_cursor = None
+            if next_row is not None:
+                next_cursor = _encode_cursor(offset + len(page), next_row, query)
+            return {
+                'applications': [_project(app, projection) for app in page],
+                'total': None,
+                'next_cursor': next_cursor
+            }
+        
+        # Rows are parsed once per snapshot (by the index); this only filters
+        index = await self._get_application_index()
+        applications = index.query(statuses=[status_filter] if status_filter else None,
+                                   applied_only=bool(applied_only))
+        
+        if sort_field is not None:
+            applications.sort(key=lambda app: _sort_value(app, sort_field), reverse=descending)
+            if descending:
+                # Keep rows with no value last in both directions
+                applications.sort(key=lambda app: _sort_value(app, sort_field)[0])
+        
+        if not paged and offset == 0 and projection is None:
+            return [app.to_dict() for app in applications]
+        
+        total = len(applications)
+        end = total if limit is None else offset + limit
+        page = [_project(app, projection) for app in applications[offset:end]]
+        if not paged:
+            return page
+        
+        next_cursor = None
+        if end < total:
+            next_cursor = _encode_cursor(end, applications[end - 1].row + 1, query)
+        return {'applications': page, 'total': total, 'next_cursor': next_cursor}
+    
+    async def _get_application_changes(self, since: str, projection: Optional[list]) -> dict:
+        """Rows inserted, changed and deleted since a change token"""
+        rows = await self._get_tracker_rows()
+        delta = self.row_versions.changes_since(since) if since else None
+        
+        def parse(row_nums: list) -> list:
+            parsed = []
+            for row_num in row_nums:
+                offset = row_num - DATA_START_ROW
+                parsed.extend(self._filter_applications(rows[offset:offset + 1], row_num))
+            return [_project(app, projection) for app in parsed]
+        
+        if delta is None:
+            applications = self._filter_applications(rows, DATA_START_ROW)
+            return {
+                'token': self.row_versions.token(),
+                'reset': True,
+                'inserted': [_project(app, projection) for app in applications],
+                'changed': [],
+                'deleted': []
+            }
+        
+        inserted, changed, deleted = delta
+        return {
+            'token': self.row_versions.token(),
+            'reset': False,
+            'inserted': parse(inserted),
+            'changed': parse(changed),
+            'deleted': deleted
+        }
+    
+    def _filter_applications(self, rows: list, start_row: int,
+                             status_filter: Optional[str] = None,
+                             applied_only: Optional[bool] = False) -> list:
+        """Parse raw rows into Applications, applying the status filters"""
+        applications = parse_applications(rows, start_row)
+        
+        # Filter by applied_only if requested
+        if applied_only:
+            applications = [app for app in applications if self.is_applied(app.status)]
+        
+        # Filter by specific status if requested
+        if status_filter:
+            wanted = status_filter.lower().strip()
+            applications = [app for app in applications if app.status.lower().strip() == wanted]
+        
+        return applications
+    
+    async def _read_application_window(self, first_row: int, count: int) -> tuple:
+        """
+        Read just enough sheet rows, starting at first_row, to collect count applications.
+        
+        Sheets trims trailing blank rows from a read, so a short read can't tell
+        a gap from the end of the data; the listing is considered finished after
+        WINDOW_END_BLANK_ROWS consecutive blank rows.
+        
+        Returns:
+            (applications, next_row) where next_row is None once the data runs out
+        """
+        applications = []
+        row = first_row
+        blank_run = 0
+        while True:
+            # After a run of blanks, read far enough to either find more data or confirm the end
+            size = max(count - len(applications), WINDOW_MIN_ROWS,
+                       WINDOW_END_BLANK_ROWS - blank_run if blank_run else 0)
+            result = await self._execute(
+                lambda: self.sheets_service.spreadsheets().values().get(
+                    spreadsheetId=SPREADSHEET_ID,
+                    range=f'{SHEET_NAME}!A{row}:G{row + size - 1}'
+                ),
+                api=self._tracker_api,
+                coalesce_key=('values.get', SPREADSHEET_ID, f'{SHEET_NAME}!A{row}:G{row + size - 1}'),
+                idempotent=True
+            )
+            rows = result.get('values', [])
+            for app in self._filter_applications(rows, row):
+                if len(applications) == count:
+                    return applications, applications[-1].row + 1
+                applications.append(app)
+            
+            filled = [k for k, r in enumerate(rows) if r and r[0]]
+            blank_run = size - 1 - filled[-1] if filled else blank_run + size
+            if blank_run >= WINDOW_END_BLANK_ROWS:
+                return applications, None
+            if len(applications) == count:
+                return applications, applications[-1].row + 1
+            row += size
+    
+    async def _execute(self, request_factory, timeout: Optional[float] = None,
+                       api: Optional[str] = None, coalesce_key=None, cost: int = 1,
+                       idempotent: bool = False):
+        """Execute a Google API request without blocking the event loop (see GoogleApiExecutor.execute)"""
+        if api is None:
+            # A tracker call served by the mirror, which needs one pull before it can answer
+            await self._ensure_mirror_snapshot()
+        return await self.api_executor.execute(request_factory, timeout=timeout, api=api,
+                                               coalesce_key=coalesce_key, cost=cost,
+                                               idempotent=idempotent)
+    
+    @property
+    def _tracker_api(self) -> Optional[str]:
+        """Quota tracker reads and writes count against (none when they're served by the mirror)"""
+        return None if self.mirror is not None else 'sheets'
+    
+    async def _ensure_mirror_snapshot(self):
+        """First run: nothing can be served offline until one pull has succeeded"""
+        if self.mirror is None or self.mirror.has_snapshot:
+            return
+        # Concurrent first calls share one initial sync rather than queueing up several
+        if self._mirror_first_sync is None or self._mirror_first_sync.done():
+            self._mirror_first_sync = asyncio.ensure_future(self._sync_mirror())
+        await asyncio.shield(self._mirror_first_sync)
+    
+    async def _get_tracker_rows(self) -> list:
+        """Raw tracker rows (A:G from DATA_START_ROW), served from the cache when fresh"""
+        rows = self.tracker_cache.get(SPREADSHEET_ID, TRACKER_RANGE)
+        if rows is not None:
+            return rows
+        
+        # Reads only share a request sent after the last write they know of
+        generation = self.tracker_cache.generation(SPREADSHEET_ID, TRACKER_RANGE)
+        result = await self._execute(
+            lambda: self.sheets_service.spreadsheets().values().get(
+                spreadsheetId=SPREADSHEET_ID,
+                range=TRACKER_RANGE
+            ),
+            api=self._tracker_api,
+            coalesce_key=('values.get', SPREADSHEET_ID, TRACKER_RANGE, generation),
+            idempotent=True
+        )
+        
+        rows = result.get('values', [])
+        # A write that landed while the read was in flight may be missing from it
+        if self.tracker_cache.put(SPREADSHEET_ID, TRACKER_RANGE, rows, generation=generation):
+            self.row_versions.observe_snapshot(rows)
+        return rows
+    
+    def _known_row_count(self) -> int:
+        """Filled tracker rows in the cached snapshot (0 if none is cached)"""
+        rows = self.tracker_cache.peek(SPREADSHEET_ID, TRACKER_RANGE)
+        return _filled_row_count(rows) if rows is not None else 0
+    
+    async def _reconcile_append(self, values: list, error: Exception, after: int = 0) -> Optional[int]:
+        """
+        After an append failed, find out whether it was applied anyway.
+        
+        Appends aren't retried (sending one twice adds the rows twice), so a
+        timeout, lost response or server error leaves it unknown whether the
+        rows landed. The tracker is read back and searched for them, past the
+        after rows it was known to have. A rejected request (4xx) never ran.
+        
+        Returns:
+            the first row the values landed on, or None if they didn't
+        
+        Raises:
+            RuntimeError when the tracker can't be read to tell
+        """
+        status = _http_status(error)
+        if status is not None and status < 500:
+            return None
+        self.tracker_cache.invalidate(SPREADSHEET_ID, TRACKER_RANGE)
+        try:
+            rows = await self._get_tracker_rows()
+        except Exception as e:
+            raise RuntimeError(f"{error} (and the tracker couldn't be read back to check whether "
+                               f"it was added: {e}); look at the sheet before adding it again") from error
+        offset = _find_appended_rows(rows, values, start=after)
+        return None if offset is None else DATA_START_ROW + offset
+    
+    def _cache_write_result(self, updated: dict, fallback_row: Optional[int] = None):
+        """Write the values echoed back by an update/append into the tracker cache"""
+        first_row = _first_row_of_range(updated.get('updatedRange', '')) or fallback_row
+        data = updated.get('updatedData', {})
+        values = data.get('values')
+        start_col = re.search(r'!([A-Z]+)\d+', data.get('range', updated.get('updatedRange', '')))
+        if first_row is None or values is None or start_col is None:
+            self.tracker_cache.invalidate(SPREADSHEET_ID, TRACKER_RANGE)
+            return
+        
+        col_index = _column_index(start_col.group(1))
+        if col_index == 0:
+            self.tracker_cache.set_rows(SPREADSHEET_ID, TRACKER_RANGE,
+                                        first_row - DATA_START_ROW, values)
+        else:
+            for i, row in enumerate(values):
+                for j, value in enumerate(row):
+                    self.tracker_cache.update_cell(SPREADSHEET_ID, TRACKER_RANGE,
+                                                   first_row - DATA_START_ROW + i,
+                                                   col_index + j, value)
+        self._reindex_rows(range(first_row, first_row + len(values)))
+        cached = self.tracker_cache.peek(SPREADSHEET_ID, TRACKER_RANGE)
+        if cached is not None:
+            self.row_versions.observe_rows(cached, first_row, len(values))
+    
+    async def _sync_mirror(self) -> dict:
+        """
+        Push the mirror's pending writes to the remote, then pull a fresh snapshot.
+        
+        Appends always go through (landing wherever the sheet now ends), and
+        only once: if the last sync's append failed without an answer (timeout,
+        lost response), its rows are looked for in the sheet first and only
+        sent again if they aren't there. An edit goes through only if the sheet still holds what the cell held
+        when we edited it; otherwise it's parked as a conflict, the sheet's
+        value stays visible, and sync_tracker can resolve it. A failure (e.g.
+        offline) stops the sync with the remaining writes still queued.
+        
+        However long the outbox, a push costs at most one values.batchUpdate
+        for the edits to existing rows and one values().append for the new
+        rows, with any edits made to those rows since folded in.
+        
+        Returns:
+            dict with the number of writes pushed and new conflicts found
+        """
+        mirror = self.mirror
+        remote = self.mirror_remote
+        async with self._mirror_sync_lock:
+            try:
+                remote_rows = [list(row) for row in await remote.fetch_rows()]
+                confirmed = self._confirm_mirror_append(remote_rows)
+                ops = mirror.pending_ops()
+                
+                # New rows, as one block (index 0 = first appended row)
+                appended = []
+                append_offsets = {}  # append op id -> offset of its first row in `appended`
+                for op in ops:
+                    if op['kind'] == 'append':
+                        append_offsets[op['id']] = len(appended)
+                        appended.extend(list(row) for row in op['cells'])
+                
+                blocks = []  # (row, col, values) edits to existing rows
+                edited, folded, unchanged = [], [], []
+                conflicts = 0
+                for op in ops:
+                    if op['kind'] == 'append':
+                        continue
+                    if op['append_ref'] is not None:
+                        if op['append_ref'] not in append_offsets:
+                            continue
+                        offset = append_offsets[op['append_ref']] + op['ref_offset']
+                        _put_cells(appended, DATA_START_ROW + offset, op['col'], [op['cells']])
+                        folded.append(op['id'])
+                        continue
+                    current = _get_cells(remote_rows, op['row'], op['col'], len(op['cells']))
+                    if current == op['cells']:
+                        unchanged.append(op['id'])
+                    elif current == op['base_cells']:
+                        blocks.append((op['row'], op['col'], [op['cells']]))
+                        _put_cells(remote_rows, op['row'], op['col'], [op['cells']])
+                        edited.append(op['id'])
+                    else:
+                        mirror.mark_conflict(op['id'], current)
+                        conflicts += 1
+                
+                if blocks:
+                    await remote.update_blocks(blocks)
+                mirror.complete(edited + unchanged)
+                if appended:
+                    mirror.set_append_in_flight({'after': _filled_row_count(remote_rows), 'rows': appended,
+                                                 'ops': list(append_offsets) + folded, 'offsets': append_offsets})
+                    first_row = await remote.append_rows(appended)
+                    _put_cells(remote_rows, first_row, 0, appended)
+                    mirror.complete(list(append_offsets) + folded,
+                                    appended_at={op_id: first_row + offset
+                                                 for op_id, offset in append_offsets.items()})
+                    mirror.set_append_in_flight(None)
+                pushed = confirmed + len(edited) + (len(append_offsets) + len(folded) if appended else 0)
+            except Exception as e:
+                mirror.last_error = str(e)
+                raise
+            
+            mirror.last_error = None
+            if mirror.replace_base(remote_rows) or pushed or conflicts:
+                # Row numbers or contents moved under the cached snapshot
+                self.tracker_cache.invalidate(SPREADSHEET_ID, TRACKER_RANGE)
+            return {'pushed': pushed, 'new_conflicts': conflicts}
+    
+    def _confirm_mirror_append(self, remote_rows: list) -> int:
+        """
+        Settle an append the last sync sent without getting an answer: if its
+        rows are in the freshly fetched sheet (past where it ended then), the
+        ops it carried are done; otherwise they stay queued to be sent again.
+        
+        Returns:
+            how many outbox ops were confirmed
+        """
+        record = self.mirror.append_in_flight()
+        if record is None:
+            return 0
+        offset = _find_appended_rows(remote_rows, record['rows'], start=record['after'])
+        if offset is None:
+            self.mirror.set_append_in_flight(None)
+            return 0
+        first_row = DATA_START_ROW + offset
+        self.mirror.complete(record['ops'], appended_at={int(op_id): first_row + op_offset
+                                                         for op_id, op_offset in record['offsets'].items()})
+        self.mirror.set_append_in_flight(None)
+        return len(record['ops'])
+    
+    async def keep_mirror_synced(self):
+        """
+        Background task: keep the offline mirror and Google Sheets in step.
+        
+        Syncs every MIRROR_SYNC_INTERVAL_SECONDS, and shortly after local
+        writes. While the remote is unreachable, writes stay queued in the
+        mirror and reads keep being served from it.
+        """
+        if self._mirror_path is None:
+            return
+        self._loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.wait_for(self._mirror_wake.wait(), MIRROR_SYNC_INTERVAL_SECONDS)
+                await asyncio.sleep(MIRROR_WRITE_DEBOUNCE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._mirror_wake.clear()
+            if self._mirror is None or not self.mirror_remote.available():
+                continue  # Not opened by a tool call yet, or we can't sign in silently
+            try:
+                await self._sync_mirror()
+            except Exception as e:
+                print(f"Tracker sync failed, retrying in {MIRROR_RETRY_SECONDS}s: {e}", file=sys.stderr)
+                await asyncio.sleep(MIRROR_RETRY_SECONDS)
+    
+    async def sync_tracker(self, resolve_conflicts: Optional[str] = None):
+        """
+        Sync the offline mirror with Google Sheets now and report its state.
+        
+        Args:
+            resolve_conflicts: 'local' to push our conflicting edits over the
+                sheet's values, 'remote' to discard them
+        """
+        if self.mirror is None:
+            return ("ℹ️ The offline mirror is turned off (INTERNSHIP_COACH_MIRROR=0); the tracker is "
+                    "read and written in Google Sheets directly, so there's nothing to sync")
+        resolved = self.mirror.resolve_conflicts(resolve_conflicts) if resolve_conflicts else 0
+        try:
+            result = await self._sync_mirror()
+        except Exception as e:
+            result = {'error': f"Sync failed, writes stay queued: {e}"}
+        if resolved:
+            result['resolved'] = resolved
+        result.update(self.mirror.status())
+        return result
+    
+    def get_cache_stats(self) -> dict:
+        """Tracker cache hit/miss counters"""
+        return self.tracker_cache.stats()
+    
+    def get_server_metrics(self, format: str = "json"):
+        """
+        Latency and usage metrics since the server started.
+        
+        Args:
+            format: "json" for per-tool/per-API summaries, "prometheus" for
+                the text exposition format
+        """
+        if format == "prometheus":
+            return self.metrics.prometheus_text()
+        result = self.metrics.snapshot()
+        if result['enabled']:
+            result['google_api_executor'] = self.api_executor.stats()
+            result['tracker_cache'] = self.tracker_cache.stats()
+        return result
+    
+    def get_more_results(self, cursor: str):
+        """
+        Continue a response that was too large to send in one piece.
+        
+        Args:
+            cursor: The cursor from the truncated response
+        """
+        return self.responses.resume(cursor)
+    
+    async def export_metrics(self, path: Optional[str] = METRICS_TEXTFILE,
+                             interval: float = METRICS_EXPORT_INTERVAL_SECONDS):
+        """
+        Background task: rewrite a Prometheus textfile every interval seconds.
+        
+        Does nothing unless a path is given (INTERNSHIP_COACH_METRICS_TEXTFILE)
+        and metrics are on.
+        """
+        if not path or not self.metrics.enabled:
+            return
+        while True:
+            try:
+                self.metrics.write_textfile(path)
+            except OSError as e:
+                print(f"Couldn't write metrics to {path}: {e}", file=sys.stderr)
+            await asyncio.sleep(interval)
+    
+    async def _get_application_index(self) -> ApplicationIndex:
+        """
+        Index over the current tracker snapshot.
+        
+        When the snapshot is refetched, only the rows RowVersions saw change
+        since the index was last in step are re-parsed; it's rebuilt from
+        scratch only when there's no usable delta (first build, trimmed change
+        log, or a read that wasn't cached).
+        """
+        rows = await self._get_tracker_rows()
+        if self._app_index is not None and self._app_index_rows is rows:
+            return self._app_index
+        
+        started = time.perf_counter() if self.metrics.enabled else None
+        observed = self.tracker_cache.peek(SPREADSHEET_ID, TRACKER_RANGE) is rows
+        delta = None
+        if self._app_index is not None and observed and self._app_index_version is not None:
+            delta = self.row_versions.changes_since(self._app_index_version)
+        self._app_index_rows = rows
+        if delta is None:
+            index = ApplicationIndex(self.is_applied)
+            index.load(parse_applications(rows))
+            self._app_index = index
+            stage = 'tracker_index_build'
+        else:
+            self._reindex_rows(sorted(set().union(*delta)))
+            stage = 'tracker_index_update'
+        if started is not None:
+            self.metrics.observe('stage', stage, time.perf_counter() - started)
+        self._app_index_version = self.row_versions.token() if observed else None
+        return self._app_index
+    
+    async def _duplicate_check_index(self, current: bool = False) -> Optional[ApplicationIndex]:
+        """
+        Index to check new rows against for duplicates without a tracker read
+        of its own: the current one when the snapshot is cached or local (with
+        the mirror), else the last one built, else None (nothing to check).
+        current=True reads the tracker if it has to.
+        """
+        if (current or self.tracker_cache.is_fresh(SPREADSHEET_ID, TRACKER_RANGE)
+                or (self.mirror is not None and self.mirror.has_snapshot)):
+            return await self._get_application_index()
+        return self._app_index
+    
+    def _reindex_rows(self, row_nums):
+        """Refresh index entries for rows just written through to (or changed in) the cached snapshot"""
+        rows = self._app_index_rows
+        if self._app_index is None or self.tracker_cache.peek(SPREADSHEET_ID, TRACKER_RANGE) is not rows:
+            return
+        for row_num in row_nums:
+            offset = row_num - DATA_START_ROW
+            parsed = self._filter_applications(rows[offset:offset + 1], row_num) if 0 <= offset < len(rows) else []
+            if parsed:
+                self._app_index.upsert(parsed[0])
+            else:
+                self._app_index.remove(row_num)
+    
+    async def query_applications(self, statuses: Optional[list] = None,
+                                 companies: Optional[list] = None,
+                                 referral_sources: Optional[list] = None,
+                                 applied_since: Optional[str] = None,
+                                 applied_before: Optional[str] = None,
+                                 applied_only: Optional[bool] = False,
+                                 fields: Optional[list] = None):
         """
-        Fetch applications from sheet. 
-        
-        APPLIED = Submitted, Rejected, Technical, Phone Screen/HireVue, or any interview status
-        NOT APPLIED = In Progress, blank, or any other status
+        Find applications matching a combination of filters using the in-memory indexes.
+        e.g. statuses=["Technical", "Interview"], applied_since="9/1", referral_sources=["Handshake"]
         
         Args:
-            status_filter: Filter by specific status (case-insensitive)
-            applied_only: If True, only return applications that count as "applied"
+            statuses: Match any of these statuses (case-insensitive)
+            companies: Match any of these companies (case-insensitive)
+            referral_sources: Match any of these referral sources (case-insensitive)
+            applied_since: Applied on or after this date (M/D, M/D/YY or YYYY-MM-DD)
+            applied_before: Applied before this date
+            applied_only: Only applications that count as "applied"
+            fields: Only include these fields (the row number is always included)
         """
-        sheet = self.sheets_service.spreadsheets()
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f'{SHEET_NAME}!A{DATA_START_ROW}:G'
-        ).execute()
+        if isinstance(statuses, str):
+            statuses = [statuses]
+        if isinstance(companies, str):
+            companies = [companies]
+        if isinstance(referral_sources, str):
+            referral_sources = [referral_sources]
+        projection = _field_projection(fields)
+        since = _parse_query_date(applied_since) if applied_since else None
+        before = _parse_query_date(applied_before) if applied_before else None
         
-        rows = result.get('values', [])
-        applications = []
+        index = await self._get_application_index()
+        matches = index.query(statuses, companies, referral_sources, since, before, bool(applied_only))
+        return [_project(app, projection) for app in matches]
+    
+    async def get_pipeline_stats(self, weeks: Optional[int] = None) -> dict:
+        """
+        How the search is going: counts by status, applied vs in progress,
+        funnel conversion rates, referral source breakdown and weekly volume.
         
-        for i, row in enumerate(rows, start=DATA_START_ROW):
-            if not row or len(row) == 0 or not row[0]:  # Skip empty rows
-                continue
-                
-            app = {
-                'row': i,
-                'company': row[0] if len(row) > 0 else '',
-                'position': row[1] if len(row) > 1 else '',
-                'date_applied': row[2] if len(row) > 2 else '',
-                'referral_source': row[3] if len(row) > 3 else '',
-                'status': row[4] if len(row) > 4 else '',
-                'details': row[5] if len(row) > 5 else '',
-                'portal': row[6] if len(row) > 6 else ''
-            }
-            
-            # Filter by applied_only if requested
-            if applied_only and not self.is_applied(app['status']):
-                continue
-            
-            # Filter by specific status if requested
-            if status_filter:
-                if app['status'].lower().strip() == status_filter.lower().strip():
-                    applications.append(app)
-            else:
-                applications.append(app)
+        The aggregates are built in the same pass that indexes a fetched
+        snapshot and adjusted row by row on writes, so this is a dict build.
         
-        return applications
+        Args:
+            weeks: Only report weekly volume for the most recent N weeks
+        """
+        index = await self._get_application_index()
+        return index.stats.snapshot(weeks)
     
     async def add_application(self, company: str, position: str, 
                             date_applied: str, referral_source: str,
                             status: str = "In Progress", details: str = "",
-                            portal: str = ""):
-        """Add new application matching your sheet format"""
-        sheet = self.sheets_service.spreadsheets()
+                            portal: str = "", skip_duplicates: bool = False):
+        """
+        Add new application matching your sheet format.
+        
+        Rows that look like the same role ("Google LLC" / "Software Engineering
+        Intern" vs "Google" / "SWE Intern") are flagged in the reply, or with
+        skip_duplicates the application isn't added at all. The check uses the
+        index already in memory; only skip_duplicates reads the tracker for it.
+        """
+        index = await self._duplicate_check_index(current=skip_duplicates)
+        duplicates = index.likely_duplicates(company, position) if index is not None else []
+        if duplicates and skip_duplicates:
+            existing = duplicates[0][0]
+            return (f"⚠️ Not added: {position} at {company} looks like a duplicate of row {existing.row} "
+                    f"({existing.company} – {existing.position}, {existing.status or 'no status'})")
         
         # Format: Company | Position | Date Applied | Referral | Status | Details | Portal
         values = [[company, position, date_applied, referral_source, status, details, portal]]
         body = {'values': values}
         
-        result = sheet.values().append(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f'{SHEET_NAME}!A{DATA_START_ROW}:G',
-            valueInputOption='USER_ENTERED',
-            insertDataOption='INSERT_ROWS',
-            body=body
-        ).execute()
+        appended_after = self._known_row_count()
+        try:
+            result = await self._execute(
+                lambda: self.sheets_service.spreadsheets().values().append(
+                    spreadsheetId=SPREADSHEET_ID,
+                    range=TRACKER_RANGE,
+                    valueInputOption='USER_ENTERED',
+                    insertDataOption='INSERT_ROWS',
+                    includeValuesInResponse=True,
+                    body=body
+                ),
+                api=self._tracker_api
+            )
+        except Exception as e:
+            if await self._reconcile_append(values, e, appended_after) is None:
+                raise
+        else:
+            self._cache_write_result(result.get('updates', {}))
+        
+        message = f"✅ Added: {position} at {company} (Status: {status})"
+        for app, _ in duplicates:
+            message += (f"\n⚠️ Possible duplicate of row {app.row} ({app.company} – {app.position}, "
+                        f"{app.status or 'no status'}, applied {app.date_applied or 'n/a'})")
+        return message
+    
+    async def add_applications(self, applications: list, skip_duplicates: bool = False):
+        """
+        Add many applications at once.
+        
+        Valid records are appended in order with one values().append per
+        BULK_APPEND_CHUNK_SIZE rows; invalid records are skipped and reported.
+        A chunk whose append fails isn't resent: the tracker is read back to
+        see whether it landed anyway (see _reconcile_append).
+        Each record is checked against the tracker's duplicate index (as
+        already in memory, unless skip_duplicates) and against earlier records
+        in the same batch.
+        
+        Args:
+            applications: list of records with the same fields as add_application
+            skip_duplicates: Don't add records that look like a tracked role
+                (or an earlier record in the batch)
+        
+        Returns:
+            dict with counts and a result per record (in input order) giving the
+            row it was written to, or the validation error, plus
+            possible_duplicates / duplicate_of_index for likely duplicates
+        """
+        index = await self._duplicate_check_index(current=skip_duplicates)
+        batch = DuplicateIndex()  # keyed by input index
+        results = []
+        pending = []  # (result, row values)
+        for i, record in enumerate(applications):
+            result = {'index': i}
+            results.append(result)
+            try:
+                values = _application_row(record)
+            except ValueError as e:
+                result['status'] = 'invalid'
+                result['error'] = str(e)
+                continue
+            result['company'] = values[0]
+            result['position'] = values[1]
+            
+            duplicates = index.likely_duplicates(values[0], values[1]) if index is not None else []
+            if duplicates:
+                result['possible_duplicates'] = [
+                    {'row': app.row, 'company': app.company, 'position': app.position,
+                     'status': app.status, 'date_applied': app.date_applied, 'similarity': similarity}
+                    for app, similarity in duplicates
+                ]
+            earlier = batch.matches(values[0], values[1], limit=1)
+            if earlier:
+                result['duplicate_of_index'] = earlier[0][0]
+            if skip_duplicates and (duplicates or earlier):
+                result['status'] = 'duplicate'
+                continue
+            batch.add(i, values[0], values[1])
+            pending.append((result, values))
+        
+        requests_sent = 0
+        for start in range(0, len(pending), BULK_APPEND_CHUNK_SIZE):
+            chunk = pending[start:start + BULK_APPEND_CHUNK_SIZE]
+            body = {'values': [values for _, values in chunk]}
+            appended_after = self._known_row_count()
+            try:
+                response = await self._execute(
+                    lambda: self.sheets_service.spreadsheets().values().append(
+                        spreadsheetId=SPREADSHEET_ID,
+                        range=TRACKER_RANGE,
+                        valueInputOption='USER_ENTERED',
+                        insertDataOption='INSERT_ROWS',
+                        includeValuesInResponse=True,
+                        body=body
+                    ),
+                    api=self._tracker_api
+                )
+            except Exception as e:
+                error = e
+                try:
+                    first_row = await self._reconcile_append(body['values'], e, appended_after)
+                except RuntimeError as unknown:
+                    error, first_row = unknown, None
+                if first_row is None:
+                    # Later chunks would land out of order, so stop here
+                    for result, _ in pending[start:]:
+                        result['status'] = 'failed'
+                        result['error'] = str(error)
+                    break
+                requests_sent += 1
+            else:
+                requests_sent += 1
+                updates = response.get('updates', {})
+                self._cache_write_result(updates)
+                first_row = _first_row_of_range(updates.get('updatedRange', ''))
+            for offset, (result, _) in enumerate(chunk):
+                result['status'] = 'added'
+                result['row'] = first_row + offset if first_row is not None else None
         
-        return f"✅ Added: {position} at {company} (Status: {status})"
+        added = sum(1 for r in results if r.get('status') == 'added')
+        return {
+            'added': added,
+            'invalid': sum(1 for r in results if r.get('status') == 'invalid'),
+            'duplicates': sum(1 for r in results if 'possible_duplicates' in r or 'duplicate_of_index' in r),
+            'failed': sum(1 for r in results if r.get('status') == 'failed'),
+            'requests_sent': requests_sent,
+            'results': results
+        }
     
     async def update_application_status(self, row_num: int, new_status: str):
         """Update application status (Column E)"""
-        sheet = self.sheets_service.spreadsheets()
         range_name = f'{SHEET_NAME}!E{row_num}'
         body = {'values': [[new_status]]}
         
-        result = sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=range_name,
-            valueInputOption='USER_ENTERED',
-            body=body
-        ).execute()
+        result = await self._execute(
+            lambda: self.sheets_service.spreadsheets().values().update(
+                spreadsheetId=SPREADSHEET_ID,
+                range=range_name,
+                valueInputOption='USER_ENTERED',
+                includeValuesInResponse=True,
+                body=body
+            ),
+            api=self._tracker_api, idempotent=True
+        )
+        self._cache_write_result(result, fallback_row=row_num)
         
         return f"✅ Updated row {row_num} to: {new_status}"
     
     async def update_application_details(self, row_num: int, details: str):
         """Update details column (Column F)"""
-        sheet = self.sheets_service.spreadsheets()
         range_name = f'{SHEET_NAME}!F{row_num}'
         body = {'values': [[details]]}
         
-        result = sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=range_name,
-            valueInputOption='USER_ENTERED',
-            body=body
-        ).execute()
+        result = await self._execute(
+            lambda: self.sheets_service.spreadsheets().values().update(
+                spreadsheetId=SPREADSHEET_ID,
+                range=range_name,
+                valueInputOption='USER_ENTERED',
+                includeValuesInResponse=True,
+                body=body
+            ),
+            api=self._tracker_api, idempotent=True
+        )
+        self._cache_write_result(result, fallback_row=row_num)
         
         return f"✅ Updated details for row {row_num}"
     
+    async def batch_update(self, edits: list):
+        """
+        Apply many cell edits in a single values.batchUpdate request.
+        
+        Adjacent cells are merged into ranges before sending, so a block of
+        status changes on consecutive rows costs one range, not one request each.
+        
+        Args:
+            edits: list of {"row": int, "column": str, "value": str}. column is
+                a letter (A-G) or a field name (company, position, date_applied,
+                referral_source, status, details, portal). If the same cell is
+                edited more than once, the last edit wins.
+        
+        Returns:
+            dict with the number of ranges sent, cells updated, and a result
+            entry per edit (in input order)
+        """
+        results = []
+        cells = {}  # (row, col) -> (value, edit_index)
+        for i, edit in enumerate(edits):
+            result = {'row': edit.get('row'), 'column': edit.get('column'), 'value': edit.get('value')}
+            results.append(result)
+            try:
+                row = int(edit['row'])
+                column = str(edit['column']).strip()
+                if column.lower() in TRACKER_FIELDS:
+                    col = TRACKER_FIELDS.index(column.lower())
+                elif column.isalpha():
+                    col = _column_index(column)
+                else:
+                    raise ValueError(f"Unknown column: {column}")
+                if row < DATA_START_ROW:
+                    raise ValueError(f"Row must be {DATA_START_ROW} or later")
+                if not 0 <= col < len(TRACKER_FIELDS):
+                    raise ValueError(f"Column must be between A and {_column_letter(len(TRACKER_FIELDS) - 1)}")
+                value = edit.get('value', '')
+                value = '' if value is None else str(value)
+            except (KeyError, TypeError, ValueError) as e:
+                result['status'] = 'invalid'
+                result['error'] = str(e) if not isinstance(e, KeyError) else f"Missing field: {e.args[0]}"
+                continue
+            
+            previous = cells.get((row, col))
+            if previous is not None:
+                results[previous[1]]['status'] = 'superseded'
+            cells[(row, col)] = (value, i)
+            result['row'] = row
+            result['column'] = _column_letter(col)
+            result['status'] = 'pending'
+        
+        blocks = _merge_cell_edits([(row, col, value, i) for (row, col), (value, i) in cells.items()])
+        if not blocks:
+            return {'ranges_sent': 0, 'updated_cells': 0, 'results': results}
+        
+        data = []
+        for block in blocks:
+            last_row = block['row'] + len(block['values']) - 1
+            last_col = block['col'] + len(block['values'][0]) - 1
+            range_name = f"{SHEET_NAME}!{_column_letter(block['col'])}{block['row']}"
+            if last_row != block['row'] or last_col != block['col']:
+                range_name += f":{_column_letter(last_col)}{last_row}"
+            data.append({'range': range_name, 'values': block['values']})
+        body = {
+            'valueInputOption': 'USER_ENTERED',
+            'includeValuesInResponse': True,
+            'data': data
+        }
+        
+        try:
+            response = await self._execute(
+                lambda: self.sheets_service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=SPREADSHEET_ID,
+                    body=body
+                ),
+                api=self._tracker_api, idempotent=True
+            )
+        except Exception as e:
+            for block in blocks:
+                for edit_row in block['edits']:
+                    for i in edit_row:
+                        results[i]['status'] = 'failed'
+                        results[i]['error'] = str(e)
+            return {'ranges_sent': len(data), 'updated_cells': 0, 'results': results}
+        
+        responses = response.get('responses', [])
+        for block, block_data, updated in zip(blocks, data, responses + [None] * (len(blocks) - len(responses))):
+            if updated is not None:
+                self._cache_write_result(updated, fallback_row=block['row'])
+            for edit_row in block['edits']:
+                for i in edit_row:
+                    results[i]['status'] = 'updated' if updated is not None else 'unknown'
+                    results[i]['range'] = (updated or {}).get('updatedRange', block_data['range'])
+        
+        return {
+            'ranges_sent': len(data),
+            'updated_cells': response.get('totalUpdatedCells', 0),
+            'results': results
+        }
+    
     async def add_interview_to_calendar(self, company: str, position: str,
                                        interview_date: str, interview_time: str,
                                        duration_minutes: int = 60,
-                                       notes: str = ""):
+                                       notes: str = "",
+                                       check_conflicts: bool = False):
         """
         Add interview to Google Calendar
         Args:
             company: Company name
             position: Position title
             interview_date: Date in YYYY-MM-DD format
-            interview_time: Time in HH:MM format (24-hour)
+            interview_time: Time in HH:MM format (24-hour, in TIMEZONE)
             duration_minutes: Interview duration
             notes: Additional notes
+            check_conflicts: Don't book if the slot overlaps busy time on the calendar
         """
         try:
-            # Parse datetime
-            start_datetime = datetime.strptime(
-                f"{interview_date} {interview_time}", 
-                "%Y-%m-%d %H:%M"
-            )
-            end_datetime = start_datetime + timedelta(minutes=duration_minutes)
+            event = _interview_event(company, position, interview_date, interview_time,
+                                     duration_minutes, notes)
             
-            # Create event
-            event = {
-                'summary': f'Interview: {position} at {company}',
-                'description': f'Position: {position}\nCompany: {company}\n\n{notes}',
-                'start': {
-                    'dateTime': start_datetime.isoformat(),
-                    'timeZone': 'America/New_York',  # Adjust to your timezone
-                },
-                'end': {
-                    'dateTime': end_datetime.isoformat(),
-                    'timeZone': 'America/New_York',
-                },
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'popup', 'minutes': 24 * 60},  # 1 day before
-                        {'method': 'popup', 'minutes': 60},        # 1 hour before
-                    ],
-                },
-            }
+            if check_conflicts:
+                start = _event_timestamp(event['start'])
+                end = _event_timestamp(event['end'])
+                busy = await self._get_busy(start, end)
+                conflicts = busy.conflicts(start, end)
+                if conflicts:
+                    blocks = "\n".join(f"  • {_format_timestamp(s)} → {_format_timestamp(e)}"
+                                        for s, e in conflicts)
+                    return (f"⚠️ Not scheduled: {interview_date} {interview_time} overlaps busy time\n"
+                            f"{blocks}\nUse find_free_slots to pick another time.")
             
-            event = self.calendar_service.events().insert(
-                calendarId='primary', 
-                body=event
-            ).execute()
+            event = await self._insert_interview_event(event)
+            self._remember_event(event)
             
             return f"📅 Interview scheduled: {company} on {interview_date} at {interview_time}\nCalendar link: {event.get('htmlLink')}"
         
         except Exception as e:
             return f"❌ Error scheduling interview: {str(e)}"
     
-    async def get_upcoming_interviews(self, days_ahead: int = 14):
-        """Get upcoming interviews from calendar"""
+    async def _insert_interview_event(self, event: dict) -> dict:
+        """
+        Insert one interview event under its deterministic id, so a retried or
+        repeated insert can't create a second copy.
+        
+        When the insert may have gone through without a response (timeout) or
+        the id is already taken (409), the event is looked up instead. An id
+        whose event was deleted can't be reused, so that interview is inserted
+        again under a new id chosen by Calendar.
+        """
+        event = dict(event, id=_interview_event_id(event))
+        
+        def insert(body):
+            return self._execute(
+                lambda: self.calendar_service.events().insert(calendarId='primary', body=body),
+                api='calendar', idempotent='id' in body
+            )
+        
+        try:
+            return await insert(event)
+        except Exception as e:
+            if not isinstance(e, TimeoutError) and _http_status(e) != 409:
+                raise
         try:
-            now = datetime.utcnow().isoformat() + 'Z'
-            future = (datetime.utcnow() + timedelta(days=days_ahead)).isoformat() + 'Z'
+            existing = await self._execute(
+                lambda: self.calendar_service.events().get(calendarId='primary', eventId=event['id']),
+                api='calendar', idempotent=True
+            )
+        except Exception as e:
+            if _http_status(e) != 404:
+                raise
+            return await insert(event)  # The timed-out insert never landed
+        if existing.get('status') != 'cancelled':
+            return existing
+        return await insert({key: value for key, value in event.items() if key != 'id'})
+    
+    def _mark_scheduled(self, result: dict, event: dict):
+        """Record a bulk-scheduled interview's event in its result and the local caches"""
+        result['status'] = 'scheduled'
+        result.pop('error', None)
+        result['event_id'] = event.get('id')
+        result['link'] = event.get('htmlLink')
+        self._remember_event(event)
+    
+    async def _calendar_batch(self, requests: list) -> list:
+        """
+        Send Calendar requests as one batch HTTP request.
+        
+        Args:
+            requests: Zero-argument callables building each request (called on
+                the worker thread, like any request_factory)
+        
+        Returns:
+            [(response, error)] in request order
+        """
+        outcomes = {}  # request id -> (response, error)
+        
+        def callback(request_id, response, exception):
+            outcomes[request_id] = (response, exception)
+        
+        def build_batch():
+            batch = self.calendar_service.new_batch_http_request(callback=callback)
+            for n, build in enumerate(requests):
+                batch.add(build(), request_id=str(n))
+            return batch
+        
+        # Inserts in a batch carry their own id, so resending one is safe
+        await self._execute(build_batch, api='calendar', cost=len(requests), idempotent=True)
+        return [outcomes.get(str(n), (None, RuntimeError("no response in batch")))
+                for n in range(len(requests))]
+    
+    async def _confirm_inserted(self, items: list) -> list:
+        """
+        Look up bulk-scheduled events whose insert may have gone through
+        without a response (a timed-out batch, or a 409 for their id).
+        
+        Args:
+            items: (result, event body) pairs; each body carries its own id
+        
+        Returns:
+            the items that aren't on the calendar and still need inserting
+        """
+        retry = []
+        for start in range(0, len(items), CALENDAR_BATCH_SIZE):
+            chunk = items[start:start + CALENDAR_BATCH_SIZE]
+            try:
+                outcomes = await self._calendar_batch([
+                    lambda event=event: self.calendar_service.events().get(calendarId='primary', eventId=event['id'])
+                    for _, event in chunk
+                ])
+            except Exception:
+                retry.extend(chunk)  # Inserts carry their id, so sending one again is safe
+                continue
+            for item, (event, error) in zip(chunk, outcomes):
+                result = item[0]
+                if error is None and event.get('status') != 'cancelled':
+                    self._mark_scheduled(result, event)
+                elif error is None:
+                    result['status'] = 'failed'
+                    result['error'] = ("This interview was scheduled before and deleted; "
+                                       "Calendar won't reuse its id, so change the time to add it again")
+                else:
+                    if _http_status(error) != 404:
+                        result['error'] = str(error)
+                    retry.append(item)
+        return retry
+    
+    def _remember_event(self, event: dict):
+        """Write an event we just created through to the local event and busy caches"""
+        if self.calendar_cache.sync_token is not None:
+            self.calendar_cache.apply(event)
+        start = _event_timestamp(event.get('start', {}))
+        end = _event_timestamp(event.get('end', {}))
+        window = self.busy.window
+        if start is not None and end is not None and window is not None \
+                and start < window[1] and end > window[0]:
+            self.busy.add(start, end)
+    
+    async def _get_busy(self, start: float, end: float) -> BusyIntervals:
+        """
+        Busy blocks covering [start, end), from the local cache when it covers
+        the window and is fresh, otherwise from one freebusy query (widened to
+        FREEBUSY_MIN_WINDOW_DAYS so nearby checks reuse it).
+        """
+        async with self._freebusy_lock:
+            if self.busy.covers(start, end, FREEBUSY_CACHE_TTL_SECONDS):
+                return self.busy
+            window_end = max(end, start + FREEBUSY_MIN_WINDOW_DAYS * 86400)
+            body = {
+                'timeMin': datetime.fromtimestamp(start, timezone.utc).isoformat(),
+                'timeMax': datetime.fromtimestamp(window_end, timezone.utc).isoformat(),
+                'timeZone': TIMEZONE,
+                'items': [{'id': 'primary'}]
+            }
+            result = await self._execute(
+                lambda: self.calendar_service.freebusy().query(body=body),
+                api='calendar', idempotent=True
+            )
+            blocks = result.get('calendars', {}).get('primary', {}).get('busy', [])
+            self.busy.replace(start, window_end, [
+                (_event_timestamp({'dateTime': block['start']}), _event_timestamp({'dateTime': block['end']}))
+                for block in blocks
+            ])
+            return self.busy
+    
+    async def find_free_slots(self, start_date: str, end_date: Optional[str] = None,
+                              duration_minutes: int = 60, earliest: str = "09:00",
+                              latest: str = "17:00", step_minutes: int = 30,
+                              max_slots: int = 20, candidates: Optional[list] = None):
+        """
+        Find open interview slots, or check specific candidate times.
+        
+        One freebusy query covers the whole window; every slot is then checked
+        against the cached busy blocks locally.
+        
+        Args:
+            start_date: First day to search (YYYY-MM-DD)
+            end_date: Last day to search (default: start_date)
+            duration_minutes: Slot length
+            earliest: Earliest start time each day (HH:MM, in TIMEZONE)
+            latest: Slots must end by this time each day
+            step_minutes: Spacing between candidate start times
+            max_slots: Stop after this many free slots
+            candidates: Instead of searching, check these times
+                ("YYYY-MM-DD HH:MM") and report which are free
+        
+        Returns:
+            dict with the time zone and either the free slots or a verdict per candidate
+        """
+        duration = duration_minutes * 60
+        now = time.time()
+        if candidates:
+            spans = []
+            for candidate in candidates:
+                date_str, _, time_str = candidate.strip().partition(' ')
+                start = _local_timestamp(date_str, time_str or '00:00')
+                spans.append((candidate, start, start + duration))
+            busy = await self._get_busy(min(s for _, s, _ in spans), max(e for _, _, e in spans))
+            checked = []
+            for candidate, start, end in spans:
+                conflicts = busy.conflicts(start, end)
+                checked.append({
+                    'slot': candidate,
+                    'free': not conflicts and start >= now,
+                    'conflicts': [{'start': _format_timestamp(s), 'end': _format_timestamp(e)}
+                                  for s, e in conflicts]
+                })
+            return {'time_zone': TIMEZONE, 'candidates': checked}
+        
+        first_day = datetime.strptime(start_date, "%Y-%m-%d")
+        last_day = datetime.strptime(end_date, "%Y-%m-%d") if end_date else first_day
+        days = [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+        if not days:
+            return {'time_zone': TIMEZONE, 'slots': []}
+        
+        busy = await self._get_busy(_local_timestamp(start_date, earliest),
+                                    _local_timestamp(days[-1].strftime("%Y-%m-%d"), latest))
+        slots = []
+        step = max(1, step_minutes) * 60
+        for day in days:
+            day_str = day.strftime("%Y-%m-%d")
+            start = _local_timestamp(day_str, earliest)
+            day_end = _local_timestamp(day_str, latest)
+            while start + duration <= day_end and len(slots) < max_slots:
+                if start >= now and busy.is_free(start, start + duration):
+                    slots.append({'start': _format_timestamp(start),
+                                  'end': _format_timestamp(start + duration)})
+                start += step
+        return {'time_zone': TIMEZONE, 'slots': slots}
+    
+    async def _list_event_pages(self, **params) -> tuple:
+        """Follow events().list pages; returns (events, nextSyncToken)"""
+        events = []
+        page_token = None
+        while True:
+            result = await self._execute(
+                lambda: self.calendar_service.events().list(
+                    calendarId='primary',
+                    singleEvents=True,
+                    maxResults=CALENDAR_PAGE_SIZE,
+                    pageToken=page_token,
+                    **params
+                ),
+                api='calendar', idempotent=True
+            )
+            events.extend(result.get('items', []))
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                return events, result.get('nextSyncToken')
+    
+    async def _sync_calendar(self, force: bool = False):
+        """
+        Bring the interview event cache up to date.
+        
+        Uses an incremental sync when we hold a sync token, falling back to a
+        full sync the first time and whenever Calendar expires the token
+        (410 Gone). Skipped while the last sync is under
+        CALENDAR_SYNC_TTL_SECONDS old unless force is set.
+        """
+        cache = self.calendar_cache
+        async with self._calendar_sync_lock:
+            if not force and cache.is_fresh(CALENDAR_SYNC_TTL_SECONDS):
+                return
+            if cache.sync_token is not None:
+                try:
+                    events, token = await self._list_event_pages(syncToken=cache.sync_token)
+                except Exception as e:
+                    if _http_status(e) != 410:
+                        raise
+                else:
+                    for event in events:
+                        cache.apply(event)
+                    cache.sync_token = token
+                    cache.synced_at = time.monotonic()
+                    cache.incremental_syncs += 1
+                    return
             
-            events_result = self.calendar_service.events().list(
-                calendarId='primary',
-                timeMin=now,
-                timeMax=future,
-                maxResults=20,
-                singleEvents=True,
-                orderBy='startTime',
-                q='Interview'  # Search for events with "Interview" in title
-            ).execute()
+            events, token = await self._list_event_pages()
+            cache.reset()
+            for event in events:
+                cache.apply(event)
+            cache.sync_token = token
+            cache.synced_at = time.monotonic()
+            cache.full_syncs += 1
+    
+    async def schedule_interviews(self, interviews: list, check_conflicts: bool = False):
+        """
+        Add many interviews to Google Calendar at once.
+        
+        Inserts are grouped into batch HTTP requests of up to
+        CALENDAR_BATCH_SIZE events, so a super-day or a re-import costs a
+        round trip per batch instead of per event. Items that fail with a
+        rate limit or server error are retried (only those items) for up to
+        CALENDAR_BATCH_MAX_ATTEMPTS rounds.
+        
+        Each event gets an id derived from its title and time, so an insert
+        sent twice (a retry after a lost response, or importing the same list
+        again) is refused by Calendar instead of creating a second event. A
+        batch that timed out isn't resent: its events are looked up first.
+        
+        Args:
+            interviews: list of records with the same fields as schedule_interview
+                (company, position, interview_date, interview_time,
+                duration_minutes, notes)
+            check_conflicts: Skip interviews that overlap busy time on the
+                calendar or an earlier interview in the same request
+        
+        Returns:
+            dict with counts and a result per interview (in input order) giving
+            the event id and link, or the error
+        """
+        results = []
+        pending = []  # (result, event body)
+        for i, record in enumerate(interviews):
+            result = {'index': i}
+            results.append(result)
+            try:
+                if not isinstance(record, dict):
+                    raise ValueError("expected an object with interview fields")
+                missing = [f for f in ('company', 'position', 'interview_date', 'interview_time')
+                           if not record.get(f)]
+                if missing:
+                    raise ValueError(f"missing {', '.join(missing)}")
+                event = _interview_event(record['company'], record['position'],
+                                         record['interview_date'], record['interview_time'],
+                                         int(record.get('duration_minutes') or 60),
+                                         record.get('notes') or "")
+            except (ValueError, TypeError) as e:
+                result['status'] = 'invalid'
+                result['error'] = str(e)
+                continue
+            event['id'] = _interview_event_id(event)
+            result['company'] = record['company']
+            result['start'] = event['start']['dateTime']
+            pending.append((result, event))
+        
+        if check_conflicts and pending:
+            spans = [(_event_timestamp(event['start']), _event_timestamp(event['end']))
+                     for _, event in pending]
+            busy = (await self._get_busy(min(s for s, _ in spans), max(e for _, e in spans))).copy()
+            accepted = []
+            for item, (start, end) in zip(pending, spans):
+                conflicts = busy.conflicts(start, end)
+                if conflicts:
+                    item[0]['status'] = 'conflict'
+                    item[0]['conflicts'] = [{'start': _format_timestamp(s), 'end': _format_timestamp(e)}
+                                            for s, e in conflicts]
+                    continue
+                busy.add(start, end)
+                accepted.append(item)
+            pending = accepted
+        
+        batches_sent = 0
+        for attempt in range(CALENDAR_BATCH_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(_backoff_delay(attempt - 1))
+            retry = []
+            unconfirmed = []  # Inserts that may have landed without us hearing back
+            for start in range(0, len(pending), CALENDAR_BATCH_SIZE):
+                chunk = pending[start:start + CALENDAR_BATCH_SIZE]
+                try:
+                    outcomes = await self._calendar_batch([
+                        lambda event=event: self.calendar_service.events().insert(calendarId='primary', body=event)
+                        for _, event in chunk
+                    ])
+                except Exception as e:
+                    for result, _ in chunk:
+                        result['status'] = 'failed'
+                        result['error'] = str(e)
+                        result['attempts'] = attempt + 1
+                    if isinstance(e, TimeoutError):
+                        # The batch may still be running on its worker thread;
+                        # look the events up rather than sending it again
+                        unconfirmed.extend(chunk)
+                    else:
+                        retry.extend(chunk)
+                    continue
+                batches_sent += 1
+                
+                for item, (event, error) in zip(chunk, outcomes):
+                    result = item[0]
+                    result['attempts'] = attempt + 1
+                    if error is None:
+                        self._mark_scheduled(result, event)
+                        continue
+                    result['status'] = 'failed'
+                    result['error'] = str(error)
+                    status = _http_status(error)
+                    if status == 409:
+                        # The id is taken: an earlier attempt already inserted it
+                        unconfirmed.append(item)
+                    elif status is None or _is_retryable(error):
+                        retry.append(item)
+            if unconfirmed:
+                retry.extend(await self._confirm_inserted(unconfirmed))
+            pending = retry
+            if not pending:
+                break
+        
+        return {
+            'scheduled': sum(1 for r in results if r.get('status') == 'scheduled'),
+            'invalid': sum(1 for r in results if r.get('status') == 'invalid'),
+            'conflicts': sum(1 for r in results if r.get('status') == 'conflict'),
+            'failed': sum(1 for r in results if r.get('status') == 'failed'),
+            'batches_sent': batches_sent,
+            'results': results
+        }
+    
+    async def get_upcoming_interviews(self, days_ahead: int = 14):
+        """
+        Get upcoming interviews from calendar
+        
+        Served from the local event cache, which is synced incrementally
+        (only changed events are fetched), so every interview in the window
+        is returned however many there are.
+        
+        Args:
+            days_ahead: How many days ahead to look
+        """
+        try:
+            await self._sync_calendar()
             
-            events = events_result.get('items', [])
+            now = time.time()
+            events = self.calendar_cache.between(now, now + days_ahead * 86400)
             
             interviews = []
             for event in events:
                 start = event['start'].get('dateTime', event['start'].get('date'))
                 interviews.append({
-                    'summary': event['summary'],
+                    'summary': event.get('summary', ''),
                     'start': start,
                     'description': event.get('description', ''),
                     'link': event.get('htmlLink', '')
@@ -658,19 +4767,34 @@ class InternshipCoach:
     
     def generate_study_schedule(self, interview_date: str, topics: list[str], 
                                days_available: int):
-        """Generate personalized study schedule"""
+        """
+        Generate personalized study schedule
+        
+        Topics are spread over the study days before the interview (at most
+        days_available of them), with any remainder going one extra topic to
+        the earliest days so nothing is left unscheduled. For several
+        interviews at once use plan_study_schedule.
+        """
         schedule = []
-        topics_per_day = max(1, len(topics) // max(1, days_available))
+        if not topics:
+            return schedule
         
         interview_dt = datetime.strptime(interview_date, "%Y-%m-%d")
+        today = datetime.now()
+        days_until = (interview_dt.date() - today.date()).days
+        days = max(1, min(int(days_available), days_until) if days_until > 0 else 1)
+        days = min(days, len(topics))
+        per_day, extra = divmod(len(topics), days)
         
-        for i in range(0, len(topics), topics_per_day):
-            day_topics = topics[i:i+topics_per_day]
-            day_num = i // topics_per_day + 1
-            study_date = datetime.now() + timedelta(days=day_num-1)
+        start = 0
+        for day_index in range(days):
+            count = per_day + (1 if day_index < extra else 0)
+            day_topics = topics[start:start + count]
+            start += count
+            study_date = today + timedelta(days=day_index)
             
             schedule.append({
-                'day': day_num,
+                'day': day_index + 1,
                 'date': study_date.strftime("%Y-%m-%d"),
                 'topics': day_topics,
                 'morning': [f"Review {topic} fundamentals (1 hour)" for topic in day_topics],
@@ -680,6 +4804,42 @@ class InternshipCoach:
         
         return schedule
     
+    async def plan_study_schedule(self, interviews: Optional[list] = None, daily_hours=None,
+                                  start_date: Optional[str] = None, days_ahead: int = 30,
+                                  session_minutes: int = STUDY_SESSION_MINUTES):
+        """
+        Spaced-repetition study plan across several interviews (see plan_study).
+        
+        Args:
+            interviews: [{company, position, date, topics, weight}]; when omitted,
+                the upcoming interviews on the calendar are used. Interviews
+                without topics get the prep topics for their position.
+            daily_hours: Hours per day, or a dict keyed by date, weekday or 'default'
+            start_date: First study day (YYYY-MM-DD, default today)
+            days_ahead: How far ahead to look on the calendar
+            session_minutes: Length of a study session
+        """
+        if interviews is None:
+            upcoming = await self.get_upcoming_interviews(days_ahead)
+            if isinstance(upcoming, str):
+                return upcoming
+            interviews = []
+            for event in upcoming:
+                match = re.match(r'\s*Interview:\s*(.+?)\s+at\s+(.+)', event['summary'])
+                position, company = match.groups() if match else (event['summary'], '')
+                interviews.append({'company': company, 'position': position,
+                                   'date': event['start'][:10]})
+            if not interviews:
+                return f"📭 No interviews on the calendar in the next {days_ahead} days"
+        
+        prepared = []
+        for interview in interviews:
+            interview = dict(interview)
+            if not interview.get('topics'):
+                interview['topics'] = self.get_interview_prep_plan(interview.get('position') or '')['topics']
+            prepared.append(interview)
+        return plan_study(prepared, daily_hours, start_date, session_minutes)
+    
     def get_interview_prep_plan(self, position: str):
         """Generate interview prep based on position keywords"""
         position_lower = position.lower()
@@ -787,7 +4947,7 @@ class InternshipCoach:
 
 # Initialize MCP server
 app = Server("internship-coach")
-coach = InternshipCoach()
+coach = InternshipCoach(mirror_path=MIRROR_PATH if MIRROR_ENABLED else None)
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools"""
@@ -801,13 +4961,54 @@ async def list_tools() -> list[Tool]:
                     "status_filter": {
                         "type": "string", 
                         "description": "Filter by status (Submitted, In Progress, Rejected, Phone Screen/HireVue, Technical, etc.)"
+                    },
+                    "applied_only": {"type": "boolean", "description": "Only return applications that count as applied"},
+                    "limit": {"type": "number", "description": "Page size; returns {applications, total, next_cursor} instead of a plain list"},
+                    "offset": {"type": "number", "description": "Number of matching applications to skip"},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page (keep the other arguments the same)"},
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": TRACKER_FIELDS},
+                        "description": "Only return these fields (row is always included)"
+                    },
+                    "sort_by": {"type": "string", "description": "Field to sort by, prefix with '-' for descending (e.g. -date_applied)"},
+                    "since": {"type": "string", "description": "Change token from a previous call: only return rows inserted, changed or deleted since then. Pass an empty string to get everything plus a token."}
+                }
+            }
+        ),
+        Tool(
+            name="query_applications",
+            description="Find applications matching combined filters, e.g. status Technical or Interview, applied since 9/1, via Handshake. Filters are ANDed; values within one filter are ORed.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "statuses": {"type": "array", "items": {"type": "string"}, "description": "Match any of these statuses"},
+                    "companies": {"type": "array", "items": {"type": "string"}, "description": "Match any of these companies"},
+                    "referral_sources": {"type": "array", "items": {"type": "string"}, "description": "Match any of these referral sources (LinkedIn/Online, Handshake, ...)"},
+                    "applied_since": {"type": "string", "description": "Applied on or after this date (M/D, M/D/YY or YYYY-MM-DD)"},
+                    "applied_before": {"type": "string", "description": "Applied before this date"},
+                    "applied_only": {"type": "boolean", "description": "Only applications that count as applied"},
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": TRACKER_FIELDS},
+                        "description": "Only return these fields (row is always included)"
                     }
                 }
             }
         ),
+        Tool(
+            name="get_pipeline_stats",
+            description="Summarize the search: counts by status, applied vs in progress, conversion rates Submitted -> Phone Screen -> Technical -> Interview, referral source breakdown and weekly application volume",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "weeks": {"type": "integer", "description": "Only show weekly volume for the most recent N weeks (default: all)"}
+                }
+            }
+        ),
         Tool(
             name="add_application",
-            description="Add new internship application to tracking sheet",
+            description="Add new internship application to tracking sheet (warns when it looks like one already tracked, e.g. 'Google LLC' / 'Software Engineering Intern' vs 'Google' / 'SWE Intern')",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -817,11 +5018,40 @@ async def list_tools() -> list[Tool]:
                     "referral_source": {"type": "string", "description": "How you applied (LinkedIn/Online, Internal Referral, Handshake, etc.)"},
                     "status": {"type": "string", "description": "Application status (default: In Progress)"},
                     "details": {"type": "string", "description": "Additional details or notes"},
-                    "portal": {"type": "string", "description": "Applicant portal link"}
+                    "portal": {"type": "string", "description": "Applicant portal link"},
+                    "skip_duplicates": {"type": "boolean", "description": "Don't add it if it looks like an application already tracked (default: add and warn)"}
                 },
                 "required": ["company", "position", "date_applied", "referral_source"]
             }
         ),
+        Tool(
+            name="add_applications",
+            description="Add many internship applications to the tracking sheet in one request (e.g. importing a career-fair list); likely duplicates of tracked applications or of earlier records are flagged",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "applications": {
+                        "type": "array",
+                        "description": "Applications to add, in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "company": {"type": "string", "description": "Company name"},
+                                "position": {"type": "string", "description": "Position title"},
+                                "date_applied": {"type": "string", "description": "Date applied (M/D/YY format)"},
+                                "referral_source": {"type": "string", "description": "How you applied (LinkedIn/Online, Internal Referral, Handshake, etc.)"},
+                                "status": {"type": "string", "description": "Application status (default: In Progress)"},
+                                "details": {"type": "string", "description": "Additional details or notes"},
+                                "portal": {"type": "string", "description": "Applicant portal link"}
+                            },
+                            "required": ["company", "position", "date_applied", "referral_source"]
+                        }
+                    },
+                    "skip_duplicates": {"type": "boolean", "description": "Skip records that look like a tracked application or an earlier record (default: add and flag)"}
+                },
+                "required": ["applications"]
+            }
+        ),
         Tool(
             name="update_status",
             description="Update application status in sheet",
@@ -846,6 +5076,29 @@ async def list_tools() -> list[Tool]:
                 "required": ["row_num", "details"]
             }
         ),
+        Tool(
+            name="batch_update",
+            description="Update many cells at once (e.g. mark several applications Rejected) in a single Sheets request",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "edits": {
+                        "type": "array",
+                        "description": "Cell edits to apply",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "row": {"type": "number", "description": "Row number in sheet (starts at 16)"},
+                                "column": {"type": "string", "description": "Column letter (A-G) or field name (status, details, ...)"},
+                                "value": {"type": "string", "description": "New cell value"}
+                            },
+                            "required": ["row", "column", "value"]
+                        }
+                    }
+                },
+                "required": ["edits"]
+            }
+        ),
         Tool(
             name="schedule_interview",
             description="Add interview to Google Calendar",
@@ -857,11 +5110,57 @@ async def list_tools() -> list[Tool]:
                     "interview_date": {"type": "string", "description": "Date (YYYY-MM-DD)"},
                     "interview_time": {"type": "string", "description": "Time (HH:MM in 24-hour format)"},
                     "duration_minutes": {"type": "number", "description": "Duration in minutes (default: 60)"},
-                    "notes": {"type": "string", "description": "Additional notes"}
+                    "notes": {"type": "string", "description": "Additional notes"},
+                    "check_conflicts": {"type": "boolean", "description": "Don't book if the slot overlaps existing busy time"}
                 },
                 "required": ["company", "position", "interview_date", "interview_time"]
             }
         ),
+        Tool(
+            name="schedule_interviews",
+            description="Add many interviews to Google Calendar at once (e.g. a super-day), using batched requests. Reports success or failure per interview.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "interviews": {
+                        "type": "array",
+                        "description": "Interviews to schedule, each with the same fields as schedule_interview",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "company": {"type": "string", "description": "Company name"},
+                                "position": {"type": "string", "description": "Position title"},
+                                "interview_date": {"type": "string", "description": "Date (YYYY-MM-DD)"},
+                                "interview_time": {"type": "string", "description": "Time (HH:MM in 24-hour format)"},
+                                "duration_minutes": {"type": "number", "description": "Duration in minutes (default: 60)"},
+                                "notes": {"type": "string", "description": "Additional notes"}
+                            },
+                            "required": ["company", "position", "interview_date", "interview_time"]
+                        }
+                    },
+                    "check_conflicts": {"type": "boolean", "description": "Skip interviews that overlap busy time or each other"}
+                },
+                "required": ["interviews"]
+            }
+        ),
+        Tool(
+            name="find_free_slots",
+            description=f"Find open interview slots in a date range, or check whether specific candidate times are free (times are in {TIMEZONE})",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "start_date": {"type": "string", "description": "First day to search (YYYY-MM-DD)"},
+                    "end_date": {"type": "string", "description": "Last day to search (default: start_date)"},
+                    "duration_minutes": {"type": "number", "description": "Slot length in minutes (default: 60)"},
+                    "earliest": {"type": "string", "description": "Earliest start each day, HH:MM (default: 09:00)"},
+                    "latest": {"type": "string", "description": "Latest end each day, HH:MM (default: 17:00)"},
+                    "step_minutes": {"type": "number", "description": "Spacing between candidate starts (default: 30)"},
+                    "max_slots": {"type": "number", "description": "Maximum slots to return (default: 20)"},
+                    "candidates": {"type": "array", "items": {"type": "string"}, "description": "Check these times instead (\"YYYY-MM-DD HH:MM\")"}
+                },
+                "required": ["start_date"]
+            }
+        ),
         Tool(
             name="get_upcoming_interviews",
             description="Get upcoming interviews from calendar",
@@ -885,6 +5184,38 @@ async def list_tools() -> list[Tool]:
                 "required": ["interview_date", "topics", "days_available"]
             }
         ),
+        Tool(
+            name="plan_study_schedule",
+            description="Plan study across all upcoming interviews at once with spaced-repetition reviews, respecting daily hour budgets and per-topic weights. Uses the calendar's interviews when none are given.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "interviews": {
+                        "type": "array",
+                        "description": "Interviews to prepare for (default: upcoming interviews on the calendar)",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "company": {"type": "string"},
+                                "position": {"type": "string"},
+                                "date": {"type": "string", "description": "Interview date (YYYY-MM-DD)"},
+                                "weight": {"type": "number", "description": "Importance of this interview (default: 1)"},
+                                "topics": {
+                                    "type": "array",
+                                    "description": "Topics as strings or {topic, weight, hours} (default: prep topics for the position)",
+                                    "items": {}
+                                }
+                            },
+                            "required": ["date"]
+                        }
+                    },
+                    "daily_hours": {"description": "Study hours per day, or an object keyed by date, weekday (mon..sun) or 'default'"},
+                    "start_date": {"type": "string", "description": "First study day (YYYY-MM-DD, default: today)"},
+                    "days_ahead": {"type": "number", "description": "How far ahead to look on the calendar (default: 30)"},
+                    "session_minutes": {"type": "number", "description": "Length of a study session (default: 60)"}
+                }
+            }
+        ),
         Tool(
             name="get_interview_prep",
             description="Get customized interview prep plan based on position",
@@ -908,6 +5239,76 @@ async def list_tools() -> list[Tool]:
                 },
                 "required": ["company", "position"]
             }
+        ),
+        Tool(
+            name="recommend_resumes_batch",
+            description="Recommend a resume for each of many job postings at once (e.g. triaging a folder of saved postings). Results are returned in input order.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "postings": {
+                        "type": "array",
+                        "description": "Job postings to score",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "company": {"type": "string", "description": "Name of the company"},
+                                "position": {"type": "string", "description": "Job title of the position"},
+                                "job_description": {"type": "string", "description": "Optional: full job description text"}
+                            },
+                            "required": ["company", "position"]
+                        }
+                    }
+                },
+                "required": ["postings"]
+            }
+        ),
+        Tool(
+            name="sync_tracker",
+            description="Sync the local offline copy of the tracker with Google Sheets now; shows pending writes and any conflicting edits",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "resolve_conflicts": {
+                        "type": "string",
+                        "enum": ["local", "remote"],
+                        "description": "Settle conflicts: 'local' keeps your edits, 'remote' keeps the sheet's values"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="get_cache_stats",
+            description="Show tracker cache hit/miss counters (each hit is a Google Sheets round trip saved)",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
+        ),
+        Tool(
+            name="get_server_metrics",
+            description="Show where time goes: per-tool latency (p50/p90/p99) and error counts, Google Sheets/Calendar request counts, latency and bytes transferred, PDF extraction and index build times",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "prometheus"],
+                        "description": "json (default) for summaries, prometheus for the text exposition format"
+                    }
+                }
+            }
+        ),
+        Tool(
+            name="get_more_results",
+            description="Fetch the next part of a response that was truncated for size (pass the cursor it ended with)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "cursor": {"type": "string", "description": "Cursor from the truncated response's continuation"}
+                },
+                "required": ["cursor"]
+            }
         )
     ]
 
@@ -928,26 +5329,49 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     try:
         result = await coach.call_tool(name, arguments)
         
-        # Convert result to TextContent
-        if isinstance(result, str):
-            return [TextContent(type="text", text=result)]
-        elif isinstance(result, (dict, list)):
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        else:
-            return [TextContent(type="text", text=str(result))]
+        # Convert result to TextContent (compact JSON, split if it's over the size cap)
+        started = time.perf_counter() if coach.metrics.enabled else None
+        text = coach.responses.encode(result)
+        if started is not None:
+            coach.metrics.observe('stage', 'response_encode', time.perf_counter() - started)
+        return [TextContent(type="text", text=text)]
     
     except Exception as e:
+        if _is_retryable(e) and _http_status(e) < 500:  # A rate limit (429 or 403 rateLimitExceeded)
+            return [TextContent(type="text", text="⏳ Google API quota exceeded even after retrying; try again in a minute")]
+        if str(e) == AUTHORIZE_FIRST_MESSAGE:
+            return [TextContent(type="text", text=AUTHORIZE_FIRST_MESSAGE)]
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 async def main():
-    """Run the MCP server"""
-    coach.authenticate_google()
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    """Run the MCP server (Google authentication happens on the first tool call that needs it)"""
+    refresher = asyncio.create_task(coach.keep_credentials_fresh())
+    syncer = asyncio.create_task(coach.keep_mirror_synced())
+    exporter = asyncio.create_task(coach.export_metrics())
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            if coach.needs_authorization():
+                # First run: open the browser sign-in now, off the API workers and their
+                # timeout. Started only once the transport holds its own stdout handle,
+                # since the sign-in sends sys.stdout to stderr while it runs.
+                threading.Thread(target=coach.authorize, name='google-sign-in', daemon=True).start()
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        refresher.cancel()
+        syncer.cancel()
+        exporter.cancel()
+        coach.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if '--authorize' in sys.argv[1:]:
+        try:
+            coach.authorize()
+        finally:
+            coach.close()
+        print(f"✅ Google access authorized (token saved to {TOKEN_PATH})")
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Duplicate detection: which company/position spellings count as the same
+application, and what add_application does with them.
+
+Run with: python -m pytest tests
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internship_coach_mcp import (  # noqa: E402
+    DATA_START_ROW, DuplicateIndex, InMemorySheetsRemote, InternshipCoach
+)
+
+TRACKED = [
+    ('Google', 'Software Engineering Intern'),
+    ('JPMorgan Chase', 'Software Engineer Intern'),
+    ('Lockheed Martin', 'Software Engineering Intern'),
+    ('Meta', 'ML Intern'),
+    ('Jane Street', 'Quantitative Research Intern'),
+]
+
+
+@pytest.fixture
+def index():
+    index = DuplicateIndex()
+    for row, (company, position) in enumerate(TRACKED, start=DATA_START_ROW):
+        index.add(row, company, position)
+    return index
+
+
+@pytest.mark.parametrize('company, position, row', [
+    ('Google LLC', 'SWE Intern', DATA_START_ROW),
+    ('Googel', 'Software Engineer Intern, Summer 2026', DATA_START_ROW),
+    ('Goolge Inc', 'Software Engineering Internship', DATA_START_ROW),
+    ('J.P. Morgan', 'SWE Intern', DATA_START_ROW + 1),
+    ('Lockhead Martin', 'SWE Intern', DATA_START_ROW + 2),
+    ('Lockheed', 'Software Engineering Intern', DATA_START_ROW + 2),
+    ('Meta Platforms', 'Machine Learning Intern', DATA_START_ROW + 3),
+    ('Jane Street', 'Quant Research Intern', DATA_START_ROW + 4),
+])
+def test_same_role_under_other_spellings(index, company, position, row):
+    assert [match for match, _ in index.matches(company, position)] == [row]
+
+
+@pytest.mark.parametrize('company, position', [
+    ('Google', 'Hardware Engineering Intern'),
+    ('Google', 'Data Engineer Intern'),
+    ('Google', 'Security Engineer Intern'),
+    ('Google', 'Software Engineering Manager'),
+    ('Jane Street', 'Quantitative Trading Intern'),
+    ('Morgan Stanley', 'Software Engineer Intern'),
+    ('Appian', 'Software Engineering Intern'),
+    ('Beta', 'ML Intern'),
+])
+def test_different_roles_or_companies_are_not_duplicates(index, company, position):
+    assert index.matches(company, position) == []
+
+
+def test_removed_rows_stop_matching(index):
+    index.remove(DATA_START_ROW)
+    assert index.matches('Google', 'SWE Intern') == []
+    index.add(DATA_START_ROW, 'Google', 'SWE Intern')
+    assert index.matches('Google LLC', 'Software Engineering Intern')[0][0] == DATA_START_ROW
+
+
+def test_skip_duplicates_keeps_other_roles(tmp_path):
+    remote = InMemorySheetsRemote([['Google', 'Software Engineering Intern', '9/1/25', 'Handshake', 'Submitted']])
+    coach = InternshipCoach(mirror_path=str(tmp_path / 'mirror.sqlite3'), mirror_remote=remote)
+    try:
+        skipped = asyncio.run(coach.add_application('Google LLC', 'SWE Intern', '9/2/25', 'Handshake',
+                                                    skip_duplicates=True))
+        added = asyncio.run(coach.add_application('Google', 'Hardware Engineering Intern', '9/2/25',
+                                                  'Handshake', skip_duplicates=True))
+        assert skipped.startswith('⚠️ Not added')
+        assert added.startswith('✅ Added')
+        positions = [app['position'] for app in asyncio.run(coach.get_applications())]
+        assert positions == ['Software Engineering Intern', 'Hardware Engineering Intern']
+    finally:
+        coach.close()
@@ -0,0 +1,211 @@
+"""
+Offline mirror sync against InMemorySheetsRemote: outbox replay, conflict
+detection and offline reads, with no Google credentials involved.
+
+Run with: python -m pytest tests
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from internship_coach_mcp import (  # noqa: E402
+    DATA_START_ROW, TRACKER_FIELDS, InMemorySheetsRemote, InternshipCoach
+)
+
+SHEET = [
+    ['Google', 'SWE Intern', '9/1/25', 'LinkedIn/Online', 'Submitted', '', ''],
+    ['Meta', 'ML Intern', '9/2/25', 'Handshake', 'Technical', '', ''],
+    ['Amazon', 'SDE Intern', '9/3/25', 'Internal Referral', 'In Progress', '', ''],
+]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def remote():
+    return InMemorySheetsRemote(SHEET)
+
+
+@pytest.fixture
+def coach(tmp_path, remote):
+    coach = InternshipCoach(mirror_path=str(tmp_path / 'mirror.sqlite3'), mirror_remote=remote)
+    run(coach.get_applications())  # first use pulls the initial snapshot
+    yield coach
+    coach.close()
+
+
+class LostResponseRemote(InMemorySheetsRemote):
+    """Writes appended rows, then fails as if the response never arrived"""
+    
+    def __init__(self, rows, writes_before_failing: bool = True):
+        super().__init__(rows)
+        self.fail_appends = 0
+        self.writes_before_failing = writes_before_failing
+    
+    async def append_rows(self, values: list) -> int:
+        if self.fail_appends and not self.writes_before_failing:
+            self.fail_appends -= 1
+            raise TimeoutError("Google API call timed out after 30s")
+        first_row = await super().append_rows(values)
+        if self.fail_appends:
+            self.fail_appends -= 1
+            raise TimeoutError("Google API call timed out after 30s")
+        return first_row
+
+
+def padded(rows: list) -> list:
+    return [list(row) + [''] * (len(TRACKER_FIELDS) - len(row)) for row in rows]
+
+
+def test_first_read_pulls_snapshot(coach, remote):
+    applications = run(coach.get_applications())
+    assert [a['company'] for a in applications] == ['Google', 'Meta', 'Amazon']
+    assert coach.mirror.has_snapshot
+    assert remote.calls == 1
+
+
+def test_reads_and_writes_work_offline(coach, remote):
+    remote.online = False
+    run(coach.add_application('Stripe', 'ML Intern', '9/4/25', 'Handshake'))
+    run(coach.update_application_status(DATA_START_ROW, 'Phone Screen/HireVue'))
+
+    applications = run(coach.get_applications())
+    assert applications[0]['status'] == 'Phone Screen/HireVue'
+    assert applications[-1]['company'] == 'Stripe'
+    assert run(coach.get_pipeline_stats())['total'] == 4
+    assert len(coach.mirror.pending_ops()) == 2
+
+    result = run(coach.sync_tracker())
+    assert 'error' in result
+    assert result['pending_writes'] == 2
+    assert remote.rows == SHEET
+
+
+def test_outbox_replays_when_back_online(coach, remote):
+    remote.online = False
+    run(coach.add_application('Stripe', 'ML Intern', '9/4/25', 'Handshake'))
+    run(coach.update_application_details(DATA_START_ROW + 1, 'Recruiter call Friday'))
+    remote.online = True
+
+    result = run(coach.sync_tracker())
+    assert result['pushed'] == 2
+    assert result['pending_writes'] == 0
+    assert remote.rows[1][5] == 'Recruiter call Friday'
+    assert remote.rows[3][:2] == ['Stripe', 'ML Intern']
+    assert padded(remote.rows) == [[a[f] for f in TRACKER_FIELDS] for a in run(coach.get_applications())]
+
+
+def test_sync_sends_one_batch_update_and_one_append(coach, remote):
+    remote.online = False
+    run(coach.batch_update([{'row': DATA_START_ROW + i, 'column': 'status', 'value': 'Rejected'}
+                            for i in range(len(SHEET))]))
+    run(coach.update_application_details(DATA_START_ROW, 'Moved on'))
+    run(coach.add_application('Stripe', 'ML Intern', '9/4/25', 'Handshake'))
+    run(coach.add_application('Databricks', 'Data Science Intern', '9/5/25', 'Handshake'))
+    remote.online = True
+    remote.calls = 0
+
+    run(coach.sync_tracker())
+    assert remote.calls == 3  # fetch, batchUpdate, append
+    assert [row[4] for row in remote.rows[:len(SHEET)]] == ['Rejected'] * len(SHEET)
+    assert [row[0] for row in remote.rows[len(SHEET):]] == ['Stripe', 'Databricks']
+
+
+@pytest.mark.parametrize('writes_before_failing', [True, False])
+def test_append_with_lost_response_is_not_sent_twice(tmp_path, writes_before_failing):
+    remote = LostResponseRemote(SHEET, writes_before_failing)
+    coach = InternshipCoach(mirror_path=str(tmp_path / 'mirror.sqlite3'), mirror_remote=remote)
+    try:
+        run(coach.get_applications())
+        remote.online = False
+        run(coach.add_application('Stripe', 'ML Intern', '9/4/25', 'Handshake'))
+        run(coach.update_application_status(DATA_START_ROW + len(SHEET), 'Technical'))
+        remote.online = True
+        remote.fail_appends = 1
+        
+        result = run(coach.sync_tracker())
+        assert 'error' in result
+        assert result['pending_writes'] == 2
+        
+        result = run(coach.sync_tracker())
+        assert result['pending_writes'] == 0
+        assert [row[0] for row in remote.rows] == ['Google', 'Meta', 'Amazon', 'Stripe']
+        assert remote.rows[-1][4] == 'Technical'
+        assert coach.mirror.append_in_flight() is None
+    finally:
+        coach.close()
+
+
+def test_edits_to_offline_rows_follow_them_when_the_sheet_grew(coach, remote):
+    remote.online = False
+    run(coach.add_application('Stripe', 'ML Intern', '9/4/25', 'Handshake'))
+    provisional_row = DATA_START_ROW + len(SHEET)
+    run(coach.update_application_status(provisional_row, 'Technical'))
+    remote.online = True
+    remote.rows.append(['Added Elsewhere', 'Intern', '9/4/25', 'Handshake', 'Submitted', '', ''])
+
+    run(coach.sync_tracker())
+    assert remote.rows[len(SHEET)][0] == 'Added Elsewhere'
+    assert remote.rows[len(SHEET) + 1][:5] == ['Stripe', 'ML Intern', '9/4/25', 'Handshake', 'Technical']
+
+
+def test_conflicting_edit_is_parked_and_can_be_resolved(coach, remote):
+    remote.online = False
+    run(coach.update_application_status(DATA_START_ROW + 1, 'Interview'))
+    remote.online = True
+    remote.rows[1][4] = 'Rejected'
+
+    result = run(coach.sync_tracker())
+    assert result['new_conflicts'] == 1
+    conflict, = result['conflicts']
+    assert (conflict['local'], conflict['sheet'], conflict['was']) == (['Interview'], ['Rejected'], ['Technical'])
+    assert remote.rows[1][4] == 'Rejected'
+    assert run(coach.get_applications())[1]['status'] == 'Rejected'
+
+    result = run(coach.sync_tracker(resolve_conflicts='local'))
+    assert result['resolved'] == 1
+    assert result['conflicts'] == []
+    assert remote.rows[1][4] == 'Interview'
+
+
+def test_remote_resolution_drops_local_edit(coach, remote):
+    remote.online = False
+    run(coach.update_application_status(DATA_START_ROW + 1, 'Interview'))
+    remote.online = True
+    remote.rows[1][4] = 'Rejected'
+    run(coach.sync_tracker())
+
+    result = run(coach.sync_tracker(resolve_conflicts='remote'))
+    assert result['resolved'] == 1
+    assert result['pending_writes'] == 0
+    assert remote.rows[1][4] == 'Rejected'
+
+
+def test_non_text_values_are_stored_as_text(coach, remote):
+    remote.online = False
+    run(coach.add_application('Stripe', 'ML Intern', 20250904, 'Handshake'))
+
+    applications = run(coach.get_applications())
+    assert applications[-1]['date_applied'] == '20250904'
+    assert run(coach.query_applications(companies=['stripe']))[0]['date_applied'] == '20250904'
+
+
+def test_mirror_survives_restart_offline(tmp_path, coach, remote):
+    remote.online = False
+    run(coach.add_application('Stripe', 'ML Intern', '9/4/25', 'Handshake'))
+    coach.close()
+
+    reopened = InternshipCoach(mirror_path=str(tmp_path / 'mirror.sqlite3'), mirror_remote=remote)
+    try:
+        applications = run(reopened.get_applications())
+        assert [a['company'] for a in applications] == ['Google', 'Meta', 'Amazon', 'Stripe']
+        assert len(reopened.mirror.pending_ops()) == 1
+    finally:
+        reopened.close()